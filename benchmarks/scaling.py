@@ -0,0 +1,104 @@
+"""Benchmarks of how loopy's processing stages scale with the size of the
+kernel, for use with `asv <https://asv.readthedocs.io>`__.
+
+The kernels are generated by :func:`loopy.synthetic.make_synthetic_kernel`.
+"""
+from __future__ import annotations
+
+
+__copyright__ = "Copyright (C) 2026 agent"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import warnings
+from abc import ABC, abstractmethod
+from typing import ClassVar
+
+import loopy as lp
+from loopy.synthetic import make_synthetic_kernel
+
+
+class _SyntheticKernelScaling(ABC):
+    params: ClassVar[list[int]] = [100, 300, 1000]
+    param_names: ClassVar[list[str]] = ["ninstructions"]
+
+    # each stage takes long enough to be timed individually
+    number = 1
+    repeat = (1, 3, 120.0)
+    timeout = 600
+
+    @abstractmethod
+    def make_kernel(self, ninstructions: int) -> lp.TranslationUnit:
+        ...
+
+    def setup(self, ninstructions):
+        # measure the stages themselves rather than cache lookups
+        lp.set_caching_enabled(False)
+        lp.clear_in_mem_caches()
+        warnings.simplefilter("ignore", lp.LoopyWarning)
+
+        self.t_unit = self.make_kernel(ninstructions)
+        self.preprocessed_t_unit = lp.preprocess_program(self.t_unit)
+
+    def teardown(self, ninstructions):
+        lp.set_caching_enabled(True)
+
+    def time_preprocess_program(self, ninstructions):
+        lp.preprocess_program(self.t_unit)
+
+    def time_pre_schedule_checks(self, ninstructions):
+        from loopy.check import pre_schedule_checks
+        pre_schedule_checks(self.preprocessed_t_unit)
+
+    def time_linearize(self, ninstructions):
+        lp.linearize(self.preprocessed_t_unit)
+
+    def time_generate_code_v2(self, ninstructions):
+        lp.generate_code_v2(self.t_unit)
+
+    def time_get_op_map(self, ninstructions):
+        lp.get_op_map(self.t_unit, subgroup_size=1)
+
+
+class FlatKernelScaling(_SyntheticKernelScaling):
+    """Many short, shallow loop nests."""
+
+    def make_kernel(self, ninstructions):
+        return make_synthetic_kernel(
+            ninstructions, loop_depth=1, target=lp.CTarget())
+
+
+class DeepKernelScaling(_SyntheticKernelScaling):
+    """Deeper loop nests with nested substitution rules and callees."""
+
+    def make_kernel(self, ninstructions):
+        return make_synthetic_kernel(
+            ninstructions, loop_depth=3, subst_rule_nesting=3,
+            callee_depth=3, target=lp.CTarget())
+
+
+class DenseDependencyScaling(_SyntheticKernelScaling):
+    """Long loop nests with dense dependencies among their instructions."""
+
+    def make_kernel(self, ninstructions):
+        return make_synthetic_kernel(
+            ninstructions, instructions_per_loop_nest=100,
+            dependency_density=0.9, target=lp.CTarget())
@@ -24,199 +24,12 @@ THE SOFTWARE.
 """
 
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from pytools import strtobool
 
-from loopy.auto_test import auto_test_vs_ref
-from loopy.codegen import PreambleInfo, generate_body, generate_code, generate_code_v2
-from loopy.codegen.result import CodeGenerationResult, GeneratedProgram
 from loopy.diagnostic import LoopyError, LoopyWarning
-from loopy.frontend.fortran import (
-    c_preprocess,
-    parse_fortran,
-    parse_transformed_fortran,
-)
-from loopy.kernel import KernelState, LoopKernel
-from loopy.kernel.creation import UniqueName, make_function, make_kernel
-from loopy.kernel.data import (
-    AddressSpace,
-    ArrayArg,
-    CallMangleInfo,
-    ConstantArg,
-    GlobalArg,
-    ImageArg,
-    KernelArgument,
-    SubstitutionRule,
-    TemporaryVariable,
-    ValueArg,
-)
-from loopy.kernel.function_interface import (
-    CallableKernel,
-    InKernelCallable,
-    ScalarCallable,
-)
-from loopy.kernel.instruction import (
-    Assignment,
-    AtomicInit,
-    AtomicUpdate,
-    BarrierInstruction,
-    CallInstruction,
-    CInstruction,
-    HappensAfter,
-    InstructionBase,
-    LegacyStringInstructionTag,
-    MemoryOrdering,
-    MemoryScope,
-    MultiAssignmentBase,
-    NoOpInstruction,
-    OrderedAtomic,
-    UseStreamingStoreTag,
-    VarAtomicity,
-)
-from loopy.kernel.tools import (
-    add_and_infer_dtypes,
-    add_dtypes,
-    find_most_recent_global_barrier,
-    get_dot_dependency_graph,
-    get_global_barrier_order,
-    get_subkernel_to_insn_id_map,
-    get_subkernels,
-    show_dependency_graph,
-)
-from loopy.library.reduction import register_reduction_parser
-from loopy.options import Options
-from loopy.preprocess import infer_arg_descr, preprocess_kernel, preprocess_program
-from loopy.schedule import (
-    generate_loop_schedules,
-    get_one_linearized_kernel,
-    get_one_scheduled_kernel,
-    linearize,
-)
-from loopy.statistics import (
-    CountGranularity,
-    MemAccess,
-    Op,
-    Sync,
-    ToCountMap,
-    ToCountPolynomialMap,
-    gather_access_footprint_bytes,
-    gather_access_footprints,
-    get_mem_access_map,
-    get_op_map,
-    get_synchronization_map,
-)
-from loopy.symbolic import LinearSubscript, Reduction, TaggedVariable, TypeCast
-from loopy.target import ASTBuilderBase, TargetBase
-from loopy.target.c import (
-    CFamilyTarget,
-    CTarget,
-    CWithGNULibcTarget,
-    ExecutableCTarget,
-    ExecutableCWithGNULibcTarget,
-    generate_header,
-)
-from loopy.target.cuda import CudaTarget
-from loopy.target.execution import ExecutorBase
-from loopy.target.ispc import ISPCTarget
-from loopy.target.opencl import OpenCLTarget
-from loopy.target.pyopencl import PyOpenCLTarget
-from loopy.tools import Optional, clear_in_mem_caches, memoize_on_disk, t_unit_to_python
-from loopy.transform.add_barrier import add_barrier
-from loopy.transform.arithmetic import (
-    collect_common_factors_on_increment,
-    fold_constants,
-)
-from loopy.transform.batch import to_batched
-from loopy.transform.buffer import buffer_array
-from loopy.transform.callable import (
-    inline_callable_kernel,
-    merge,
-    register_callable,
-    rename_callable,
-)
-from loopy.transform.concatenate import concatenate_arrays
-from loopy.transform.data import (
-    add_prefetch,
-    alias_temporaries,
-    allocate_temporaries_for_base_storage,
-    change_arg_to_image,
-    remove_unused_arguments,
-    rename_argument,
-    set_argument_order,
-    set_array_axis_names,
-    set_array_dim_names,
-    set_temporary_address_space,
-    set_temporary_scope,
-    tag_array_axes,
-    tag_data_axes,
-)
-from loopy.transform.fusion import fuse_kernels
-from loopy.transform.iname import (
-    add_inames_for_unused_hw_axes,
-    add_inames_to_insn,
-    affine_map_inames,
-    chunk_iname,
-    duplicate_inames,
-    find_unused_axis_tag,
-    get_iname_duplication_options,
-    has_schedulable_iname_nesting,
-    join_inames,
-    make_reduction_inames_unique,
-    map_domain,
-    prioritize_loops,
-    remove_inames_from_insn,
-    remove_predicates_from_insn,
-    remove_unused_inames,
-    rename_iname,
-    rename_inames,
-    split_iname,
-    split_reduction_inward,
-    split_reduction_outward,
-    tag_inames,
-    untag_inames,
-)
-from loopy.transform.instruction import (
-    add_dependency,
-    add_nosync,
-    find_instructions,
-    map_instructions,
-    remove_instructions,
-    replace_instruction_ids,
-    set_instruction_priority,
-    simplify_indices,
-    tag_instructions,
-)
-from loopy.transform.loop_fusion import (
-    get_kennedy_unweighted_fusion_candidates,
-    rename_inames_in_batch,
-)
-from loopy.transform.pack_and_unpack_args import pack_and_unpack_args_for_call
-from loopy.transform.padding import (
-    add_padding,
-    find_padding_multiple,
-    split_arg_axis,
-    split_array_axis,
-    split_array_dim,
-)
-from loopy.transform.parameter import assume, fix_parameters
-from loopy.transform.precompute import precompute
-from loopy.transform.privatize import (
-    privatize_temporaries_with_inames,
-    unprivatize_temporaries_with_inames,
-)
-from loopy.transform.realize_reduction import realize_reduction
-from loopy.transform.save import save_and_reload_temporaries
-from loopy.transform.subst import (
-    assignment_to_subst,
-    expand_subst,
-    extract_subst,
-    find_one_rule_matching,
-    find_rules_matching,
-)
-from loopy.translation_unit import TranslationUnit, for_each_kernel, make_program
-from loopy.type_inference import infer_unknown_types
-from loopy.types import LoopyType, NumpyType, ToLoopyTypeConvertible, to_loopy_type
+from loopy.translation_unit import for_each_kernel
 from loopy.typing import auto
 from loopy.version import MOST_RECENT_LANGUAGE_VERSION, VERSION
 
@@ -224,6 +37,221 @@ from loopy.version import MOST_RECENT_LANGUAGE_VERSION, VERSION
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from loopy.auto_test import auto_test_vs_ref
+    from loopy.codegen import (
+        PreambleInfo,
+        generate_body,
+        generate_code,
+        generate_code_v2,
+    )
+    from loopy.codegen.result import CodeGenerationResult, GeneratedProgram
+    from loopy.frontend.fortran import (
+        c_preprocess,
+        parse_fortran,
+        parse_transformed_fortran,
+    )
+    from loopy.kernel import KernelState, LoopKernel
+    from loopy.kernel.creation import UniqueName, make_function, make_kernel
+    from loopy.kernel.data import (
+        AddressSpace,
+        ArrayArg,
+        CallMangleInfo,
+        ConstantArg,
+        GlobalArg,
+        ImageArg,
+        KernelArgument,
+        SubstitutionRule,
+        TemporaryVariable,
+        ValueArg,
+    )
+    from loopy.kernel.function_interface import (
+        CallableKernel,
+        InKernelCallable,
+        ScalarCallable,
+    )
+    from loopy.kernel.instruction import (
+        Assignment,
+        AtomicInit,
+        AtomicUpdate,
+        BarrierInstruction,
+        CallInstruction,
+        CInstruction,
+        HappensAfter,
+        InstructionBase,
+        LegacyStringInstructionTag,
+        MemoryOrdering,
+        MemoryScope,
+        MultiAssignmentBase,
+        NoOpInstruction,
+        OpenMPReductionTag,
+        OrderedAtomic,
+        UseStreamingStoreTag,
+        VarAtomicity,
+    )
+    from loopy.kernel.tools import (
+        add_and_infer_dtypes,
+        add_dtypes,
+        find_most_recent_global_barrier,
+        get_dot_dependency_graph,
+        get_global_barrier_order,
+        get_subkernel_to_insn_id_map,
+        get_subkernels,
+        show_dependency_graph,
+    )
+    from loopy.library.reduction import register_reduction_parser
+    from loopy.options import Options
+    from loopy.preprocess import infer_arg_descr, preprocess_kernel, preprocess_program
+    from loopy.schedule import (
+        generate_loop_schedules,
+        get_one_linearized_kernel,
+        get_one_scheduled_kernel,
+        linearize,
+    )
+    from loopy.statistics import (
+        CountGranularity,
+        MemAccess,
+        Op,
+        Sync,
+        ToCountMap,
+        ToCountPolynomialMap,
+        gather_access_footprint_bytes,
+        gather_access_footprints,
+        get_mem_access_map,
+        get_op_map,
+        get_synchronization_map,
+    )
+    from loopy.symbolic import LinearSubscript, Reduction, TaggedVariable, TypeCast
+    from loopy.target import ASTBuilderBase, TargetBase
+    from loopy.target.c import (
+        CFamilyTarget,
+        CTarget,
+        CWithGNULibcTarget,
+        ExecutableCTarget,
+        ExecutableCWithGNULibcTarget,
+        generate_header,
+    )
+    from loopy.target.cuda import CudaTarget
+    from loopy.target.execution import ExecutorBase
+    from loopy.target.ispc import ISPCTarget
+    from loopy.target.opencl import OpenCLTarget
+    from loopy.target.pyopencl import PyOpenCLTarget
+    from loopy.tools import (
+        Optional,
+        clear_in_mem_caches,
+        memoize_on_disk,
+        t_unit_to_python,
+    )
+    from loopy.transform.add_barrier import add_barrier
+    from loopy.transform.arithmetic import (
+        collect_common_factors_on_increment,
+        fold_constants,
+    )
+    from loopy.transform.batch import to_batched
+    from loopy.transform.buffer import buffer_array
+    from loopy.transform.callable import (
+        inline_callable_kernel,
+        merge,
+        register_callable,
+        rename_callable,
+    )
+    from loopy.transform.concatenate import concatenate_arrays
+    from loopy.transform.cse import eliminate_common_subexpressions
+    from loopy.transform.data import (
+        add_prefetch,
+        alias_temporaries,
+        allocate_temporaries_for_base_storage,
+        change_arg_to_image,
+        pack_tile,
+        remove_unused_arguments,
+        rename_argument,
+        set_argument_order,
+        set_array_axis_names,
+        set_array_dim_names,
+        set_temporary_address_space,
+        set_temporary_scope,
+        tag_array_axes,
+        tag_data_axes,
+    )
+    from loopy.transform.fusion import fuse_kernels
+    from loopy.transform.hoist import hoist_invariants
+    from loopy.transform.iname import (
+        add_inames_for_unused_hw_axes,
+        add_inames_to_insn,
+        affine_map_inames,
+        chunk_iname,
+        duplicate_inames,
+        find_unused_axis_tag,
+        get_iname_duplication_options,
+        has_schedulable_iname_nesting,
+        join_inames,
+        make_reduction_inames_unique,
+        map_domain,
+        prioritize_loops,
+        remove_inames_from_insn,
+        remove_predicates_from_insn,
+        remove_unused_inames,
+        rename_iname,
+        rename_inames,
+        split_iname,
+        split_reduction_inward,
+        split_reduction_outward,
+        tag_inames,
+        untag_inames,
+    )
+    from loopy.transform.instruction import (
+        add_dependency,
+        add_nosync,
+        find_instructions,
+        map_instructions,
+        remove_instructions,
+        replace_instruction_ids,
+        set_instruction_priority,
+        simplify_indices,
+        tag_instructions,
+    )
+    from loopy.transform.layout import (
+        ArrayLayout,
+        apply_array_layout,
+        choose_array_layouts,
+        rank_array_layouts,
+    )
+    from loopy.transform.loop_fusion import (
+        get_kennedy_unweighted_fusion_candidates,
+        rename_inames_in_batch,
+    )
+    from loopy.transform.pack_and_unpack_args import pack_and_unpack_args_for_call
+    from loopy.transform.padding import (
+        CacheConflict,
+        CacheGeometry,
+        add_padding,
+        add_padding_to_avoid_cache_conflicts,
+        find_cache_conflicts,
+        find_padding_multiple,
+        split_arg_axis,
+        split_array_axis,
+        split_array_dim,
+    )
+    from loopy.transform.parameter import assume, fix_parameters, multiversion
+    from loopy.transform.precompute import precompute
+    from loopy.transform.privatize import (
+        privatize_temporaries_with_inames,
+        unprivatize_temporaries_with_inames,
+    )
+    from loopy.transform.realize_reduction import realize_reduction
+    from loopy.transform.save import save_and_reload_temporaries
+    from loopy.transform.session import TransformationSession
+    from loopy.transform.subst import (
+        assignment_to_subst,
+        expand_subst,
+        extract_subst,
+        find_one_rule_matching,
+        find_rules_matching,
+    )
+    from loopy.transform.tiling import auto_tile
+    from loopy.translation_unit import TranslationUnit, make_program
+    from loopy.type_inference import infer_unknown_types
+    from loopy.types import LoopyType, NumpyType, ToLoopyTypeConvertible, to_loopy_type
+
 
 __all__ = [
     "MOST_RECENT_LANGUAGE_VERSION",
@@ -231,6 +259,7 @@ __all__ = [
     "ASTBuilderBase",
     "AddressSpace",
     "ArrayArg",
+    "ArrayLayout",
     "Assignment",
     "AtomicInit",
     "AtomicUpdate",
@@ -239,6 +268,8 @@ __all__ = [
     "CInstruction",
     "CTarget",
     "CWithGNULibcTarget",
+    "CacheConflict",
+    "CacheGeometry",
     "CacheMode",
     "CallInstruction",
     "CallMangleInfo",
@@ -273,6 +304,7 @@ __all__ = [
     "NumpyType",
     "Op",
     "OpenCLTarget",
+    "OpenMPReductionTag",
     "Optional",
     "Options",
     "OrderedAtomic",
@@ -288,6 +320,7 @@ __all__ = [
     "ToCountMap",
     "ToCountPolynomialMap",
     "ToLoopyTypeConvertible",
+    "TransformationSession",
     "TranslationUnit",
     "TypeCast",
     "UniqueName",
@@ -302,24 +335,30 @@ __all__ = [
     "add_inames_to_insn",
     "add_nosync",
     "add_padding",
+    "add_padding_to_avoid_cache_conflicts",
     "add_prefetch",
     "affine_map_inames",
     "alias_temporaries",
     "allocate_temporaries_for_base_storage",
+    "apply_array_layout",
     "assignment_to_subst",
     "assume",
     "auto",
     "auto_test_vs_ref",
+    "auto_tile",
     "buffer_array",
     "c_preprocess",
     "change_arg_to_image",
+    "choose_array_layouts",
     "chunk_iname",
     "clear_in_mem_caches",
     "collect_common_factors_on_increment",
     "concatenate_arrays",
     "duplicate_inames",
+    "eliminate_common_subexpressions",
     "expand_subst",
     "extract_subst",
+    "find_cache_conflicts",
     "find_instructions",
     "find_most_recent_global_barrier",
     "find_one_rule_matching",
@@ -349,6 +388,7 @@ __all__ = [
     "get_subkernels",
     "get_synchronization_map",
     "has_schedulable_iname_nesting",
+    "hoist_invariants",
     "infer_arg_descr",
     "infer_unknown_types",
     "inline_callable_kernel",
@@ -365,7 +405,9 @@ __all__ = [
     "map_instructions",
     "memoize_on_disk",
     "merge",
+    "multiversion",
     "pack_and_unpack_args_for_call",
+    "pack_tile",
     "parse_fortran",
     "parse_transformed_fortran",
     "precompute",
@@ -373,6 +415,7 @@ __all__ = [
     "preprocess_program",
     "prioritize_loops",
     "privatize_temporaries_with_inames",
+    "rank_array_layouts",
     "realize_reduction",
     "register_callable",
     "register_preamble_generators",
@@ -419,6 +462,297 @@ __all__ = [
 # }}}
 
 
+# {{{ lazy imports
+
+# Importing all of loopy's transformations, targets and frontends takes a
+# substantial fraction of the run time of short-lived processes. The names
+# below are only imported on first access, through the module-level
+# __getattr__ (see PEP 562).
+_LAZY_IMPORTS: dict[str, tuple[str, ...]] = {
+    "loopy.auto_test": ("auto_test_vs_ref",),
+    "loopy.codegen": (
+        "PreambleInfo",
+        "generate_body",
+        "generate_code",
+        "generate_code_v2",
+        ),
+    "loopy.codegen.result": (
+        "CodeGenerationResult",
+        "GeneratedProgram",
+        ),
+    "loopy.frontend.fortran": (
+        "c_preprocess",
+        "parse_fortran",
+        "parse_transformed_fortran",
+        ),
+    "loopy.kernel": (
+        "KernelState",
+        "LoopKernel",
+        ),
+    "loopy.kernel.creation": (
+        "UniqueName",
+        "make_function",
+        "make_kernel",
+        ),
+    "loopy.kernel.data": (
+        "AddressSpace",
+        "ArrayArg",
+        "CallMangleInfo",
+        "ConstantArg",
+        "GlobalArg",
+        "ImageArg",
+        "KernelArgument",
+        "SubstitutionRule",
+        "TemporaryVariable",
+        "ValueArg",
+        ),
+    "loopy.kernel.function_interface": (
+        "CallableKernel",
+        "InKernelCallable",
+        "ScalarCallable",
+        ),
+    "loopy.kernel.instruction": (
+        "Assignment",
+        "AtomicInit",
+        "AtomicUpdate",
+        "BarrierInstruction",
+        "CallInstruction",
+        "CInstruction",
+        "HappensAfter",
+        "InstructionBase",
+        "LegacyStringInstructionTag",
+        "MemoryOrdering",
+        "MemoryScope",
+        "MultiAssignmentBase",
+        "NoOpInstruction",
+        "OpenMPReductionTag",
+        "OrderedAtomic",
+        "UseStreamingStoreTag",
+        "VarAtomicity",
+        ),
+    "loopy.kernel.tools": (
+        "add_and_infer_dtypes",
+        "add_dtypes",
+        "find_most_recent_global_barrier",
+        "get_dot_dependency_graph",
+        "get_global_barrier_order",
+        "get_subkernel_to_insn_id_map",
+        "get_subkernels",
+        "show_dependency_graph",
+        ),
+    "loopy.library.reduction": ("register_reduction_parser",),
+    "loopy.options": ("Options",),
+    "loopy.preprocess": (
+        "infer_arg_descr",
+        "preprocess_kernel",
+        "preprocess_program",
+        ),
+    "loopy.schedule": (
+        "generate_loop_schedules",
+        "get_one_linearized_kernel",
+        "get_one_scheduled_kernel",
+        "linearize",
+        ),
+    "loopy.statistics": (
+        "CountGranularity",
+        "MemAccess",
+        "Op",
+        "Sync",
+        "ToCountMap",
+        "ToCountPolynomialMap",
+        "gather_access_footprint_bytes",
+        "gather_access_footprints",
+        "get_mem_access_map",
+        "get_op_map",
+        "get_synchronization_map",
+        ),
+    "loopy.symbolic": (
+        "LinearSubscript",
+        "Reduction",
+        "TaggedVariable",
+        "TypeCast",
+        ),
+    "loopy.target": (
+        "ASTBuilderBase",
+        "TargetBase",
+        ),
+    "loopy.target.c": (
+        "CFamilyTarget",
+        "CTarget",
+        "CWithGNULibcTarget",
+        "ExecutableCTarget",
+        "ExecutableCWithGNULibcTarget",
+        "generate_header",
+        ),
+    "loopy.target.cuda": ("CudaTarget",),
+    "loopy.target.execution": ("ExecutorBase",),
+    "loopy.target.ispc": ("ISPCTarget",),
+    "loopy.target.opencl": ("OpenCLTarget",),
+    "loopy.target.pyopencl": ("PyOpenCLTarget",),
+    "loopy.tools": (
+        "Optional",
+        "clear_in_mem_caches",
+        "memoize_on_disk",
+        "t_unit_to_python",
+        ),
+    "loopy.transform.add_barrier": ("add_barrier",),
+    "loopy.transform.arithmetic": (
+        "collect_common_factors_on_increment",
+        "fold_constants",
+        ),
+    "loopy.transform.batch": ("to_batched",),
+    "loopy.transform.buffer": ("buffer_array",),
+    "loopy.transform.callable": (
+        "inline_callable_kernel",
+        "merge",
+        "register_callable",
+        "rename_callable",
+        ),
+    "loopy.transform.concatenate": ("concatenate_arrays",),
+    "loopy.transform.cse": ("eliminate_common_subexpressions",),
+    "loopy.transform.data": (
+        "add_prefetch",
+        "alias_temporaries",
+        "allocate_temporaries_for_base_storage",
+        "change_arg_to_image",
+        "pack_tile",
+        "remove_unused_arguments",
+        "rename_argument",
+        "set_argument_order",
+        "set_array_axis_names",
+        "set_array_dim_names",
+        "set_temporary_address_space",
+        "set_temporary_scope",
+        "tag_array_axes",
+        "tag_data_axes",
+        ),
+    "loopy.transform.fusion": ("fuse_kernels",),
+    "loopy.transform.hoist": ("hoist_invariants",),
+    "loopy.transform.iname": (
+        "add_inames_for_unused_hw_axes",
+        "add_inames_to_insn",
+        "affine_map_inames",
+        "chunk_iname",
+        "duplicate_inames",
+        "find_unused_axis_tag",
+        "get_iname_duplication_options",
+        "has_schedulable_iname_nesting",
+        "join_inames",
+        "make_reduction_inames_unique",
+        "map_domain",
+        "prioritize_loops",
+        "remove_inames_from_insn",
+        "remove_predicates_from_insn",
+        "remove_unused_inames",
+        "rename_iname",
+        "rename_inames",
+        "split_iname",
+        "split_reduction_inward",
+        "split_reduction_outward",
+        "tag_inames",
+        "untag_inames",
+        ),
+    "loopy.transform.instruction": (
+        "add_dependency",
+        "add_nosync",
+        "find_instructions",
+        "map_instructions",
+        "remove_instructions",
+        "replace_instruction_ids",
+        "set_instruction_priority",
+        "simplify_indices",
+        "tag_instructions",
+        ),
+    "loopy.transform.layout": (
+        "ArrayLayout",
+        "apply_array_layout",
+        "choose_array_layouts",
+        "rank_array_layouts",
+        ),
+    "loopy.transform.loop_fusion": (
+        "get_kennedy_unweighted_fusion_candidates",
+        "rename_inames_in_batch",
+        ),
+    "loopy.transform.pack_and_unpack_args": ("pack_and_unpack_args_for_call",),
+    "loopy.transform.padding": (
+        "CacheConflict",
+        "CacheGeometry",
+        "add_padding",
+        "add_padding_to_avoid_cache_conflicts",
+        "find_cache_conflicts",
+        "find_padding_multiple",
+        "split_arg_axis",
+        "split_array_axis",
+        "split_array_dim",
+        ),
+    "loopy.transform.parameter": (
+        "assume",
+        "fix_parameters",
+        "multiversion",
+        ),
+    "loopy.transform.precompute": ("precompute",),
+    "loopy.transform.privatize": (
+        "privatize_temporaries_with_inames",
+        "unprivatize_temporaries_with_inames",
+        ),
+    "loopy.transform.realize_reduction": ("realize_reduction",),
+    "loopy.transform.save": ("save_and_reload_temporaries",),
+    "loopy.transform.session": ("TransformationSession",),
+    "loopy.transform.subst": (
+        "assignment_to_subst",
+        "expand_subst",
+        "extract_subst",
+        "find_one_rule_matching",
+        "find_rules_matching",
+        ),
+    "loopy.transform.tiling": ("auto_tile",),
+    "loopy.translation_unit": (
+        "TranslationUnit",
+        "make_program",
+        ),
+    "loopy.type_inference": ("infer_unknown_types",),
+    "loopy.types": (
+        "LoopyType",
+        "NumpyType",
+        "ToLoopyTypeConvertible",
+        "to_loopy_type",
+        ),
+    }
+
+_LAZY_ATTRIBUTES: dict[str, str] = {
+        name: module_name
+        for module_name, names in _LAZY_IMPORTS.items()
+        for name in names}
+
+
+def __getattr__(name: str) -> Any:
+    from importlib import import_module
+
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        # give access to submodules (e.g. 'loopy.target') without an
+        # explicit import, as they used to be imported along with loopy
+        try:
+            return import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as err:
+            if err.name != f"{__name__}.{name}":
+                raise
+
+            raise AttributeError(
+                    f"module '{__name__}' has no attribute '{name}'") from None
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
+
+# }}}
+
+
 # {{{ set_options
 
 @for_each_kernel
@@ -429,6 +763,7 @@ def set_options(kernel, *args, **kwargs):
 
     See also :class:`Options`.
     """
+    from loopy.kernel import LoopKernel
     assert isinstance(kernel, LoopKernel)
 
     if args and kwargs:
@@ -565,6 +900,9 @@ def make_copy_kernel(new_dim_tags, old_dim_tags=None):
         VectorArrayDimTag,
         parse_array_dim_tags,
     )
+    from loopy.kernel.creation import make_kernel
+    from loopy.transform.data import tag_array_axes
+    from loopy.transform.iname import tag_inames
     new_dim_tags = parse_array_dim_tags(new_dim_tags, n_axes=None)
 
     rank = len(new_dim_tags)
@@ -653,6 +991,10 @@ def make_einsum(spec, arg_names, **knl_creation_kwargs):
     sum_indices = all_indices - out_indices
 
     from pymbolic import var
+
+    from loopy.kernel.creation import make_kernel
+    from loopy.kernel.instruction import Assignment
+    from loopy.symbolic import Reduction
     lhs = var("out")[tuple(var(i) for i in out_spec)]
 
     rhs = 1
@@ -689,20 +1031,20 @@ def set_default_target(target: Callable[[], TargetBase] | None):
     _DEFAULT_TARGET = target
 
 
-def _set_up_default_target():
+def _make_default_target() -> TargetBase:
+    # Importing pyopencl (and the target) is deferred until a kernel is
+    # created without a target, to keep 'import loopy' cheap.
     try:
         import pyopencl  # noqa: F401
     except ImportError:
         from loopy.target.opencl import OpenCLTarget
-        target = OpenCLTarget
+        return OpenCLTarget()
     else:
         from loopy.target.pyopencl import PyOpenCLTarget
-        target = PyOpenCLTarget
-
-    set_default_target(target)
+        return PyOpenCLTarget()
 
 
-_set_up_default_target()
+set_default_target(_make_default_target)
 
 # }}}
 
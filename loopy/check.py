@@ -25,7 +25,7 @@ THE SOFTWARE.
 
 import logging
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import reduce
 from typing import TYPE_CHECKING, cast
 
@@ -36,6 +36,7 @@ import islpy as isl
 from islpy import dim_type
 from pymbolic.primitives import AlgebraicLeaf, Variable, is_arithmetic_expression
 from pytools import memoize_method, set_union
+from pytools.persistent_dict import WriteOncePersistentDict
 
 from loopy.diagnostic import (
     LoopyError,
@@ -65,6 +66,7 @@ from loopy.kernel.instruction import (
     _DataObliviousInstruction,
 )
 from loopy.symbolic import CombineMapper, ResolvedFunction, SubArrayRef, WalkMapper
+from loopy.tools import LoopyKeyBuilder, caches
 from loopy.translation_unit import (
     CallableId,
     CallablesTable,
@@ -73,10 +75,12 @@ from loopy.translation_unit import (
 )
 from loopy.type_inference import TypeReader
 from loopy.typing import auto, not_none
+from loopy.version import DATA_MODEL_VERSION
 
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Callable, Mapping, Sequence
+    from concurrent.futures import Executor
 
     import pymbolic.primitives as p
     from pymbolic import ArithmeticExpression
@@ -114,6 +118,10 @@ __doc__ = """
 .. autofunction:: check_bounds
 
 .. autofunction:: check_variable_access_ordered
+
+.. autofunction:: pre_schedule_checks
+
+.. autodata:: EXPENSIVE_PRE_SCHEDULE_CHECKS
 """
 
 
@@ -478,13 +486,15 @@ def check_multiple_tags_allowed(kernel: LoopKernel) -> None:
         GroupInameTag,
         IlpBaseTag,
         LocalInameTag,
+        OpenMPParallelTag,
         UnrollTag,
         VectorizeTag,
         filter_iname_tags_by_type,
     )
     illegal_combinations = [
-        (GroupInameTag, LocalInameTag, VectorizeTag, UnrollTag, ForceSequentialTag),
-        (IlpBaseTag, ForceSequentialTag)
+        (GroupInameTag, LocalInameTag, VectorizeTag, UnrollTag, ForceSequentialTag,
+            OpenMPParallelTag),
+        (IlpBaseTag, ForceSequentialTag, OpenMPParallelTag)
     ]
     for iname in kernel.inames.values():
         for comb in illegal_combinations:
@@ -607,7 +617,7 @@ def check_for_write_races(kernel: LoopKernel) -> None:
     """
     Check if any memory accesses lead to write races.
     """
-    from loopy.kernel.data import ConcurrentTag
+    from loopy.kernel.data import ConcurrentTag, OpenMPParallelTag
 
     for insn in kernel.instructions:
         for assignee_name, assignee_indices in zip(
@@ -626,7 +636,8 @@ def check_for_write_races(kernel: LoopKernel) -> None:
 
                 raceable_parallel_insn_inames = {
                     iname for iname in insn.within_inames
-                    if kernel.iname_tags_of_type(iname, ConcurrentTag)}
+                    if kernel.iname_tags_of_type(
+                        iname, (ConcurrentTag, OpenMPParallelTag))}
 
             elif assignee_name in kernel.temporary_variables:
                 temp_var = kernel.temporary_variables[assignee_name]
@@ -718,6 +729,11 @@ class _AccessCheckMapper(WalkMapper[[isl.Set, str]]):
     kernel: LoopKernel
     callables_table: CallablesTable
 
+    callee_kernels: list[LoopKernel] = field(default_factory=list)
+    """Callee kernels encountered at call sites, with the assumptions from
+    the call site added. These still need to be checked.
+    """
+
     def __post_init__(self) -> None:
         super().__init__()
 
@@ -891,16 +907,27 @@ class _AccessCheckMapper(WalkMapper[[isl.Set, str]]):
 
             # }}}
 
-            _check_bounds_inner_rec(subkernel, self.callables_table)
+            self.callee_kernels.append(subkernel)
 
 
-def _check_bounds_inner(kernel: LoopKernel, callables_table: CallablesTable) -> None:
+def _check_bounds_for_insns(
+            kernel: LoopKernel,
+            callables_table: CallablesTable,
+            insn_ids: Sequence[str]
+        ) -> list[LoopKernel]:
+    """Checks the array accesses in the instructions *insn_ids* of *kernel*.
+
+    :returns: the callee kernels invoked by these instructions, with the
+        call site's constraints added to their assumptions.
+    :raises LoopyIndexError: if an out-of-bounds access is found.
+    """
     from loopy.kernel.instruction import get_insn_domain
 
     temp_var_names = set(kernel.temporary_variables)
     acm = _AccessCheckMapper(kernel, callables_table)
     kernel_assumptions_is_universe = kernel.assumptions.is_universe()
-    for insn in kernel.instructions:
+    for insn_id in insn_ids:
+        insn = kernel.id_to_insn[insn_id]
         domain = get_insn_domain(insn, kernel)
 
         # data-dependent bounds? can't do much
@@ -919,11 +946,10 @@ def _check_bounds_inner(kernel: LoopKernel, callables_table: CallablesTable) ->
 
         insn.with_transformed_expressions(run_acm)
 
+    return acm.callee_kernels
 
-def _check_bounds_inner_rec(
-            kernel: LoopKernel,
-            callables_table: CallablesTable
-        ) -> None:
+
+def _get_bounds_check_mode(kernel: LoopKernel) -> bool | str:
     if kernel.options.enforce_array_accesses_within_bounds not in [
             "no_check",
             True,
@@ -932,29 +958,118 @@ def _check_bounds_inner_rec(
                 "'enforce_array_accesses_within_bounds': %s"
                 % kernel.options.enforce_array_accesses_within_bounds)
 
-    if kernel.options.enforce_array_accesses_within_bounds == "no_check":
-        return
+    return kernel.options.enforce_array_accesses_within_bounds
+
+
+def _handle_out_of_bounds_access(kernel: LoopKernel, err: LoopyIndexError) -> None:
+    if _get_bounds_check_mode(kernel):
+        raise err
+    else:
+        warn_with_kernel(kernel, "array_access_out_of_bounds", str(err))
 
+
+def _split_into_batches(
+            insn_ids: Sequence[str],
+            nbatches: int
+        ) -> list[Sequence[str]]:
+    batch_size = max(1, -(-len(insn_ids) // nbatches))
+    return [insn_ids[i:i+batch_size]
+            for i in range(0, len(insn_ids), batch_size)]
+
+
+def _check_bounds_serial(
+            kernels: Sequence[LoopKernel],
+            callables_table: CallablesTable
+        ) -> list[LoopKernel]:
     from pytools import ProcessLogger
-    with ProcessLogger(logger, "%s: check array access within bounds" % kernel.name):
-        if kernel.options.enforce_array_accesses_within_bounds:
-            _check_bounds_inner(kernel, callables_table)
-        else:
-            from loopy.diagnostic import LoopyIndexError
+
+    callee_kernels: list[LoopKernel] = []
+    for kernel in kernels:
+        with ProcessLogger(logger,
+                           "%s: check array access within bounds" % kernel.name):
             try:
-                _check_bounds_inner(kernel, callables_table)
+                callee_kernels.extend(_check_bounds_for_insns(
+                    kernel, callables_table,
+                    [insn.id for insn in kernel.instructions]))
             except LoopyIndexError as e:
-                from loopy.diagnostic import warn_with_kernel
-                warn_with_kernel(kernel, "array_access_out_of_bounds", str(e))
+                _handle_out_of_bounds_access(kernel, e)
+
+    return callee_kernels
+
+
+def _check_bounds_in_pool(
+            kernels: Sequence[LoopKernel],
+            callables_table: CallablesTable,
+            pool: Executor,
+            nbatches: int
+        ) -> list[LoopKernel]:
+    from pytools import ProcessLogger
+
+    with ProcessLogger(logger, "check array access within bounds of %s"
+                       % ", ".join(kernel.name for kernel in kernels)):
+        futures = [
+            (kernel, pool.submit(_check_bounds_for_insns,
+                                 kernel, callables_table, insn_ids))
+            for kernel in kernels
+            for insn_ids in _split_into_batches(
+                [insn.id for insn in kernel.instructions], nbatches)]
+
+        # Results are merged in submission order so that diagnostics do not
+        # depend on the order in which the batches complete.
+        callee_kernels: list[LoopKernel] = []
+        failed_kernels: set[LoopKernel] = set()
+        for kernel, future in futures:
+            try:
+                callee_kernels.extend(future.result())
+            except LoopyIndexError as e:
+                # report only the first violation in each kernel, as in
+                # the serial case
+                if kernel not in failed_kernels:
+                    failed_kernels.add(kernel)
+                    _handle_out_of_bounds_access(kernel, e)
+
+    return callee_kernels
 
 
 def check_bounds(t_unit: TranslationUnit) -> None:
     """
     Performs out-of-bound check for every array access.
+
+    Callee kernels are checked under the assumptions implied by each of their
+    call sites. If :attr:`loopy.Options.bounds_check_max_workers` is positive
+    on any of the entrypoints, the checks are sharded into batches of
+    instructions and run in a :class:`concurrent.futures.ProcessPoolExecutor`
+    with that many worker processes.
     """
-    for epoint in t_unit.entrypoints:
-        _check_bounds_inner_rec(t_unit[epoint],
-                                t_unit.callables_table)
+    max_workers = max((t_unit[epoint].options.bounds_check_max_workers
+                       for epoint in t_unit.entrypoints), default=0)
+
+    def check_all(check_kernels: Callable[[Sequence[LoopKernel]],
+                                          list[LoopKernel]]) -> None:
+        # Breadth-first traversal of the call tree. Callees called with
+        # identical assumptions from several call sites are checked only once.
+        visited: set[LoopKernel] = set()
+        kernels = [t_unit[epoint] for epoint in t_unit.entrypoints]
+        while kernels:
+            new_kernels: list[LoopKernel] = []
+            for kernel in kernels:
+                if kernel in visited:
+                    continue
+                visited.add(kernel)
+
+                if _get_bounds_check_mode(kernel) != "no_check":
+                    new_kernels.append(kernel)
+
+            kernels = check_kernels(new_kernels)
+
+    if max_workers:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            check_all(lambda kernels: _check_bounds_in_pool(
+                kernels, t_unit.callables_table, pool, max_workers))
+    else:
+        check_all(lambda kernels: _check_bounds_serial(
+                kernels, t_unit.callables_table))
 
 # }}}
 
@@ -1302,33 +1417,108 @@ def check_variable_access_ordered(kernel: LoopKernel) -> None:
 # }}}
 
 
-def pre_schedule_checks(t_unit: TranslationUnit) -> None:
+# {{{ pre-schedule check driver
+
+pre_schedule_check_cache: WriteOncePersistentDict[
+        tuple[str, TranslationUnit],
+        tuple[tuple[str, type[Warning]], ...]
+] = WriteOncePersistentDict(
+        "loopy-pre-schedule-check-cache-v1-"+DATA_MODEL_VERSION,
+        key_builder=LoopyKeyBuilder(),
+        safe_sync=False)
+
+
+caches.append(pre_schedule_check_cache)
+
+
+def _run_memoized_check(
+            check: Callable[[TranslationUnit], None],
+            t_unit: TranslationUnit
+        ) -> None:
+    """Runs *check* on *t_unit*, reusing the recorded outcome of a previous
+    successful run on an equal translation unit if one is available.
+
+    Only successful outcomes are memoized. Warnings emitted by *check* via
+    :func:`~loopy.diagnostic.warn_with_kernel` are recorded alongside the
+    outcome and re-emitted on a cache hit.
+    """
+    from loopy import CACHING_ENABLED
+
+    if not CACHING_ENABLED:
+        check(t_unit)
+        return
+
+    cache_key = (check.__name__, t_unit)
+
     try:
-        logger.debug("pre-schedule checks start for entrypoints: "
-                     f"{t_unit.entrypoints}.")
+        recorded_warnings = pre_schedule_check_cache[cache_key]
+        logger.debug(f"{check.__name__}: check cache hit")
+    except KeyError:
+        logger.debug(f"{check.__name__}: check cache miss")
+
+        from loopy.diagnostic import record_kernel_warnings
+        with record_kernel_warnings() as new_warnings:
+            check(t_unit)
+
+        recorded_warnings = tuple(new_warnings)
+        pre_schedule_check_cache.store_if_not_present(cache_key,
+                                                      recorded_warnings)
+        return
 
-        check_for_integer_subscript_indices(t_unit)
+    import warnings
+    for message, category in recorded_warnings:
+        warnings.warn(message, category, stacklevel=3)
 
-        check_functions_are_resolved(t_unit)
-        check_separated_array_consistency(t_unit)
-        check_offsets_and_dim_tags(t_unit)
+
+def pre_schedule_checks(t_unit: TranslationUnit) -> None:
+    """Runs the sanity checks that must pass before *t_unit* can be
+    linearized. The outcome of each of the
+    :data:`EXPENSIVE_PRE_SCHEDULE_CHECKS` is memoized on disk, keyed on the
+    check and *t_unit*. The remaining checks are cheap compared to hashing
+    *t_unit* and are run directly.
+
+    If :attr:`loopy.Options.skip_expensive_checks` is set on all entrypoints
+    of *t_unit*, the checks listed in :data:`EXPENSIVE_PRE_SCHEDULE_CHECKS`
+    are skipped.
+    """
+    checks = [
+        check_for_integer_subscript_indices,
+        check_functions_are_resolved,
+        check_separated_array_consistency,
+        check_offsets_and_dim_tags,
         # Ordering restriction:
         # check_sub_array_ref_inames_not_within_or_redn_inames should be done
         # before check_bounds. See: BatchedAccessMapMapper.map_sub_array_ref.
-        check_sub_array_ref_inames_not_within_or_redn_inames(t_unit)
-        check_for_duplicate_insn_ids(t_unit)
-        check_for_double_use_of_hw_axes(t_unit)
-        check_insn_attributes(t_unit)
-        check_loop_priority_inames_known(t_unit)
-        check_multiple_tags_allowed(t_unit)
-        check_for_inactive_iname_access(t_unit)
-        check_for_unused_inames(t_unit)
-        check_for_write_races(t_unit)
-        check_for_data_dependent_parallel_bounds(t_unit)
-        check_bounds(t_unit)
-        check_write_destinations(t_unit)
-        check_has_schedulable_iname_nesting(t_unit)
-        check_variable_access_ordered(t_unit)
+        check_sub_array_ref_inames_not_within_or_redn_inames,
+        check_for_duplicate_insn_ids,
+        check_for_double_use_of_hw_axes,
+        check_insn_attributes,
+        check_loop_priority_inames_known,
+        check_multiple_tags_allowed,
+        check_for_inactive_iname_access,
+        check_for_unused_inames,
+        check_for_write_races,
+        check_for_data_dependent_parallel_bounds,
+        check_bounds,
+        check_write_destinations,
+        check_has_schedulable_iname_nesting,
+        check_variable_access_ordered,
+    ]
+
+    if all(t_unit[ep].options.skip_expensive_checks
+           for ep in t_unit.entrypoints):
+        checks = [check for check in checks
+                  if check not in EXPENSIVE_PRE_SCHEDULE_CHECKS]
+
+    try:
+        logger.debug("pre-schedule checks start for entrypoints: "
+                     f"{t_unit.entrypoints}.")
+
+        for check in checks:
+            if check in EXPENSIVE_PRE_SCHEDULE_CHECKS:
+                _run_memoized_check(check, t_unit)
+            else:
+                check(t_unit)
 
         logger.debug("pre-schedule checks done")
     except KeyboardInterrupt:
@@ -1342,6 +1532,19 @@ def pre_schedule_checks(t_unit: TranslationUnit) -> None:
         raise
 
 
+EXPENSIVE_PRE_SCHEDULE_CHECKS = frozenset({
+    check_for_write_races,
+    check_for_data_dependent_parallel_bounds,
+    check_bounds,
+    })
+"""The :mod:`islpy`-heavy checks run by :func:`pre_schedule_checks`. Their
+outcomes are memoized on disk, and they are skipped if
+:attr:`loopy.Options.skip_expensive_checks` is set.
+"""
+
+# }}}
+
+
 # {{{ post-schedule / pre-code-generation checks
 
 # {{{ check_for_nested_base_storage
@@ -1900,6 +2103,8 @@ def check_implemented_domains(
         ) -> bool:
     from islpy import align_two, dim_type
 
+    from loopy.symbolic import condition_to_set
+
     last_idomains = None
     last_insn_inames = None
 
@@ -1943,6 +2148,12 @@ def check_implemented_domains(
         insn_domain = kernel.get_inames_domain(insn_inames)
         insn_parameters = frozenset(insn_domain.get_var_names_not_none(dim_type.param))
         assumptions, insn_domain = align_two(assumption_non_param, insn_domain)
+
+        # affine predicates are taken into account by code generation
+        for pred in insn.predicates:
+            pred_set = condition_to_set(insn_domain.space, pred)
+            if pred_set is not None:
+                insn_domain = insn_domain & pred_set
         desired_domain = ((insn_domain & assumptions)
             .project_out_except(insn_inames, [dim_type.set])
             .project_out_except(insn_parameters, [dim_type.param]))
@@ -24,7 +24,7 @@ THE SOFTWARE.
 """
 
 import logging
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field, replace
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -141,6 +141,7 @@ class CodeGenerationState:
     .. attribute:: seen_atomic_dtypes
 
     .. autoattribute:: var_subst_map
+    .. autoattribute:: strength_reduced_subscripts
 
     .. autoattribute:: allow_complex
     .. autoattribute:: vectorization_info
@@ -183,6 +184,14 @@ class CodeGenerationState:
     codegen_cache_manager: CodegenOperationCacheManager
     vectorization_info: VectorizationInfo | None = None
 
+    strength_reduced_subscripts: constantdict.constantdict[Expression, str] = (
+        field(default_factory=constantdict.constantdict))
+    """
+    A mapping from flattened array subscripts to the names of variables
+    holding their values, which are maintained incrementally by the enclosing
+    loop. See :attr:`loopy.Options.strength_reduce_indices`.
+    """
+
     # {{{ copy helpers
 
     def copy(self, **kwargs: Any) -> Self:
@@ -538,7 +547,24 @@ class TranslationUnitCodeGenerationResult:
                     self.host_programs.values()))
 
 
+def _generate_code_for_callable(
+            t_unit: TranslationUnit,
+            func_id: CallableId
+        ) -> CodeGenerationResult[Any]:
+    return generate_code_for_a_single_kernel(t_unit[func_id],
+                                             t_unit.callables_table,
+                                             t_unit.target,
+                                             func_id in t_unit.entrypoints)
+
+
 def generate_code_v2(t_unit: TranslationUnit) -> CodeGenerationResult[Any]:
+    """
+    :returns: a :class:`TranslationUnitCodeGenerationResult`
+
+    If :attr:`loopy.Options.codegen_max_workers` is greater than one on any
+    of the entrypoints of *t_unit*, code for the callable kernels is generated
+    concurrently in a :class:`concurrent.futures.ProcessPoolExecutor`.
+    """
     # {{{ cache retrieval
 
     from loopy import ABORT_ON_CACHE_MISS, CACHING_ENABLED
@@ -596,12 +622,25 @@ def generate_code_v2(t_unit: TranslationUnit) -> CodeGenerationResult[Any]:
 
     # {{{ collect host/device programs
 
-    for func_id in sorted(key for key, val in t_unit.callables_table.items()
-                          if isinstance(val, CallableKernel)):
-        cgr = generate_code_for_a_single_kernel(t_unit[func_id],
-                                                t_unit.callables_table,
-                                                t_unit.target,
-                                                func_id in t_unit.entrypoints)
+    func_ids = sorted(key for key, val in t_unit.callables_table.items()
+                      if isinstance(val, CallableKernel))
+    max_workers = min(
+            max((t_unit[epoint].options.codegen_max_workers
+                 for epoint in t_unit.entrypoints), default=0),
+            len(func_ids))
+
+    if max_workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            # Results are merged in the order of *func_ids*, independent of
+            # the order in which the workers complete.
+            cgrs = list(pool.map(_generate_code_for_callable,
+                                 [t_unit] * len(func_ids), func_ids))
+    else:
+        cgrs = [_generate_code_for_callable(t_unit, func_id)
+                for func_id in func_ids]
+
+    for func_id, cgr in zip(func_ids, cgrs, strict=True):
         if func_id in t_unit.entrypoints:
             host_programs[func_id] = cgr.host_program
         else:
@@ -103,6 +103,7 @@ def generate_code_for_sched_index(
             InameImplementationTag,
             InOrderSequentialSequentialTag,
             LoopedIlpTag,
+            OpenMPParallelTag,
             UnrolledIlpTag,
             UnrollHintTag,
             UnrollTag,
@@ -128,6 +129,10 @@ def generate_code_for_sched_index(
             hints = [codegen_state.ast_builder.emit_unroll_hint(tag.value)
                     for tag in unroll_tags]
             func = partial(generate_sequential_loop_dim_code, hints=hints)
+        elif filter_iname_tags_by_type(tags, OpenMPParallelTag):
+            hints = [codegen_state.ast_builder.emit_openmp_parallel_hint(
+                codegen_state, sched_item.iname)]
+            func = partial(generate_sequential_loop_dim_code, hints=hints)
         elif not tags or filter_iname_tags_by_type(tags, (LoopedIlpTag,
                     ForceSequentialTag, InOrderSequentialSequentialTag)):
             func = partial(generate_sequential_loop_dim_code, hints=[])
@@ -468,6 +473,15 @@ def build_loop_nest(
                     implemented_predicates=new_codegen_state.implemented_predicates
                     | pred_checks)
 
+            # Affine predicates become known facts about the domain, so that
+            # the bounds checks they imply need not be generated.
+            from loopy.symbolic import condition_to_set
+            for pred in pred_checks:
+                pred_set = condition_to_set(
+                        new_codegen_state.implemented_domain.space, pred)
+                if pred_set is not None:
+                    new_codegen_state = new_codegen_state.intersect(pred_set)
+
         if is_empty:
             result: list[CodeGenerationResult[Any]] = []
         else:
@@ -91,6 +91,12 @@ def to_codegen_result(
     if chk_domain.is_empty():
         return None
 
+    from loopy.symbolic import condition_to_set
+    for pred in required_preds:
+        pred_set = condition_to_set(new_implemented_domain.space, pred)
+        if pred_set is not None:
+            new_implemented_domain = new_implemented_domain & pred_set
+
     condition_exprs = []
     if not chk_domain.plain_is_universe():
         from loopy.symbolic import set_to_cond_expr
@@ -42,15 +42,24 @@ if TYPE_CHECKING:
     from loopy.codegen import CodeGenerationState
     from loopy.kernel import LoopKernel
     from loopy.schedule import EnterLoop
-    from loopy.typing import InameStr
+    from loopy.typing import Expression, InameStr
 
 
 # {{{ conditional-reducing slab decomposition
 
 def get_slab_decomposition(
             kernel: LoopKernel,
-            iname: InameStr
+            iname: InameStr,
+            slab_increments: tuple[int, int] | None = None,
         ) -> Sequence[tuple[str, isl.BasicSet]]:
+    """Returns a sequence of tuples ``(slab_name, slab)``, the first of which
+    is the bulk of the loop over *iname*, followed by the slabs of its
+    initial and final iterations, if any are separated out according to
+    *slab_increments* (defaulting to
+    :attr:`loopy.LoopKernel.iname_slab_increments`, or, if those are zero
+    and :attr:`loopy.Options.peel_remainder_slabs` is set, to the result of
+    :func:`get_remainder_slab_increments`).
+    """
     iname_domain = kernel.get_inames_domain(iname)
 
     if iname_domain.is_empty():
@@ -58,7 +67,13 @@ def get_slab_decomposition(
 
     space = iname_domain.space
 
-    lower_incr, upper_incr = kernel.iname_slab_increments.get(iname, (0, 0))
+    if slab_increments is None:
+        slab_increments = kernel.iname_slab_increments.get(iname)
+    if (slab_increments in [None, (0, 0)]
+            and kernel.options.peel_remainder_slabs):
+        slab_increments = get_remainder_slab_increments(kernel, iname)
+
+    lower_incr, upper_incr = slab_increments or (0, 0)
     lower_bulk_bound = None
     upper_bulk_bound = None
 
@@ -132,6 +147,122 @@ def get_slab_decomposition(
     else:
         return [("bulk", (isl.BasicSet.universe(space)))]
 
+
+def _get_peelable_inner_inames(
+            kernel: LoopKernel,
+            iname: InameStr
+        ) -> set[InameStr]:
+    """Returns the inames of the innermost, unrolled and vectorized loops
+    nested inside the loops over *iname*.
+    """
+    assert kernel.linearization is not None
+
+    from loopy.kernel.data import UnrollTag, VectorizeTag
+    from loopy.schedule import EnterLoop, LeaveLoop, gather_schedule_block
+
+    result: set[InameStr] = set()
+
+    for sched_index, sched_item in enumerate(kernel.linearization):
+        if not (isinstance(sched_item, EnterLoop) and sched_item.iname == iname):
+            continue
+
+        block, _ = gather_schedule_block(kernel.linearization, sched_index)
+
+        last_entered_iname = None
+        for inner_sched_item in block[1:-1]:
+            if isinstance(inner_sched_item, EnterLoop):
+                last_entered_iname = inner_sched_item.iname
+                if kernel.iname_tags_of_type(
+                        inner_sched_item.iname, (UnrollTag, VectorizeTag)):
+                    result.add(inner_sched_item.iname)
+            elif isinstance(inner_sched_item, LeaveLoop):
+                if inner_sched_item.iname == last_entered_iname:
+                    result.add(inner_sched_item.iname)
+                last_entered_iname = None
+
+    return result
+
+
+def _get_partial_outer_iterations(
+            kernel: LoopKernel,
+            outer_iname: InameStr,
+            inner_iname: InameStr
+        ) -> isl.Set | None:
+    """Returns the set of values of *outer_iname* for which *inner_iname*
+    does not take on all the values of its constant-length range, or *None*
+    if *inner_iname* does not have such a range.
+    """
+    from loopy.diagnostic import StaticValueFindingError
+    from loopy.isl_helpers import make_slab, static_value_of_pw_aff
+    from loopy.symbolic import aff_to_expr
+
+    try:
+        length = kernel.get_constant_iname_length(inner_iname)
+        lower_bound = int(aff_to_expr(static_value_of_pw_aff(
+                kernel.get_iname_bounds(inner_iname, constants_only=True)
+                .lower_bound_pw_aff.coalesce(),
+                constants_only=True)))
+    except (StaticValueFindingError, isl.Error):
+        return None
+
+    domain = (
+            kernel.get_inames_domain(frozenset({outer_iname, inner_iname}))
+            .project_out_except([outer_iname, inner_iname], [dim_type.set]))
+
+    assumptions = isl.BasicSet.from_params(kernel.assumptions)
+    domain, assumptions = isl.align_two(domain, assumptions)
+    domain = domain & assumptions
+
+    _, inner_idx = domain.get_var_dict()[inner_iname]
+    full_range = (
+            domain.eliminate(dim_type.set, inner_idx, 1)
+            & make_slab(domain.space, inner_iname,
+                        lower_bound, lower_bound + length))
+
+    return ((full_range - domain)
+            .project_out_except([outer_iname], [dim_type.set]))
+
+
+def get_remainder_slab_increments(
+            kernel: LoopKernel,
+            iname: InameStr
+        ) -> tuple[int, int]:
+    """Returns the number of initial and final iterations of the sequential
+    loop over *iname* that need to be separated out so that the innermost,
+    unrolled and vectorized loops nested in the remaining bulk run over
+    their full, constant-length range, as is the case after splitting an
+    iname by a length that does not divide its trip count. Returns
+    ``(0, 0)`` if no such separation is needed or possible.
+    """
+    from loopy.kernel.data import HardwareConcurrentTag
+    if kernel.iname_tags_of_type(iname, HardwareConcurrentTag):
+        return (0, 0)
+
+    partial_iterations = [
+            partial
+            for inner_iname in sorted(_get_peelable_inner_inames(kernel, iname))
+            if inner_iname != iname
+            for partial in [
+                _get_partial_outer_iterations(kernel, iname, inner_iname)]
+            if partial is not None and not partial.is_empty()]
+
+    if not partial_iterations:
+        return (0, 0)
+
+    for slab_increments in [(0, 1), (1, 0), (1, 1)]:
+        try:
+            (_, bulk_slab), *_ = get_slab_decomposition(
+                    kernel, iname, slab_increments)
+        except NotImplementedError:
+            return (0, 0)
+
+        bulk_slab = bulk_slab.project_out_except([iname], [dim_type.set])
+        if all((partial & isl.align_spaces(bulk_slab, partial)).is_empty()
+               for partial in partial_iterations):
+            return slab_increments
+
+    return (0, 0)
+
 # }}}
 
 
@@ -367,6 +498,108 @@ def set_up_hw_parallel_loops(
 # }}}
 
 
+# {{{ index strength reduction
+
+def get_strength_reducible_subscripts(
+            codegen_state: CodeGenerationState,
+            sched_index: int
+        ) -> dict[Expression, Expression]:
+    """Returns a mapping from the flattened subscripts of the array accesses
+    in the loop entered at *sched_index* to their coefficients of the loop's
+    iname, for those subscripts that are worth computing incrementally
+    (cf. :attr:`loopy.Options.strength_reduce_indices`). Only innermost loops
+    are considered.
+    """
+    kernel = codegen_state.kernel
+    assert kernel.linearization is not None
+
+    from loopy.schedule import EnterLoop, RunInstruction, gather_schedule_block
+    loop_iname = cast("EnterLoop", kernel.linearization[sched_index]).iname
+    block, _ = gather_schedule_block(kernel.linearization, sched_index)
+
+    if any(isinstance(sched_item, EnterLoop) for sched_item in block[1:]):
+        return {}
+
+    from pymbolic import evaluate, var
+    from pymbolic.primitives import is_constant
+
+    from loopy.diagnostic import ExpressionNotAffineError
+    from loopy.kernel.array import get_access_info
+    from loopy.kernel.data import (
+        ArrayArg,
+        Assignment,
+        ConstantArg,
+        TemporaryVariable,
+        ValueArg,
+    )
+    from loopy.symbolic import (
+        ArrayAccessFinder,
+        CoefficientCollector,
+        get_dependencies,
+        simplify_using_aff,
+    )
+
+    # the values of these do not change within the loop
+    invariant_names = (
+            (kernel.all_inames() | kernel.all_params()
+                | {arg.name for arg in kernel.args if isinstance(arg, ValueArg)})
+            - {loop_iname}
+            - set(kernel.writer_map()))
+
+    result: dict[Expression, Expression] = {}
+
+    for sched_item in block:
+        if not isinstance(sched_item, RunInstruction):
+            continue
+
+        insn = kernel.id_to_insn[sched_item.insn_id]
+        if not isinstance(insn, Assignment):
+            continue
+
+        # sorted to keep the generated code independent of hash randomization
+        access_finder = ArrayAccessFinder()
+        for access in sorted(
+                access_finder(insn.assignee) | access_finder(insn.expression),
+                key=str):
+            ary = kernel.get_var_descriptor(access.aggregate.name)
+            if not isinstance(ary, (ArrayArg, TemporaryVariable, ConstantArg)):
+                continue
+
+            # mirrors the flattening in ExpressionToCExpressionMapper
+            index_tuple = tuple(
+                    simplify_using_aff(kernel, idx) for idx in access.index_tuple)
+            access_info = get_access_info(kernel, ary, index_tuple,
+                    lambda expr: evaluate(expr, codegen_state.var_subst_map),
+                    codegen_state.vectorization_info)
+
+            if (len(access_info.subscripts) != 1
+                    or access_info.vector_index is not None):
+                continue
+
+            subscript, = access_info.subscripts
+            if not get_dependencies(subscript) <= invariant_names | {loop_iname}:
+                continue
+
+            try:
+                coeffs = CoefficientCollector([loop_iname])(subscript)
+            except (ExpressionNotAffineError, RuntimeError):
+                continue
+
+            coeff = coeffs.pop(var(loop_iname), 0)
+            if coeff == 0:
+                continue
+
+            # leave plain indices like 'i + 1' to the compiler
+            if is_constant(coeff) and all(is_constant(c) for c in coeffs.values()):
+                continue
+
+            result[subscript] = coeff
+
+    return result
+
+# }}}
+
+
 # {{{ sequential loop
 
 def generate_sequential_loop_dim_code(
@@ -444,7 +677,11 @@ def generate_sequential_loop_dim_code(
 
         # {{{ find implemented loop, build inner code
 
-        from loopy.symbolic import pw_aff_to_pw_aff_implemented_by_expr
+        from loopy.isl_helpers import simplify_pw_aff
+        from loopy.symbolic import (
+            pw_aff_to_expr,
+            pw_aff_to_pw_aff_implemented_by_expr,
+        )
         impl_lbound = pw_aff_to_pw_aff_implemented_by_expr(lbound)
         impl_ubound = pw_aff_to_pw_aff_implemented_by_expr(ubound)
 
@@ -469,6 +706,40 @@ def generate_sequential_loop_dim_code(
                 .copy(kernel=intersect_kernel_with_slab(
                     kernel, slab, loop_iname)))
 
+        # OpenMP requires parallel loops to be in canonical form, i.e. to
+        # only advance the loop variable
+        from loopy.kernel.data import OpenMPParallelTag
+        induction_variables = []
+        if (kernel.options.strength_reduce_indices
+                and codegen_state.ast_builder.can_implement_induction_variables
+                and not kernel.iname_tags_of_type(loop_iname, OpenMPParallelTag)
+                and not impl_ubound.is_equal(impl_lbound)):
+            from pymbolic import substitute
+
+            from loopy.type_inference import TypeReader
+
+            # subscripts involving e.g. 64-bit strides may be wider than
+            # the iname, so that each offset needs its own type
+            type_reader = TypeReader(kernel, codegen_state.callables_table)
+
+            loop_lbound = pw_aff_to_expr(
+                    simplify_pw_aff(lbound, kernel.assumptions))
+            strength_reduced_subscripts = {}
+            for subscript, coeff in get_strength_reducible_subscripts(
+                    new_codegen_state, sched_index).items():
+                name = codegen_state.var_name_generator(f"{loop_iname}_offset")
+                induction_variables.append((
+                    name,
+                    type_reader(subscript),
+                    flatten(substitute(subscript, {loop_iname: loop_lbound})),
+                    coeff))
+                strength_reduced_subscripts[subscript] = name
+
+            new_codegen_state = new_codegen_state.copy(
+                    strength_reduced_subscripts=(
+                        new_codegen_state.strength_reduced_subscripts
+                        .update(strength_reduced_subscripts)))
+
         inner = build_loop_nest(new_codegen_state, sched_index+1)
 
         # }}}
@@ -478,8 +749,6 @@ def generate_sequential_loop_dim_code(
 
         astb = codegen_state.ast_builder
 
-        from loopy.symbolic import pw_aff_to_expr
-
         if impl_ubound.is_equal(impl_lbound):
             # single-trip, generate just a variable assignment, not a loop
             inner = merge_codegen_results(codegen_state, [
@@ -500,7 +769,9 @@ def generate_sequential_loop_dim_code(
         else:
             inner_ast = inner.current_ast(codegen_state)
 
-            from loopy.isl_helpers import simplify_pw_aff
+            loop_kwargs = {}
+            if induction_variables:
+                loop_kwargs["induction_variables"] = induction_variables
 
             result.append(
                 inner.with_new_ast(
@@ -509,7 +780,7 @@ def generate_sequential_loop_dim_code(
                         codegen_state, loop_iname, kernel.index_dtype,
                         pw_aff_to_expr(simplify_pw_aff(lbound, kernel.assumptions)),
                         pw_aff_to_expr(simplify_pw_aff(ubound, kernel.assumptions)),
-                        inner_ast, hints)))
+                        inner_ast, hints, **loop_kwargs)))
 
     return merge_codegen_results(codegen_state, result)
 
@@ -24,12 +24,16 @@ THE SOFTWARE.
 """
 
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import TYPE_CHECKING
 
 from pytools import MovedFunctionDeprecationWrapper
 
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
+
     from loopy.kernel import LoopKernel
 
 
@@ -76,9 +80,36 @@ def warn_with_kernel(
     text += (" (add '%s' to silenced_warnings kernel attribute to disable)"
             % id)
 
+    message = f"in kernel {kernel.name}: {text}"
+
+    recorded_warnings = _recorded_kernel_warnings.get()
+    if recorded_warnings is not None:
+        recorded_warnings.append((message, type))
+
     stacklevel = 2 if stacklevel is None else stacklevel + 1
     from warnings import warn
-    warn(f"in kernel {kernel.name}: {text}", type, stacklevel=stacklevel)
+    warn(message, type, stacklevel=stacklevel)
+
+
+_recorded_kernel_warnings: ContextVar[
+        list[tuple[str, type[LoopyWarning]]] | None] = ContextVar(
+            "_recorded_kernel_warnings", default=None)
+
+
+@contextmanager
+def record_kernel_warnings(
+        ) -> Generator[list[tuple[str, type[LoopyWarning]]], None, None]:
+    """Returns a context manager providing a list to which the message and
+    category of each warning issued via :func:`warn_with_kernel` in the
+    current context are appended. Unlike :func:`warnings.catch_warnings`,
+    this leaves the global warning filters untouched and is thread-safe.
+    """
+    recorded_warnings: list[tuple[str, type[LoopyWarning]]] = []
+    token = _recorded_kernel_warnings.set(recorded_warnings)
+    try:
+        yield recorded_warnings
+    finally:
+        _recorded_kernel_warnings.reset(token)
 
 
 warn = MovedFunctionDeprecationWrapper(warn_with_kernel)
@@ -24,6 +24,7 @@ THE SOFTWARE.
 """
 
 import logging
+import re
 
 
 logger = logging.getLogger(__name__)
@@ -31,6 +32,8 @@ logger = logging.getLogger(__name__)
 from pytools import ProcessLogger
 
 from loopy.diagnostic import LoopyError
+from loopy.tools import memoize_on_disk
+from loopy.translation_unit import for_each_kernel
 
 
 def c_preprocess(source, defines=None, filename=None, include_paths=None):
@@ -305,9 +308,12 @@ def parse_fortran(source, filename="<floopy code>", free_form=None, strict=None,
         seq_dependencies=None, auto_dependencies=None, target=None):
     """
     :returns: a :class:`loopy.TranslationUnit`
-    """
 
-    parse_plog = ProcessLogger(logger, "parsing fortran file '%s'" % filename)
+    The result is memoized on disk, keyed on *source* and the remaining
+    arguments. On a cache miss, *source* is split into its subroutines, each
+    of which is translated separately, so that translations of unchanged
+    subroutines are reused from the cache.
+    """
 
     if seq_dependencies is not None and auto_dependencies is not None:
         raise TypeError(
@@ -325,13 +331,57 @@ def parse_fortran(source, filename="<floopy code>", free_form=None, strict=None,
     if strict is None:
         strict = True
 
-    import logging
-    console = logging.StreamHandler()
-    console.setLevel(logging.INFO)
-    formatter = logging.Formatter("%(name)-12s: %(levelname)-8s %(message)s")
-    console.setFormatter(formatter)
-    logging.getLogger("fparser").addHandler(console)
+    return _parse_fortran(source, filename, free_form, strict,
+                          seq_dependencies, target)
+
+
+# {{{ incremental translation
+
+_END_SUBROUTINE_RE = re.compile(r"^\s*end\s*subroutine\b", re.IGNORECASE)
+_LOOPY_TAG_RE = re.compile(r"^\s*!\s*\$loopy\s+(begin|end)\s+tagged:")
+
+
+def _split_into_program_units(source):
+    """Splits the Fortran *source* after each ``end subroutine`` statement, so
+    that the pieces may be translated independently. A split never occurs
+    within a region of ``$loopy begin tagged`` directives. Text following the
+    last split is attached to the last piece.
+    """
+    units = []
+    unit_lines = []
+    ntags_open = 0
+
+    for line in source.split("\n"):
+        unit_lines.append(line)
+
+        tag_match = _LOOPY_TAG_RE.match(line)
+        if tag_match is not None:
+            ntags_open += 1 if tag_match.group(1) == "begin" else -1
+
+        if ntags_open == 0 and _END_SUBROUTINE_RE.match(line):
+            units.append("\n".join(unit_lines))
+            unit_lines = []
+
+    trailing = "\n".join(unit_lines)
+    if not units:
+        units.append(trailing)
+    elif trailing.strip():
+        units[-1] = units[-1] + "\n" + trailing
 
+    return units
+
+
+@memoize_on_disk
+def _translate_fortran_program_units(source, filename, free_form, strict,
+        seq_dependencies, target, known_subprograms):
+    """
+    :arg known_subprograms: a tuple of
+        :class:`~loopy.frontend.fortran.translator.SubprogramInterface` for
+        the subroutines preceding *source*, which may be called from it.
+    :returns: a tuple of the translation units for the subroutines in
+        *source*, the index type used by their loops (or *None* if they
+        contain no loops), and the interfaces of the subroutines.
+    """
     from fparser import api
     tree = api.parse(source, isfree=free_form, isstrict=strict,
             analyze=False, ignore_comments=False)
@@ -341,10 +391,62 @@ def parse_fortran(source, filename="<floopy code>", free_form=None, strict=None,
                 "and returned invalid data (Sorry!)")
 
     from loopy.frontend.fortran.translator import F2LoopyTranslator
-    f2loopy = F2LoopyTranslator(filename, target=target)
+    f2loopy = F2LoopyTranslator(filename, target=target,
+                                known_subprograms=known_subprograms)
     f2loopy(tree)
 
-    kernels = f2loopy.make_kernels(seq_dependencies=seq_dependencies)
+    return (tuple(f2loopy.make_kernels(seq_dependencies=seq_dependencies)),
+            f2loopy.index_dtype,
+            f2loopy.get_subprogram_interfaces())
+
+
+@for_each_kernel
+def _set_index_dtype(kernel, index_dtype):
+    from loopy.types import to_loopy_type
+    return kernel.copy(index_dtype=to_loopy_type(index_dtype))
+
+
+@memoize_on_disk
+def _parse_fortran(source, filename, free_form, strict, seq_dependencies,
+        target):
+    parse_plog = ProcessLogger(logger, "parsing fortran file '%s'" % filename)
+
+    import logging
+    console = logging.StreamHandler()
+    console.setLevel(logging.INFO)
+    formatter = logging.Formatter("%(name)-12s: %(levelname)-8s %(message)s")
+    console.setFormatter(formatter)
+    logging.getLogger("fparser").addHandler(console)
+
+    # Calls are translated based on the interfaces of the callees, so that a
+    # unit only needs to be re-translated if its source or the interfaces of
+    # the subroutines preceding it change.
+    translated_units = []
+    known_subprograms = ()
+    for unit_source in _split_into_program_units(source):
+        unit_kernels, index_dtype, interfaces = (
+                _translate_fortran_program_units(unit_source, filename,
+                    free_form, strict, seq_dependencies, target,
+                    known_subprograms))
+        translated_units.append((unit_kernels, index_dtype))
+        known_subprograms = known_subprograms + interfaces
+
+    # All loops in a source file must share the same index type, as if the
+    # file was translated as a whole.
+    index_dtypes = {index_dtype for _, index_dtype in translated_units
+                    if index_dtype is not None}
+    if len(index_dtypes) > 1:
+        raise LoopyError("index types of loops in '%s' do not agree: %s"
+                % (filename, ", ".join(sorted(str(dt) for dt in index_dtypes))))
+
+    kernels = []
+    for unit_kernels, index_dtype in translated_units:
+        if index_dtype is None and index_dtypes:
+            common_index_dtype, = index_dtypes
+            unit_kernels = [_set_index_dtype(t_unit, common_index_dtype)
+                            for t_unit in unit_kernels]
+
+        kernels.extend(unit_kernels)
 
     from loopy.transform.callable import merge
     prog = merge(kernels)
@@ -365,5 +467,7 @@ def parse_fortran(source, filename="<floopy code>", free_form=None, strict=None,
 
     return prog
 
+# }}}
+
 
 # vim: foldmethod=marker
@@ -24,6 +24,7 @@ THE SOFTWARE.
 """
 
 import re
+from dataclasses import dataclass
 from sys import intern
 from typing import ClassVar
 from warnings import warn
@@ -257,6 +258,30 @@ class Scope:
                 | frozenset().union(*(frozenset(bset.get_var_names(dim_type.param))
                                       for bset in self.index_sets)))
 
+
+@dataclass(frozen=True)
+class SubprogramInterface:
+    """The names read and written by a subroutine translated earlier, as
+    required to translate calls to it (cf. :meth:`Scope.read_vars` and
+    :meth:`Scope.written_vars`).
+    """
+    subprogram_name: str
+    read_var_names: frozenset[str]
+    written_var_names: frozenset[str]
+
+    @staticmethod
+    def from_scope(scope):
+        return SubprogramInterface(
+                scope.subprogram_name,
+                frozenset(scope.read_vars()),
+                frozenset(scope.written_vars()))
+
+    def read_vars(self):
+        return self.read_var_names
+
+    def written_vars(self):
+        return self.written_var_names
+
 # }}}
 
 
@@ -342,10 +367,16 @@ def specialize_fortran_division(t_unit):
 # {{{ translator
 
 class F2LoopyTranslator(FTreeWalkerBase):
-    def __init__(self, filename, target=None):
+    def __init__(self, filename, target=None, known_subprograms=()):
+        """
+        :arg known_subprograms: a sequence of :class:`SubprogramInterface`
+            for the subroutines that may be called by the translated source
+            in addition to the ones defined in it.
+        """
         FTreeWalkerBase.__init__(self, filename)
 
         self.target = target
+        self.known_subprograms = tuple(known_subprograms)
 
         self.scope_stack = []
 
@@ -406,6 +437,11 @@ class F2LoopyTranslator(FTreeWalkerBase):
         scope = Scope(node.name, list(node.args))
         self.scope_stack.append(scope)
 
+        # Identifiers are numbered per subroutine, so that they do not depend
+        # on the other subroutines translated along with this one.
+        self.insn_id_counter = 0
+        self.condition_id_counter = 0
+
         self.block_nest.append("sub")
         for c in node.content:
             self.rec(c)
@@ -605,7 +641,7 @@ class F2LoopyTranslator(FTreeWalkerBase):
 
         # {{{ comply with loopy's kernel call requirements
 
-        callee, = (knl for knl in self.kernels
+        callee, = (knl for knl in [*self.known_subprograms, *self.kernels]
                    if knl.subprogram_name == node.designator)
         call_params = [scope.process_expression_for_loopy(self.parse_expr(node,
                                                                           item))
@@ -873,6 +909,9 @@ class F2LoopyTranslator(FTreeWalkerBase):
 
     # }}}
 
+    def get_subprogram_interfaces(self):
+        return tuple(SubprogramInterface.from_scope(sub) for sub in self.kernels)
+
     def make_kernels(self, seq_dependencies):
         result = []
 
@@ -0,0 +1,300 @@
+"""Attribution of :mod:`islpy` time to loopy call sites"""
+from __future__ import annotations
+
+
+__copyright__ = "Copyright (C) 2026 agent"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import os
+import sys
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+import islpy as isl
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+    from types import FrameType
+
+
+__doc__ = """
+Most of loopy's compile time is spent inside :mod:`islpy`. The tools in this
+module attribute that time to the loopy functions making the calls::
+
+    from loopy.isl_profiling import profile_isl_calls
+
+    with profile_isl_calls() as profile:
+        code = lp.generate_code_v2(t_unit)
+
+    print(profile.report())
+
+.. autofunction:: profile_isl_calls
+
+.. autoclass:: IslCallStats
+
+.. autoclass:: IslProfile
+"""
+
+
+# {{{ data structures
+
+@dataclass
+class IslCallStats:
+    """Aggregate statistics over a set of :mod:`islpy` calls.
+
+    .. attribute:: ncalls
+    .. attribute:: time
+
+        The wall time (in seconds) spent in the calls.
+
+    .. attribute:: nbasic_sets
+
+        The total number of basic sets (or basic maps, or pieces of
+        piecewise objects) in the arguments of the calls.
+
+    .. attribute:: nconstraints
+
+        The total number of constraints of the basic sets (or basic maps) in
+        the arguments of the calls.
+    """
+    ncalls: int = 0
+    time: float = 0
+    nbasic_sets: int = 0
+    nconstraints: int = 0
+
+    def add(self, other: IslCallStats) -> None:
+        self.ncalls += other.ncalls
+        self.time += other.time
+        self.nbasic_sets += other.nbasic_sets
+        self.nconstraints += other.nconstraints
+
+
+@dataclass
+class IslProfile:
+    """The result of :func:`profile_isl_calls`.
+
+    .. attribute:: stats
+
+        A mapping from ``(entrypoint, caller, isl_method)`` to
+        :class:`IslCallStats`. *caller* is the innermost loopy function
+        making the :mod:`islpy` call, *entrypoint* is the outermost loopy
+        function on the stack at the time of the call (such as a
+        transformation or :func:`loopy.generate_code_v2`), and *isl_method*
+        is the qualified name of the :mod:`islpy` method being called.
+
+    .. automethod:: by_entrypoint
+    .. automethod:: by_caller
+    .. automethod:: by_isl_method
+    .. automethod:: report
+    """
+    stats: dict[tuple[str, str, str], IslCallStats] = field(
+        default_factory=lambda: defaultdict(IslCallStats))
+
+    def _aggregate(self, key_index: int) -> dict[str, IslCallStats]:
+        result: dict[str, IslCallStats] = defaultdict(IslCallStats)
+        for key, stats in self.stats.items():
+            result[key[key_index]].add(stats)
+
+        return dict(result)
+
+    def by_entrypoint(self) -> dict[str, IslCallStats]:
+        return self._aggregate(0)
+
+    def by_caller(self) -> dict[str, IslCallStats]:
+        return self._aggregate(1)
+
+    def by_isl_method(self) -> dict[str, IslCallStats]:
+        return self._aggregate(2)
+
+    def report(self, max_rows: int = 20) -> str:
+        """Returns a human-readable summary of the *max_rows* most expensive
+        entrypoints, callers and :mod:`islpy` methods.
+        """
+        from pytools import Table
+
+        sections = []
+        for title, aggregate in [
+                ("entrypoint", self.by_entrypoint()),
+                ("caller", self.by_caller()),
+                ("isl method", self.by_isl_method()),
+                ]:
+            table = Table(alignments=("l", "r"))
+            table.add_row((title, "time [s]", "calls", "basic sets",
+                           "constraints"))
+            for name, stats in sorted(aggregate.items(),
+                                      key=lambda item: item[1].time,
+                                      reverse=True)[:max_rows]:
+                table.add_row((name, f"{stats.time:.4f}", stats.ncalls,
+                               stats.nbasic_sets, stats.nconstraints))
+
+            sections.append(str(table))
+
+        return "\n\n".join(sections)
+
+# }}}
+
+
+# {{{ instrumentation
+
+PROFILED_ISL_CLASSES = (
+        "BasicSet", "Set", "BasicMap", "Map", "UnionSet", "UnionMap",
+        "Aff", "PwAff", "MultiAff", "PwMultiAff",
+        "QPolynomial", "PwQPolynomial", "UnionPwQPolynomial")
+
+_PROFILED_OPERATORS = frozenset({
+        "__and__", "__or__", "__sub__", "__add__", "__mul__", "__neg__",
+        "__le__", "__lt__", "__ge__", "__gt__"})
+
+_LOOPY_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _get_isl_object_size(obj: object) -> tuple[int, int]:
+    if isinstance(obj, (isl.BasicSet, isl.BasicMap)):
+        return 1, obj.n_constraint()
+    elif isinstance(obj, isl.Set):
+        bsets = obj.get_basic_sets()
+        return len(bsets), sum(bset.n_constraint() for bset in bsets)
+    elif isinstance(obj, isl.Map):
+        bmaps = obj.get_basic_maps()
+        return len(bmaps), sum(bmap.n_constraint() for bmap in bmaps)
+    elif isinstance(obj, (isl.PwAff, isl.PwQPolynomial)):
+        return obj.n_piece(), 0
+    else:
+        return 0, 0
+
+
+def _get_loopy_call_sites(frame: FrameType | None) -> tuple[str, str]:
+    """Returns the names of the outermost and innermost loopy functions on
+    the stack starting at *frame*. Function-local wrappers (such as those
+    created by :func:`loopy.for_each_kernel`) are not considered as outermost
+    functions, so that transformations are reported by their own name.
+    """
+    innermost = outermost = None
+
+    while frame is not None:
+        code = frame.f_code
+        if (code.co_filename.startswith(_LOOPY_DIR)
+                and code.co_filename != __file__):
+            qualname = getattr(code, "co_qualname", code.co_name)
+            name = "{}.{}".format(frame.f_globals.get("__name__", "?"), qualname)
+            if innermost is None:
+                innermost = name
+            if outermost is None or "<locals>" not in qualname:
+                outermost = name
+
+        frame = frame.f_back
+
+    return outermost or "<outside loopy>", innermost or "<outside loopy>"
+
+
+class _IslProfiler:
+    def __init__(self, profile: IslProfile) -> None:
+        self.profile = profile
+        self.local = threading.local()
+
+    def wrap(self, isl_method_name: str, func: Callable[..., Any]
+             ) -> Callable[..., Any]:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            depth = getattr(self.local, "depth", 0)
+            if depth:
+                # only account for the outermost isl call, nested calls
+                # are part of its cost
+                return func(*args, **kwargs)
+
+            self.local.depth = 1
+            try:
+                start = perf_counter()
+                result = func(*args, **kwargs)
+                elapsed = perf_counter() - start
+
+                stats = IslCallStats(ncalls=1, time=elapsed)
+                for arg in args:
+                    nbasic_sets, nconstraints = _get_isl_object_size(arg)
+                    stats.nbasic_sets += nbasic_sets
+                    stats.nconstraints += nconstraints
+
+                entrypoint, caller = _get_loopy_call_sites(sys._getframe(1))
+                self.profile.stats[entrypoint, caller, isl_method_name].add(
+                        stats)
+            finally:
+                self.local.depth = 0
+
+            return result
+
+        return wrapper
+
+
+@contextmanager
+def profile_isl_calls(
+            class_names: tuple[str, ...] = PROFILED_ISL_CLASSES
+        ) -> Generator[IslProfile, None, None]:
+    """A context manager that instruments the methods of the :mod:`islpy`
+    classes named in *class_names* for the duration of the ``with`` block.
+    Yields an :class:`IslProfile` that is populated as :mod:`islpy` calls are
+    made.
+
+    Only the outermost :mod:`islpy` call in a nest of calls is accounted for.
+    The instrumentation itself adds considerable overhead, so the absolute
+    times reported are only indicative of relative cost.
+    """
+    profile = IslProfile()
+    profiler = _IslProfiler(profile)
+
+    originals: list[tuple[type, str, object]] = []
+    try:
+        for class_name in class_names:
+            cls = getattr(isl, class_name)
+            for name, attr in list(vars(cls).items()):
+                if name.startswith("_") and name not in _PROFILED_OPERATORS:
+                    continue
+
+                isl_method_name = f"{class_name}.{name}"
+                if isinstance(attr, (staticmethod, classmethod)):
+                    wrapped = type(attr)(
+                        profiler.wrap(isl_method_name, attr.__func__))
+                elif isinstance(attr, type) or not callable(attr):
+                    continue
+                elif hasattr(type(attr), "__get__"):
+                    wrapped = profiler.wrap(isl_method_name, attr)
+                else:
+                    # non-binding callables (e.g. static methods of
+                    # extension types)
+                    wrapped = staticmethod(profiler.wrap(isl_method_name, attr))
+
+                originals.append((cls, name, attr))
+                setattr(cls, name, wrapped)
+
+        yield profile
+    finally:
+        for cls, name, attr in originals:
+            setattr(cls, name, attr)
+
+# }}}
+
+# vim: foldmethod=marker
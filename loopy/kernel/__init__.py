@@ -71,7 +71,7 @@ from loopy.kernel.data import (
     _ArraySeparationInfo,
     filter_iname_tags_by_type,
 )
-from loopy.tools import update_persistent_hash
+from loopy.tools import memoize_nullary_method, update_persistent_hash
 from loopy.types import LoopyType, NumpyType
 from loopy.typing import InsnId, PreambleGenerator, SymbolMangler, not_none
 
@@ -91,6 +91,7 @@ if TYPE_CHECKING:
     from loopy.kernel.function_interface import InKernelCallable
     from loopy.kernel.instruction import InstructionBase
     from loopy.kernel.tools import SetOperationCacheManager
+    from loopy.match import InstructionMatchIndex
     from loopy.options import Options
     from loopy.schedule import ScheduleItem
     from loopy.target import ASTBuilderBase, ASTType, TargetBase
@@ -114,6 +115,62 @@ def _get_inames_from_domains(
             frozenset(dom.get_var_names_not_none(dim_type.set)) for dom in domains)
 
 
+# {{{ caches carried over to copies
+
+# Maps the names of attributes in which :class:`LoopKernel` caches derived
+# information to the fields that information is computed from.
+# :meth:`LoopKernel.copy` carries these caches over if none of the fields
+# changes. Methods decorated with :func:`_memoize_carried_over` add their
+# entries.
+_CACHED_ATTRIBUTE_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+        "id_to_insn": ("instructions",),
+        "arg_dict": ("args",),
+        "_cached_written_variables": ("instructions",),
+        "_cached_instruction_match_index": ("instructions",),
+        }
+
+
+def _memoize_carried_over(*dependencies: str):
+    """Memoizes a method of :class:`LoopKernel` such that
+    :meth:`LoopKernel.copy` carries its results over to copies in which none
+    of the fields named in *dependencies* changes.
+
+    Methods without arguments are memoized using
+    :func:`loopy.tools.memoize_nullary_method`. The results of other methods
+    are stored in a :class:`dict` keyed by their arguments, which is shared
+    with the copies. Results must therefore be immutable.
+    """
+    def decorator(method):
+        from inspect import signature
+        if len(signature(method).parameters) == 1:
+            wrapper = memoize_nullary_method(method)
+            attr_name = wrapper.attr_name
+        else:
+            attr_name = intern(f"_memoized_{method.__name__}")
+
+            def wrapper(self, *args):
+                try:
+                    cache = self.__dict__[attr_name]
+                except KeyError:
+                    cache = self.__dict__[attr_name] = {}
+
+                try:
+                    return cache[args]
+                except KeyError:
+                    result = cache[args] = method(self, *args)
+                    return result
+
+            from functools import update_wrapper
+            update_wrapper(wrapper, method)
+
+        _CACHED_ATTRIBUTE_DEPENDENCIES[attr_name] = dependencies
+        return wrapper
+
+    return decorator
+
+# }}}
+
+
 @dataclass(frozen=True)
 class _BoundsRecord:
     lower_bound_pw_aff: islpy.PwAff
@@ -250,18 +307,17 @@ class LoopKernel(Taggable):
 
     # {{{ name wrangling
 
-    @memoize_method
+    @_memoize_carried_over("args", "temporary_variables")
     def non_iname_variable_names(self):
-        return (set(self.arg_dict.keys())
-                | set(self.temporary_variables.keys()))
+        return frozenset(self.arg_dict) | frozenset(self.temporary_variables)
 
-    @memoize_method
+    @_memoize_carried_over("args", "temporary_variables", "substitutions", "inames")
     def all_variable_names(self):
         return (
-                set(self.temporary_variables.keys())
-                | set(self.substitutions.keys())
+                frozenset(self.temporary_variables)
+                | frozenset(self.substitutions)
                 | {arg.name for arg in self.args}
-                | set(self.all_inames()))
+                | self.all_inames())
 
     def get_var_name_generator(self) -> UniqueNameGenerator:
         return UniqueNameGenerator(self.all_variable_names())
@@ -325,13 +381,30 @@ class LoopKernel(Taggable):
 
     @cached_property
     def id_to_insn(self):
-        return {insn.id: insn for insn in self.instructions}
+        return constantdict({insn.id: insn for insn in self.instructions})
+
+    def get_instruction_match_index(self) -> InstructionMatchIndex:
+        """Return a :class:`loopy.match.InstructionMatchIndex` of the
+        instructions of *self*. It is carried over to copies of *self* whose
+        instructions are unchanged.
+        """
+        try:
+            return self._cached_instruction_match_index
+        except AttributeError:
+            pass
+
+        from loopy.match import InstructionMatchIndex
+        result = InstructionMatchIndex(self.instructions)
+
+        object.__setattr__(self, "_cached_instruction_match_index", result)
+
+        return result
 
     # }}}
 
     # {{{ domain wrangling
 
-    @memoize_method
+    @_memoize_carried_over("domains")
     def parents_per_domain(self) -> Sequence[int | None]:
         """Return a list corresponding to self.domains (by index)
         containing domain indices which are nested around this
@@ -387,9 +460,9 @@ class LoopKernel(Taggable):
             parent_inames = iname_set_stack[-1] if iname_set_stack else set()
             iname_set_stack.append(parent_inames | inames)
 
-        return result
+        return tuple(result)
 
-    @memoize_method
+    @_memoize_carried_over("domains")
     def all_parents_per_domain(self) -> Sequence[Sequence[int]]:
         """Return a list corresponding to self.domains (by index)
         containing domain indices which are nested around this
@@ -408,16 +481,16 @@ class LoopKernel(Taggable):
                 dom_result.insert(0, parent)
                 parent = ppd[parent]
 
-            result.append(dom_result)
+            result.append(tuple(dom_result))
 
-        return result
+        return tuple(result)
 
-    @memoize_method
+    @_memoize_carried_over("domains")
     def _get_home_domain_map(self) -> Mapping[str, int]:
-        return {
+        return constantdict({
                 iname: i_domain
                 for i_domain, dom in enumerate(self.domains)
-                for iname in dom.get_var_names_not_none(dim_type.set)}
+                for iname in dom.get_var_names_not_none(dim_type.set)})
 
     def get_home_domain_index(self, iname: str) -> int:
         return self._get_home_domain_map()[iname]
@@ -429,7 +502,7 @@ class LoopKernel(Taggable):
 
         raise AssertionError()
 
-    @memoize_method
+    @_memoize_carried_over("domains")
     def combine_domains(self, domains: Sequence[int]) -> isl.BasicSet:
         """
         :arg domains: domain indices of domains to be combined. More 'dominant'
@@ -482,7 +555,7 @@ class LoopKernel(Taggable):
 
         return self._get_inames_domain_backend(inames)
 
-    @memoize_method
+    @_memoize_carried_over("domains")
     def get_leaf_domain_indices(self, inames: Collection[str]) -> list[int]:
         """Find the leaves of the domain tree needed to cover all inames.
 
@@ -527,9 +600,9 @@ class LoopKernel(Taggable):
             root_to_leaf[current_root] = home_domain_index
             domain_indices.update(domain_path_to_root)
 
-        return list(root_to_leaf.values())
+        return tuple(root_to_leaf.values())
 
-    @memoize_method
+    @_memoize_carried_over("domains")
     def _get_inames_domain_backend(self, inames: Collection[InameStr]):
         domain_indices: set[int] = set()
         for leaf_dom_idx in self.get_leaf_domain_indices(inames):
@@ -564,14 +637,14 @@ class LoopKernel(Taggable):
                 self.iname_tags(iname),
                 tag_type_or_types, max_num=max_num, min_num=min_num)
 
-    @memoize_method
+    @_memoize_carried_over("inames")
     def all_inames(self):
         """
         Returns a :class:`frozenset` of the names of all the inames in the kernel.
         """
         return frozenset(self.inames.keys())
 
-    @memoize_method
+    @_memoize_carried_over("domains", "inames")
     def all_params(self) -> frozenset[str]:
         all_inames = self.all_inames()
 
@@ -586,29 +659,26 @@ class LoopKernel(Taggable):
         from loopy.kernel.tools import get_outer_params
         return get_outer_params(self.domains)
 
-    @memoize_method
+    @_memoize_carried_over("instructions")
     def all_insn_inames(self):
         """Return a mapping from instruction ids to inames inside which
         they should be run.
         """
-        return {
+        return constantdict({
             insn.id: insn.within_inames
             for insn in self.instructions
-        }
+        })
 
-    @memoize_method
+    @_memoize_carried_over("instructions")
     def all_referenced_inames(self):
-        result = set()
-        for inames in self.all_insn_inames().values():
-            result.update(inames)
-        return result
+        return fset_union(self.all_insn_inames().values())
 
     def insn_inames(self, insn: str | InstructionBase) -> frozenset[InameStr]:
         if isinstance(insn, str):
             insn = self.id_to_insn[insn]
         return insn.within_inames
 
-    @memoize_method
+    @_memoize_carried_over("instructions", "inames")
     def iname_to_insns(self) -> Mapping[InameStr, Set[InsnId]]:
         result: dict[InameStr, set[InsnId]] = {
                 iname: set() for iname in self.all_inames()}
@@ -616,7 +686,8 @@ class LoopKernel(Taggable):
             for iname in insn.within_inames:
                 result[iname].add(insn.id)
 
-        return result
+        return constantdict({
+                iname: frozenset(insn_ids) for iname, insn_ids in result.items()})
 
     @memoize_method
     def _remove_inames_for_shared_hw_axes(self, cond_inames: Set[InameStr]):
@@ -655,7 +726,7 @@ class LoopKernel(Taggable):
 
     # {{{ dependency wrangling
 
-    @memoize_method
+    @_memoize_carried_over("instructions")
     def recursive_insn_dep_map(self):
         """Returns a :class:`dict` mapping an instruction IDs *a*
         to all instruction IDs it directly or indirectly depends
@@ -682,13 +753,13 @@ class LoopKernel(Taggable):
         for insn in self.instructions:
             compute_deps(insn.id)
 
-        return result
+        return constantdict(result)
 
     # }}}
 
     # {{{ read and written variables
 
-    @memoize_method
+    @_memoize_carried_over("instructions", "args", "temporary_variables")
     def reader_map(self) -> Mapping[str, Set[InsnId]]:
         """
         :return: a dict that maps variable names to ids of insns that read that
@@ -704,9 +775,11 @@ class LoopKernel(Taggable):
             for var_name in insn.read_dependency_names() & admissible_vars:
                 result.setdefault(var_name, set()).add(insn.id)
 
-        return result
+        return constantdict({
+                var_name: frozenset(insn_ids)
+                for var_name, insn_ids in result.items()})
 
-    @memoize_method
+    @_memoize_carried_over("instructions")
     def writer_map(self) -> Mapping[str, Set[InsnId]]:
         """
         :return: a dict that maps variable names to ids of insns that write
@@ -718,9 +791,11 @@ class LoopKernel(Taggable):
             for var_name in insn.assignee_var_names():
                 result.setdefault(var_name, set()).add(insn.id)
 
-        return result
+        return constantdict({
+                var_name: frozenset(insn_ids)
+                for var_name, insn_ids in result.items()})
 
-    @memoize_method
+    @_memoize_carried_over("instructions", "domains")
     def get_read_variables(self) -> Set[str]:
         return fset_union(
             insn.read_dependency_names()
@@ -736,10 +811,10 @@ class LoopKernel(Taggable):
         except AttributeError:
             pass
 
-        result = {
+        result = frozenset(
                 var_name
                 for insn in self.instructions
-                for var_name in insn.assignee_var_names()}
+                for var_name in insn.assignee_var_names())
 
         object.__setattr__(self, "_cached_written_variables", result)
 
@@ -769,7 +844,7 @@ class LoopKernel(Taggable):
 
     @cached_property
     def arg_dict(self) -> Mapping[str, KernelArgument]:
-        return {arg.name: arg for arg in self.args}
+        return constantdict({arg.name: arg for arg in self.args})
 
     @cached_property
     def scalar_loop_args(self):
@@ -801,15 +876,13 @@ class LoopKernel(Taggable):
 
     @property
     def cache_manager(self) -> SetOperationCacheManager:
-        try:
-            return self._cache_manager
-        except AttributeError:
-            pass
-
-        from loopy.kernel.tools import SetOperationCacheManager
-        cm = SetOperationCacheManager()
-        object.__setattr__(self, "_cache_manager", cm)
-        return cm
+        """The :class:`~loopy.kernel.tools.SetOperationCacheManager` used to
+        memoize :mod:`islpy` operations on this kernel's domains. It is shared
+        across all kernels in the process, so that copies of a kernel
+        (e.g. resulting from transformations) reuse each other's results.
+        """
+        from loopy.kernel.tools import get_set_operation_cache_manager
+        return get_set_operation_cache_manager()
 
     @memoize_method
     def get_iname_bounds(self,
@@ -1384,9 +1457,6 @@ class LoopKernel(Taggable):
             object.__setattr__(
                     self, "_pytools_persistent_hash_digest", p_hash_digest)
 
-        from loopy.kernel.tools import SetOperationCacheManager
-        object.__setattr__(self, "_cache_manager", SetOperationCacheManager())
-
     # }}}
 
     # {{{ persistent hash key generation / comparison
@@ -1452,19 +1522,20 @@ class LoopKernel(Taggable):
         return kwargs
 
     def copy(self, **kwargs: Any) -> LoopKernel:
-        result = replace(self, **self.get_copy_kwargs(**kwargs))
+        kwargs = self.get_copy_kwargs(**kwargs)
+        result = replace(self, **kwargs)
 
-        object.__setattr__(result, "_cache_manager", self.cache_manager)
-
-        if "instructions" not in kwargs:
-            # Avoid carrying over an invalid cache when instructions are
-            # modified.
+        # Carry over those cached results whose inputs are not modified, to
+        # avoid recomputing them for every transformation applied.
+        instance_dict = self.__dict__
+        for cached_attr, dep_fields in _CACHED_ATTRIBUTE_DEPENDENCIES.items():
             try:
-                cwv = self._cached_written_variables
-            except AttributeError:
-                pass
-            else:
-                object.__setattr__(result, "_cached_written_variables", cwv)
+                value = instance_dict[cached_attr]
+            except KeyError:
+                continue
+
+            if not any(field in kwargs for field in dep_fields):
+                result.__dict__[cached_attr] = value
 
         return result
 
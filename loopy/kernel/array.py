@@ -977,6 +977,10 @@ class ArrayBase(ImmutableRecord, Taggable):
                 tags=tags,
                 **kwargs)
 
+    def get_copy_kwargs(self, **kwargs):
+        from loopy.tools import get_record_copy_kwargs
+        return get_record_copy_kwargs(self, kwargs)
+
     # Without this __hash__ is set to None because this class overrides __eq__.
     # Source: https://docs.python.org/3/reference/datamodel.html#object.__hash__
     def __hash__(self):
@@ -303,6 +303,28 @@ class UnrollHintTag(InameImplementationTag):
             return "unr_hint"
 
 
+class OpenMPParallelTag(InameImplementationTag):
+    """Realizes the iname as a sequential loop that is shared among the
+    threads of an OpenMP team, i.e. as a ``#pragma omp parallel for`` loop.
+    Unlike :class:`ConcurrentTag`, the loop is scheduled like a sequential
+    one, so that reductions over the iname are realized by
+    :func:`loopy.realize_reduction` using OpenMP ``reduction`` clauses (for
+    the built-in scalar operations) or per-iteration partial results that
+    are combined after the loop.
+
+    Temporaries that are only accessed within the loop are made ``private``
+    to each thread. As for other parallel tags, it is up to the user to
+    ensure that the iterations of the loop are independent.
+
+    Only supported by :class:`loopy.CTarget` and its subclasses. The
+    generated code must be compiled with OpenMP enabled (e.g. ``-fopenmp``),
+    otherwise the loop is executed sequentially.
+    """
+    @override
+    def __str__(self):
+        return "omp"
+
+
 class ForceSequentialTag(InameImplementationTag):
     @override
     def __str__(self):
@@ -332,6 +354,8 @@ def parse_tag(tag: ToInameTagConvertible) -> Tag | None:
         return None
     elif tag == "ord":
         return InOrderSequentialSequentialTag()
+    elif tag == "omp":
+        return OpenMPParallelTag()
     elif tag in ["unr"]:
         return UnrollTag()
     elif tag in ["vec"]:
@@ -430,6 +454,10 @@ class KernelArgument(ImmutableRecord, Taggable):
 
         ImmutableRecord.__init__(self, **kwargs)
 
+    def get_copy_kwargs(self, **kwargs):
+        from loopy.tools import get_record_copy_kwargs
+        return get_record_copy_kwargs(self, kwargs)
+
     def supporting_names(self) -> frozenset[str]:
         """'Supporting' names are those that are likely to be required to be
         present for any use of the argument.
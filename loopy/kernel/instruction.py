@@ -46,12 +46,16 @@ from typing_extensions import Self, override
 
 import islpy as isl
 import pymbolic.primitives as p
-from pytools import ImmutableRecord, memoize_method
+from pytools import ImmutableRecord
 from pytools.tag import Tag, Taggable, tag_dataclass
 
 from loopy.diagnostic import LoopyError
 from loopy.symbolic import LinearSubscript, SubArrayRef
-from loopy.tools import Optional as LoopyOptional
+from loopy.tools import (
+    Optional as LoopyOptional,
+    get_record_copy_kwargs,
+    memoize_nullary_method,
+)
 from loopy.types import LoopyType, ToLoopyTypeConvertible, to_loopy_type
 
 
@@ -110,6 +114,27 @@ class UseStreamingStoreTag(Tag):
     """
     pass
 
+
+@tag_dataclass
+class OpenMPReductionTag(Tag):
+    """A subclass of :class:`pytools.tag.Tag` for use in
+    :attr:`InstructionBase.tags` used to indicate that the instruction
+    updates its assignees as part of a reduction over
+    :class:`~loopy.kernel.data.OpenMPParallelTag`-tagged inames, so that
+    loops over these inames should carry an OpenMP ``reduction`` clause
+    for the assignees. Attached by :func:`loopy.realize_reduction`.
+
+    .. attribute:: operator
+
+        The OpenMP reduction identifier, e.g. ``"+"`` or ``"max"``.
+
+    .. attribute:: inames
+
+        A :class:`frozenset` of the inames being reduced over.
+    """
+    operator: str
+    inames: frozenset[str]
+
 # }}}
 
 
@@ -398,7 +423,9 @@ class InstructionBase(ImmutableRecord, Taggable):
         if priority is None:
             priority = 0
 
-        if not isinstance(tags, abc_Set):
+        # Checking for the concrete types first avoids the comparatively
+        # slow ABC instance checks in the common case.
+        if not isinstance(tags, (frozenset, abc_Set)):
             # was previously allowed to be tuple
             tags = frozenset(tags)
 
@@ -413,10 +440,10 @@ class InstructionBase(ImmutableRecord, Taggable):
         # assert all(is_interned(iname) for iname in within_inames)
         # assert all(is_interned(pred) for pred in predicates)
 
-        assert isinstance(within_inames, abc_Set)
-        assert isinstance(happens_after, abc_Mapping) or happens_after is None
-        assert isinstance(groups, abc_Set)
-        assert isinstance(conflicts_with_groups, abc_Set)
+        assert isinstance(within_inames, (frozenset, abc_Set))
+        assert isinstance(happens_after, (constantdict, abc_Mapping))
+        assert isinstance(groups, (frozenset, abc_Set))
+        assert isinstance(conflicts_with_groups, (frozenset, abc_Set))
 
         from loopy.tools import is_hashable
         assert is_hashable(happens_after)
@@ -442,7 +469,7 @@ class InstructionBase(ImmutableRecord, Taggable):
         if passed_depends_on:
             assert "happens_after" not in kwargs
 
-        kwargs = super().get_copy_kwargs(**kwargs)
+        kwargs = get_record_copy_kwargs(self, kwargs)
 
         if passed_depends_on:
             # FIXME Enable once we realistically check detailed dependencies.
@@ -521,7 +548,7 @@ class InstructionBase(ImmutableRecord, Taggable):
         name, = names
         return name
 
-    @memoize_method
+    @memoize_nullary_method
     def write_dependency_names(self):
         """Return a set of dependencies of the left hand side of the
         assignments performed by this instruction, including written variables
@@ -535,7 +562,7 @@ class InstructionBase(ImmutableRecord, Taggable):
 
         return result
 
-    @memoize_method
+    @memoize_nullary_method
     def dependency_names(self):
         return self.read_dependency_names() | self.write_dependency_names()
 
@@ -842,7 +869,7 @@ class MultiAssignmentBase(InstructionBase):
 
     assignees: tuple[Assignable, ...]  # pyright: ignore[reportUninitializedInstanceVariable]
 
-    @memoize_method
+    @memoize_nullary_method
     def read_dependency_names(self):
         from loopy.symbolic import get_dependencies
         result = (
@@ -854,12 +881,12 @@ class MultiAssignmentBase(InstructionBase):
 
         return result
 
-    @memoize_method
+    @memoize_nullary_method
     def reduction_inames(self):
         from loopy.symbolic import get_reduction_inames
         return frozenset(get_reduction_inames(self.expression))
 
-    @memoize_method
+    @memoize_nullary_method
     def sub_array_ref_inames(self):
         from loopy.symbolic import get_sub_array_ref_swept_inames
         return get_sub_array_ref_swept_inames((self.assignees, self.expression))
@@ -1001,7 +1028,7 @@ class Assignment(MultiAssignmentBase):
 
     # {{{ implement InstructionBase interface
 
-    @memoize_method
+    @memoize_nullary_method
     def assignee_var_names(self):
         return (_get_assignee_var_name(self.assignee),)
 
@@ -1064,7 +1091,7 @@ class Assignment(MultiAssignmentBase):
     def assignees(self) -> tuple[Assignable]:  # pyright: ignore[reportIncompatibleVariableOverride]
         return (self.assignee,)
 
-    @memoize_method
+    @memoize_nullary_method
     def sub_array_ref_inames(self):
         assert super().sub_array_ref_inames() == frozenset()
         return frozenset()
@@ -1178,7 +1205,7 @@ class CallInstruction(MultiAssignmentBase):
 
     # {{{ implement InstructionBase interface
 
-    @memoize_method
+    @memoize_nullary_method
     def assignee_var_names(self):
         return tuple(_get_assignee_var_name(a) for a in self.assignees)
 
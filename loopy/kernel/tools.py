@@ -28,6 +28,8 @@ import dataclasses
 import itertools
 import logging
 import sys
+import threading
+from collections import OrderedDict
 from collections.abc import Set
 from functools import reduce
 from sys import intern
@@ -403,10 +405,52 @@ P = ParamSpec("P")
 
 
 class SetOperationCacheManager:
-    cache: dict[int, list[tuple[isl.Set | isl.BasicSet, object]]]
+    """Memoizes the results of (expensive) :mod:`islpy` set operations.
 
-    def __init__(self):
-        self.cache = {}
+    Results are looked up by the hash of the set and the operation, and a
+    cached result is only reused if its set is
+    :meth:`~islpy.Set.plain_is_equal` to the queried one.
+
+    The cache may be used from multiple threads: its bookkeeping is guarded
+    by a lock, while the set operations themselves are run outside of it.
+
+    .. attribute:: max_entries
+
+        If not *None*, the maximal number of results retained. Once this is
+        exceeded, the least recently used results are discarded.
+
+    .. attribute:: hits
+    .. attribute:: misses
+    .. autoattribute:: hit_rate
+
+    .. automethod:: clear
+    """
+    cache: OrderedDict[int, list[tuple[isl.Set | isl.BasicSet,
+                                       tuple[tuple[str, ...], ...], object]]]
+    max_entries: int | None
+    hits: int
+    misses: int
+
+    def __init__(self, max_entries: int | None = None):
+        self.cache = OrderedDict()
+        self.max_entries = max_entries
+        self.nentries = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that were served from the cache."""
+        nlookups = self.hits + self.misses
+        return self.hits / nlookups if nlookups else 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self.cache.clear()
+            self.nentries = 0
+            self.hits = 0
+            self.misses = 0
 
     def op(self,
            set_: isl.Set | isl.BasicSet,
@@ -415,16 +459,40 @@ class SetOperationCacheManager:
            **kwargs: P.kwargs) -> ResultT:
         assert not kwargs
 
-        hashval = hash((set_, op, args))
-        bucket = self.cache.setdefault(hashval, [])
+        # Neither the hash nor plain_is_equal of isl sets take the names of
+        # dimensions into account, so they are compared separately.
+        var_names = (tuple(set_.get_var_names(dim_type.param)),
+                     tuple(set_.get_var_names(dim_type.set)))
 
+        hashval = hash((set_, var_names, op, args))
         cmp_set = set_.to_set() if isinstance(set_, isl.BasicSet) else set_
-        for bkt_set, result in bucket:
-            if cmp_set.plain_is_equal(bkt_set):
-                return cast("ResultT", result)
+
+        with self._lock:
+            bucket = self.cache.get(hashval, [])
+            if bucket:
+                self.cache.move_to_end(hashval)
+
+            for bkt_set, bkt_var_names, result in bucket:
+                if (bkt_var_names == var_names
+                        and cmp_set.plain_is_equal(bkt_set)):
+                    self.hits += 1
+                    return cast("ResultT", result)
+
+            self.misses += 1
 
         result = op(set_, *args, **kwargs)
-        bucket.append((set_, result))
+
+        with self._lock:
+            # the bucket may have been evicted while computing the result
+            self.cache.setdefault(hashval, []).append((set_, var_names, result))
+            self.cache.move_to_end(hashval)
+            self.nentries += 1
+
+            if self.max_entries is not None:
+                while self.nentries > self.max_entries:
+                    _, evicted_bucket = self.cache.popitem(last=False)
+                    self.nentries -= len(evicted_bucket)
+
         return result
 
     def dim_min(self, set_: isl.Set | isl.BasicSet, axis: int):
@@ -513,6 +581,19 @@ class SetOperationCacheManager:
 
         # }}}
 
+
+SET_OPERATION_CACHE_MAX_ENTRIES = 2**14
+
+_set_operation_cache_manager = SetOperationCacheManager(
+        max_entries=SET_OPERATION_CACHE_MAX_ENTRIES)
+
+
+def get_set_operation_cache_manager() -> SetOperationCacheManager:
+    """Returns the process-wide :class:`SetOperationCacheManager` shared by
+    all kernels, see :attr:`loopy.LoopKernel.cache_manager`.
+    """
+    return _set_operation_cache_manager
+
 # }}}
 
 
@@ -45,6 +45,11 @@ Match expressions
 .. autoclass:: InKernel
 .. autoclass:: Iname
 
+Instruction index
+^^^^^^^^^^^^^^^^^
+
+.. autoclass:: InstructionMatchIndex
+
 """
 
 from __future__ import annotations
@@ -74,9 +79,13 @@ THE SOFTWARE.
 
 import re
 from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Mapping, Set as AbstractSet
 from dataclasses import dataclass
+from functools import cached_property
 from sys import intern
-from typing import TYPE_CHECKING, NamedTuple, Protocol, TypeAlias, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol, TypeAlias, cast
 
 from typing_extensions import override
 
@@ -89,7 +98,7 @@ from pytools.lex import RE, LexTable
 
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
 
     import pytools.tag
 
@@ -183,10 +192,25 @@ StackMatch: TypeAlias = """Callable[
 
 
 class MatchExpressionBase(ABC):
+    """
+    .. automethod:: __call__
+    .. automethod:: get_matching_insn_ids
+    """
+
     @abstractmethod
     def __call__(self, kernel: LoopKernel, matchable: Matchable) -> bool:
         raise NotImplementedError
 
+    def get_matching_insn_ids(self, kernel: LoopKernel) -> frozenset[str]:
+        """Return the ids of the instructions in *kernel* matched by *self*.
+
+        The match expressions in this module compute these from the
+        :class:`InstructionMatchIndex` of *kernel* instead of testing each
+        instruction. The default implementation tests each instruction.
+        """
+        return frozenset(
+                insn.id for insn in kernel.instructions if self(kernel, insn))
+
     @override
     def __ne__(self, other: object):
         return not self.__eq__(other)
@@ -206,6 +230,10 @@ class All(MatchExpressionBase):
     def __call__(self, kernel: LoopKernel, matchable: Matchable) -> bool:
         return True
 
+    @override
+    def get_matching_insn_ids(self, kernel: LoopKernel) -> frozenset[str]:
+        return kernel.get_instruction_match_index().all_insn_ids
+
     @override
     def __str__(self):
         return "all"
@@ -247,12 +275,27 @@ class And(MultiChildMatchExpressionBase):
     def __call__(self, kernel: LoopKernel, matchable: Matchable) -> bool:
         return all(ch(kernel, matchable) for ch in self.children)
 
+    @override
+    def get_matching_insn_ids(self, kernel: LoopKernel) -> frozenset[str]:
+        result = kernel.get_instruction_match_index().all_insn_ids
+        for ch in self.children:
+            if not result:
+                break
+            result = result & ch.get_matching_insn_ids(kernel)
+
+        return result
+
 
 class Or(MultiChildMatchExpressionBase):
     @override
     def __call__(self, kernel: LoopKernel, matchable: Matchable) -> bool:
         return any(ch(kernel, matchable) for ch in self.children)
 
+    @override
+    def get_matching_insn_ids(self, kernel: LoopKernel) -> frozenset[str]:
+        return frozenset().union(
+                *(ch.get_matching_insn_ids(kernel) for ch in self.children))
+
 
 @dataclass(frozen=True, eq=True)
 class Not(MatchExpressionBase):
@@ -262,6 +305,11 @@ class Not(MatchExpressionBase):
     def __call__(self, kernel: LoopKernel, matchable: Matchable) -> bool:
         return not self.child(kernel, matchable)
 
+    @override
+    def get_matching_insn_ids(self, kernel: LoopKernel) -> frozenset[str]:
+        return (kernel.get_instruction_match_index().all_insn_ids
+                - self.child.get_matching_insn_ids(kernel))
+
     @override
     def __str__(self):
         return "(not %s)" % str(self.child)
@@ -286,6 +334,12 @@ class ObjTagged(MatchExpressionBase):
     def __call__(self, kernel: LoopKernel, matchable: Matchable) -> bool:
         return self.tag in matchable.tags
 
+    @override
+    def get_matching_insn_ids(self, kernel: LoopKernel) -> frozenset[str]:
+        return frozenset(
+                kernel.get_instruction_match_index().obj_tag_to_insn_ids.get(
+                    self.tag, ()))
+
 
 class GlobMatchExpressionBase(MatchExpressionBase, ABC):
     glob: str
@@ -325,6 +379,10 @@ class Id(GlobMatchExpressionBase):
     def __call__(self, kernel: LoopKernel, matchable: Matchable) -> bool:
         return bool(self.re.match(matchable.id))
 
+    @override
+    def get_matching_insn_ids(self, kernel: LoopKernel) -> frozenset[str]:
+        return kernel.get_instruction_match_index().ids.lookup(self)
+
 
 class Tagged(GlobMatchExpressionBase):
     """Match a string-based tagged using a glob expression.
@@ -350,6 +408,10 @@ class Tagged(GlobMatchExpressionBase):
         else:
             return False
 
+    @override
+    def get_matching_insn_ids(self, kernel: LoopKernel) -> frozenset[str]:
+        return kernel.get_instruction_match_index().tags.lookup(self)
+
 
 class Writes(GlobMatchExpressionBase):
     @override
@@ -358,6 +420,10 @@ class Writes(GlobMatchExpressionBase):
             return False
         return any(self.re.match(name) for name in matchable.assignee_var_names())
 
+    @override
+    def get_matching_insn_ids(self, kernel: LoopKernel) -> frozenset[str]:
+        return kernel.get_instruction_match_index().writes.lookup(self)
+
 
 class Reads(GlobMatchExpressionBase):
     @override
@@ -366,12 +432,23 @@ class Reads(GlobMatchExpressionBase):
             return False
         return any(self.re.match(name) for name in matchable.read_dependency_names())
 
+    @override
+    def get_matching_insn_ids(self, kernel: LoopKernel) -> frozenset[str]:
+        return kernel.get_instruction_match_index().reads.lookup(self)
+
 
 class InKernel(GlobMatchExpressionBase):
     @override
     def __call__(self, kernel: LoopKernel, matchable: Matchable) -> bool:
         return bool(self.re.match(kernel.name))
 
+    @override
+    def get_matching_insn_ids(self, kernel: LoopKernel) -> frozenset[str]:
+        if self.re.match(kernel.name):
+            return kernel.get_instruction_match_index().all_insn_ids
+        else:
+            return frozenset()
+
 
 class Iname(GlobMatchExpressionBase):
     @override
@@ -382,6 +459,157 @@ class Iname(GlobMatchExpressionBase):
         return any(self.re.match(name)
                 for name in matchable.within_inames)
 
+    @override
+    def get_matching_insn_ids(self, kernel: LoopKernel) -> frozenset[str]:
+        return kernel.get_instruction_match_index().inames.lookup(self)
+
+# }}}
+
+
+# {{{ instruction index
+
+_GLOB_SPECIAL_CHARS = frozenset("*?[")
+
+
+class _NameToInsnIds:
+    """Maps names (such as instruction ids, tags or variable names) to the
+    ids of the instructions they are associated with, with lookups by glob.
+    Globs without special characters are looked up directly, and globs of the
+    form ``prefix*`` are looked up by bisection in the sorted names.
+    """
+
+    def __init__(self, name_to_insn_ids: Mapping[str, AbstractSet[str]]) -> None:
+        self.name_to_insn_ids = name_to_insn_ids
+
+    @cached_property
+    def sorted_names(self) -> Sequence[str]:
+        return sorted(self.name_to_insn_ids)
+
+    def lookup(self, expr: GlobMatchExpressionBase) -> frozenset[str]:
+        glob = expr.glob.strip()
+        if not _GLOB_SPECIAL_CHARS.intersection(glob):
+            return frozenset(self.name_to_insn_ids.get(glob, ()))
+
+        prefix = glob[:-1]
+        if glob[-1] == "*" and not _GLOB_SPECIAL_CHARS.intersection(prefix):
+            matched_names = []
+            for i in range(bisect_left(self.sorted_names, prefix),
+                           len(self.sorted_names)):
+                name = self.sorted_names[i]
+                if not name.startswith(prefix):
+                    break
+                matched_names.append(name)
+        else:
+            matched_names = [
+                    name for name in self.sorted_names if expr.re.match(name)]
+
+        return frozenset().union(
+                *(self.name_to_insn_ids[name] for name in matched_names))
+
+
+class _InsnIdToInsnIds(Mapping[str, AbstractSet[str]]):
+    """Maps each instruction id to a set containing only that id, without
+    building that mapping.
+    """
+
+    def __init__(self, insn_ids: AbstractSet[str]) -> None:
+        self.insn_ids = insn_ids
+
+    @override
+    def __getitem__(self, insn_id: str) -> AbstractSet[str]:
+        if insn_id not in self.insn_ids:
+            raise KeyError(insn_id)
+        return {insn_id}
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.insn_ids)
+
+    @override
+    def __len__(self) -> int:
+        return len(self.insn_ids)
+
+
+class InstructionMatchIndex:
+    """An inverted index of the instructions of a kernel by id, tag, written
+    variable, read variable and iname. Used by
+    :meth:`MatchExpressionBase.get_matching_insn_ids` to find the matching
+    instructions without testing each one. Use
+    :meth:`loopy.LoopKernel.get_instruction_match_index` to obtain an
+    instance.
+
+    Each part of the index is only built once it is first needed.
+
+    .. attribute:: insn_ids
+
+        A :class:`tuple` of the instruction ids, in the order of the
+        kernel's instructions.
+
+    .. attribute:: all_insn_ids
+
+    .. attribute:: obj_tag_to_insn_ids
+
+        A mapping from each :class:`~pytools.tag.Tag` of an instruction to the
+        ids of the instructions carrying it.
+
+    .. automethod:: in_kernel_order
+    """
+
+    def __init__(self, instructions: Sequence[InstructionBase]) -> None:
+        self.instructions = instructions
+        self.insn_ids = tuple(insn.id for insn in instructions)
+        self.all_insn_ids = frozenset(self.insn_ids)
+
+    def _invert(self,
+                get_names: Callable[[InstructionBase], Iterable[Hashable]]
+            ) -> dict[Any, set[str]]:
+        result: dict[Any, set[str]] = defaultdict(set)
+        for insn in self.instructions:
+            for name in get_names(insn):
+                result[name].add(insn.id)
+
+        return dict(result)
+
+    @cached_property
+    def obj_tag_to_insn_ids(self) -> Mapping[pytools.tag.Tag, AbstractSet[str]]:
+        return self._invert(lambda insn: insn.tags)
+
+    @cached_property
+    def ids(self) -> _NameToInsnIds:
+        return _NameToInsnIds(_InsnIdToInsnIds(self.all_insn_ids))
+
+    @cached_property
+    def tags(self) -> _NameToInsnIds:
+        from loopy.kernel.instruction import LegacyStringInstructionTag
+        return _NameToInsnIds({
+                tag.value: insn_ids
+                for tag, insn_ids in self.obj_tag_to_insn_ids.items()
+                if isinstance(tag, LegacyStringInstructionTag)})
+
+    @cached_property
+    def writes(self) -> _NameToInsnIds:
+        return _NameToInsnIds(
+                self._invert(lambda insn: insn.assignee_var_names()))
+
+    @cached_property
+    def reads(self) -> _NameToInsnIds:
+        return _NameToInsnIds(
+                self._invert(lambda insn: insn.read_dependency_names()))
+
+    @cached_property
+    def inames(self) -> _NameToInsnIds:
+        return _NameToInsnIds(self._invert(lambda insn: insn.within_inames))
+
+    @cached_property
+    def _insn_id_to_position(self) -> Mapping[str, int]:
+        return {insn_id: i for i, insn_id in enumerate(self.insn_ids)}
+
+    def in_kernel_order(self, insn_ids: AbstractSet[str]) -> list[str]:
+        """Return *insn_ids* sorted in the order of the kernel's
+        instructions.
+        """
+        return sorted(insn_ids, key=self._insn_id_to_position.__getitem__)
+
 # }}}
 
 
@@ -100,6 +100,27 @@ class Options(ImmutableRecord):
         Like :attr:`trace_assignments`, but also trace the
         assigned values.
 
+    .. attribute:: strength_reduce_indices
+
+        In innermost sequential loops, compute the flattened indices of
+        array accesses that are affine in the loop's iname incrementally,
+        in variables that are advanced along with the loop, instead of
+        evaluating them at every access. This helps in particular for
+        arrays with strides given by kernel arguments, which the target
+        compiler may not be able to strength-reduce on its own. Ignored
+        by targets whose loops cannot carry such variables.
+
+    .. attribute:: peel_remainder_slabs
+
+        Separate out the first or last iteration of sequential loops if
+        the innermost, unrolled or vectorized loops nested within them do
+        not run over their full range in those iterations, as happens after
+        :func:`loopy.split_iname` with a length that does not divide the
+        trip count. The bulk of the loop is then generated without the
+        conditionals guarding the remainder. Loops for which
+        :func:`loopy.split_iname` was given nonzero *slabs* are left as they
+        are.
+
     .. attribute:: check_dep_resolution
 
         Whether loopy should issue an error if a dependency
@@ -199,11 +220,60 @@ class Options(ImmutableRecord):
 
         If equal to ``"no_check"``, then no check is performed.
 
+    .. attribute:: bounds_check_max_workers
+
+        An :class:`int`. If positive, :func:`~loopy.check.check_bounds` shards
+        its checks by batches of instructions and by callee and runs them in
+        a process pool with this many worker processes.
+
+        Defaults to 0, i.e. checks are run serially in the calling process.
+        Listed in :attr:`non_semantic_fields`, so changing it does not
+        invalidate cached results.
+
+    .. attribute:: codegen_max_workers
+
+        An :class:`int`. If greater than one, :func:`~loopy.generate_code_v2`
+        generates code for the callable kernels of a translation unit in a
+        process pool with up to this many worker processes. The generated
+        code is identical to the one generated serially.
+
+        Defaults to 0, i.e. code is generated serially in the calling process.
+        Listed in :attr:`non_semantic_fields`, so changing it does not
+        invalidate cached results.
+
+    .. attribute:: skip_expensive_checks
+
+        If *True* on all entrypoints of a translation unit,
+        :func:`~loopy.check.pre_schedule_checks` skips the checks listed in
+        :data:`~loopy.check.EXPENSIVE_PRE_SCHEDULE_CHECKS`, such as
+        :func:`~loopy.check.check_bounds`. Intended for production builds of
+        kernels that have already been validated.
+
+        This option is listed in :attr:`non_semantic_fields`, so toggling
+        it does not invalidate cached linearizations. Cached linearizations
+        are not re-checked when it is unset.
+
+        Defaults to *False*.
+
     .. attribute:: insert_gbarriers
 
         If *True*, based on the memory dependency between variables in the
         global address space loopy will insert global barriers to avoid
         RAW, WAR and WAW races.
+
+    .. autoattribute:: non_semantic_fields
+    """
+
+    non_semantic_fields: ClassVar[frozenset[str]] = frozenset({
+            "bounds_check_max_workers",
+            "codegen_max_workers",
+            "skip_expensive_checks",
+            })
+    """The names of the options that only affect how loopy does its work,
+    not its results. These are neither hashed nor compared, so that changing
+    them does not invalidate cached results for otherwise identical kernels.
+    Kernels retrieved from a cache may therefore carry the values of these
+    options at the time they were stored.
     """
 
     _legacy_options_map: ClassVar[Mapping[str, tuple[str, None] | None]] = {
@@ -269,12 +339,21 @@ class Options(ImmutableRecord):
                     allow_terminal_colors_def),
                 disable_global_barriers=kwargs.get("disable_global_barriers",
                     False),
+                strength_reduce_indices=kwargs.get(
+                    "strength_reduce_indices", False),
+                peel_remainder_slabs=kwargs.get("peel_remainder_slabs", False),
                 check_dep_resolution=kwargs.get("check_dep_resolution", True),
 
                 enforce_variable_access_ordered=kwargs.get(
                     "enforce_variable_access_ordered", True),
                 enforce_array_accesses_within_bounds=kwargs.get(
                     "enforce_array_accesses_within_bounds", True),
+                bounds_check_max_workers=kwargs.get(
+                    "bounds_check_max_workers", 0),
+                codegen_max_workers=kwargs.get(
+                    "codegen_max_workers", 0),
+                skip_expensive_checks=kwargs.get(
+                    "skip_expensive_checks", False),
                 insert_gbarriers=kwargs.get(
                     "insert_gbarriers", False),
                 )
@@ -312,9 +391,22 @@ class Options(ImmutableRecord):
         """Custom hash computation function for use with
         :class:`pytools.persistent_dict.PersistentDict`.
         """
-        for field_name in sorted(self.__class__.fields):
+        for field_name in sorted(
+                self.__class__.fields - self.non_semantic_fields):
             key_builder.rec(key_hash, getattr(self, field_name))
 
+    def __eq__(self, other):
+        if self is other:
+            return True
+
+        return (type(self) is type(other)
+                and all(getattr(self, field_name) == getattr(other, field_name)
+                        for field_name in (
+                            self.__class__.fields - self.non_semantic_fields)))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
     @property
     def _fore(self):
         if self.allow_terminal_colors:
@@ -28,12 +28,15 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
-from functools import cached_property, partial
+from functools import cached_property, partial, reduce
 from typing import TYPE_CHECKING, ClassVar, Literal
 
+import numpy as np
+
 import islpy as isl
 from islpy import dim_type
 from pymbolic.mapper import CombineMapper
+from pymbolic.mapper.evaluator import EvaluationMapper
 from pytools import ImmutableRecord, memoize_method
 
 import loopy as lp
@@ -45,7 +48,11 @@ from loopy.translation_unit import TranslationUnit
 
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
+
+    from numpy.typing import ArrayLike
+
+    from pymbolic.typing import Expression
 
     from loopy.match import ToMatchConvertible
 
@@ -108,6 +115,13 @@ def _get_param_tuple(obj):
 
 
 class GuardedPwQPolynomial:
+    """A :class:`islpy.PwQPolynomial` along with the parameter domain on
+    which it is valid.
+
+    .. automethod:: eval_with_dict
+    .. automethod:: eval_with_arrays
+    """
+
     def __init__(self, pwqpolynomial, valid_domain):
         assert isinstance(pwqpolynomial, isl.PwQPolynomial)
         self.pwqpolynomial = pwqpolynomial
@@ -159,6 +173,24 @@ class GuardedPwQPolynomial:
 
         return self.pwqpolynomial.eval(pt).to_python()
 
+    @memoize_method
+    def _get_vectorized_evaluator(self) -> _VectorizedPwQPolynomialEvaluator:
+        return _VectorizedPwQPolynomialEvaluator(
+                self.pwqpolynomial, self.valid_domain)
+
+    def eval_with_arrays(self, value_dict: Mapping[str, ArrayLike]) -> np.ndarray:
+        """Evaluates *self* at many parameter values at once.
+
+        :arg value_dict: a mapping from parameter names to integer arrays
+            (or scalars) of values. The arrays are broadcast against each
+            other.
+        :returns: an integer :class:`numpy.ndarray` of the broadcast shape.
+
+        *self* is converted to a :mod:`numpy`-vectorized form on first use,
+        after which evaluation involves no :mod:`islpy` operations.
+        """
+        return self._get_vectorized_evaluator()(value_dict)
+
     @staticmethod
     def zero():
         p = isl.PwQPolynomial("{ 0 }")
@@ -173,6 +205,86 @@ class GuardedPwQPolynomial:
 # }}}
 
 
+# {{{ vectorized evaluation of piecewise quasi-polynomials
+
+class _VectorizedEvaluationMapper(EvaluationMapper[np.ndarray]):
+    def map_logical_and(self, expr):
+        return reduce(np.logical_and, [self.rec(ch) for ch in expr.children])
+
+    def map_logical_or(self, expr):
+        return reduce(np.logical_or, [self.rec(ch) for ch in expr.children])
+
+    def map_logical_not(self, expr):
+        return np.logical_not(self.rec(expr.child))
+
+
+def _param_set_to_cond_expr(set_: isl.Set | isl.BasicSet) -> Expression:
+    from pymbolic.primitives import LogicalAnd, LogicalOr
+
+    from loopy.symbolic import constraint_to_cond_expr
+
+    conjs: list[Expression] = []
+    for bset in set_.get_basic_sets():
+        constraints = bset.get_constraints()
+        if not constraints:
+            return True
+
+        conjs.append(LogicalAnd(tuple(
+            constraint_to_cond_expr(cns) for cns in constraints)))
+
+    return LogicalOr(tuple(conjs))
+
+
+def _qpolynomial_to_expr(qpoly: isl.QPolynomial) -> Expression:
+    from loopy.symbolic import qpolynomial_to_expr
+
+    if qpoly.is_zero():
+        return 0
+
+    return qpolynomial_to_expr(qpoly)
+
+
+class _VectorizedPwQPolynomialEvaluator:
+    """Evaluates a :class:`islpy.PwQPolynomial` at arrays of parameter
+    values, with the conditions of each piece turned into masks.
+    """
+
+    def __init__(self,
+                 pwqpolynomial: isl.PwQPolynomial,
+                 valid_domain: isl.Set | None = None) -> None:
+        self.param_names = _get_param_tuple(pwqpolynomial.space)
+        self.pieces = [
+                (_param_set_to_cond_expr(set_), _qpolynomial_to_expr(qpoly))
+                for set_, qpoly in pwqpolynomial.get_pieces()]
+        self.valid_domain_cond = (
+                True if valid_domain is None
+                else _param_set_to_cond_expr(valid_domain))
+
+    def __call__(self, value_dict: Mapping[str, ArrayLike]) -> np.ndarray:
+        try:
+            context = {name: np.asarray(value_dict[name], dtype=np.int64)
+                       for name in self.param_names}
+        except KeyError as e:
+            raise ValueError(f"no values given for parameter '{e.args[0]}'"
+                             ) from None
+
+        shape = np.broadcast_shapes(*(ary.shape for ary in context.values()))
+        mapper = _VectorizedEvaluationMapper(context)
+
+        if not np.all(mapper(self.valid_domain_cond)):
+            raise ValueError("evaluation point outside of domain of "
+                    "definition of piecewise quasipolynomial")
+
+        # The pieces' domains are disjoint, outside of them the value is 0.
+        result = np.zeros(shape, dtype=np.int64)
+        for cond, value in self.pieces:
+            result = result + np.where(mapper(cond), mapper(value), 0)
+
+        return result
+
+# }}}
+
+
 # {{{ ToCountMap
 
 class ToCountMap:
@@ -474,6 +586,8 @@ class ToCountPolynomialMap(ToCountMap):
     :class:`~loopy.statistics.GuardedPwQPolynomial`.
 
     .. automethod:: eval_and_sum
+    .. automethod:: eval_and_sum_with_arrays
+    .. automethod:: eval_with_arrays
     """
 
     def __init__(self, space, count_map=None):
@@ -536,9 +650,50 @@ class ToCountPolynomialMap(ToCountMap):
 
         return self.sum().eval_with_dict(params)
 
+    def eval_with_arrays(self, params: Mapping[str, ArrayLike]) -> ToCountMap:
+        """Evaluate all counts at arrays of parameter values, see
+        :meth:`~loopy.statistics.GuardedPwQPolynomial.eval_with_arrays`.
+
+        :return: A :class:`ToCountMap` mapping the keys of *self* to
+            :class:`numpy.ndarray` instances of counts.
+        """
+        return ToCountMap({
+            key: _to_guarded_pwqpolynomial(count).eval_with_arrays(params)
+            for key, count in self.count_map.items()})
+
+    def eval_and_sum_with_arrays(self,
+                                 params: Mapping[str, ArrayLike]) -> np.ndarray:
+        """Add all counts and evaluate them at arrays of parameter values.
+        This is a vectorized version of :meth:`eval_and_sum` intended for
+        parameter sweeps.
+
+        :return: An integer :class:`numpy.ndarray` of the shape that the
+            parameter value arrays broadcast to.
+
+        Example usage::
+
+            op_map = lp.get_op_map(knl, subgroup_size=32)
+            n = np.arange(16, 4096, 16)
+            flops = op_map.filter_by(dtype=[np.float64]).eval_and_sum_with_arrays(
+                {"n": n, "m": 256})
+        """
+        return _to_guarded_pwqpolynomial(self.sum()).eval_with_arrays(params)
+
 # }}}
 
 
+def _to_guarded_pwqpolynomial(
+            count: GuardedPwQPolynomial | isl.PwQPolynomial
+        ) -> GuardedPwQPolynomial:
+    if isinstance(count, GuardedPwQPolynomial):
+        return count
+    elif isinstance(count, isl.PwQPolynomial):
+        return GuardedPwQPolynomial(count,
+                                    isl.Set.universe(count.domain().space))
+    else:
+        raise TypeError(f"unexpected count type: {type(count)}")
+
+
 # {{{ subst_into_to_count_map
 
 def subst_into_guarded_pwqpolynomial(new_space, guarded_poly, subst_dict):
@@ -1097,6 +1252,72 @@ class _IndexStrideCoefficientCollector(CoefficientCollector):
 # }}}
 
 
+# {{{ _get_iname_strides
+
+def _get_iname_strides(knl, array, index, inames):
+    """Returns a mapping from each of *inames* to the stride (in units of the
+    array's data type) with which the access to *array* by *index* moves
+    along the iname, or to *None* if the stride cannot be determined.
+    """
+    from pymbolic.primitives import Variable
+
+    from loopy.diagnostic import ExpressionNotAffineError
+    from loopy.kernel.array import FixedStrideArrayDimTag
+    from loopy.symbolic import simplify_using_aff
+
+    if array.dim_tags is None:
+        assert len(index) <= 1
+        dim_tags = (None,) * len(index)
+    else:
+        dim_tags = array.dim_tags
+
+    iname_to_stride = {}
+
+    for iname in inames:
+        total_iname_stride = 0
+        # find total stride of this iname for each axis
+        for idx, axis_tag in zip(index, dim_tags, strict=True):
+            # collect index coefficients
+            try:
+                coeffs = _IndexStrideCoefficientCollector(
+                        [iname])(simplify_using_aff(knl, idx))
+            except ExpressionNotAffineError:
+                total_iname_stride = None
+                break
+
+            # check if idx contains this iname
+            try:
+                coeff = coeffs[Variable(iname)]
+            except KeyError:
+                # idx does not contain this iname
+                continue
+
+            # found coefficient of this iname
+            # now determine stride
+            if isinstance(axis_tag, FixedStrideArrayDimTag):
+                axis_tag_stride = axis_tag.stride
+
+                if axis_tag_stride is lp.auto:
+                    total_iname_stride = None
+                    break
+
+            elif axis_tag is None:
+                axis_tag_stride = 1
+
+            else:
+                continue
+
+            total_iname_stride += axis_tag_stride*coeff
+
+        iname_to_stride[iname] = (
+            flatten(total_iname_stride)
+            if total_iname_stride is not None else total_iname_stride)
+
+    return iname_to_stride
+
+# }}}
+
+
 # {{{ _get_lid_and_gid_strides
 
 def _get_lid_and_gid_strides(knl, array, index):
@@ -1129,63 +1350,11 @@ def _get_lid_and_gid_strides(knl, array, index):
     # where l0, l1, l2, g0, g1, and g2 come from flattened index
     # [... + g2*gid2 + g1*gid1 + g0*gid0 + ... + l2*lid2 + l1*lid1 + l0*lid0]
 
-    from pymbolic.primitives import Variable
-
-    from loopy.diagnostic import ExpressionNotAffineError
-    from loopy.kernel.array import FixedStrideArrayDimTag
-    from loopy.symbolic import simplify_using_aff
-
     def get_iname_strides(tag_to_iname_dict):
-        tag_to_stride_dict = {}
-
-        if array.dim_tags is None:
-            assert len(index) <= 1
-            dim_tags = (None,) * len(index)
-        else:
-            dim_tags = array.dim_tags
-
-        for tag in tag_to_iname_dict:
-            total_iname_stride = 0
-            # find total stride of this iname for each axis
-            for idx, axis_tag in zip(index, dim_tags, strict=True):
-                # collect index coefficients
-                try:
-                    coeffs = _IndexStrideCoefficientCollector(
-                            [tag_to_iname_dict[tag]])(
-                                    simplify_using_aff(knl, idx))
-                except ExpressionNotAffineError:
-                    total_iname_stride = None
-                    break
-
-                # check if idx contains this iname
-                try:
-                    coeff = coeffs[Variable(tag_to_iname_dict[tag])]
-                except KeyError:
-                    # idx does not contain this iname
-                    continue
-
-                # found coefficient of this iname
-                # now determine stride
-                if isinstance(axis_tag, FixedStrideArrayDimTag):
-                    axis_tag_stride = axis_tag.stride
-
-                    if axis_tag_stride is lp.auto:
-                        total_iname_stride = None
-                        break
-
-                elif axis_tag is None:
-                    axis_tag_stride = 1
-
-                else:
-                    continue
-
-                total_iname_stride += axis_tag_stride*coeff
-
-            tag_to_stride_dict[tag] = (
-                flatten(total_iname_stride)
-                if total_iname_stride is not None else total_iname_stride)
-
-        return tag_to_stride_dict
+        iname_to_stride = _get_iname_strides(
+                knl, array, index, tag_to_iname_dict.values())
+        return {tag: iname_to_stride[iname]
+                for tag, iname in tag_to_iname_dict.items()}
 
     return get_iname_strides(lid_to_iname), get_iname_strides(gid_to_iname)
 
@@ -1696,8 +1865,10 @@ def _get_op_map_for_single_kernel(knl, callables_table,
         NoOpInstruction,
     )
 
+    matching_insn_ids = within.get_matching_insn_ids(knl)
+
     for insn in knl.instructions:
-        if within(knl, insn):
+        if insn.id in matching_insn_ids:
             if isinstance(insn, (CallInstruction, Assignment)):
                 ops = op_counter(insn.assignees) + op_counter(insn.expression)
                 for key, val in ops.count_map.items():
@@ -1889,8 +2060,10 @@ def _get_mem_access_map_for_single_kernel(knl, callables_table,
         NoOpInstruction,
     )
 
+    matching_insn_ids = within.get_matching_insn_ids(knl)
+
     for insn in knl.instructions:
-        if within(knl, insn):
+        if insn.id in matching_insn_ids:
             if isinstance(insn, (CallInstruction, Assignment)):
                 insn_access_map = (
                             access_counter_g(insn.expression)
@@ -0,0 +1,219 @@
+"""Generation of large synthetic kernels for benchmarking"""
+from __future__ import annotations
+
+
+__copyright__ = "Copyright (C) 2026 agent"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+from random import Random
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from loopy.diagnostic import LoopyError
+
+
+if TYPE_CHECKING:
+    from loopy.target import TargetBase
+    from loopy.translation_unit import TranslationUnit
+
+
+__doc__ = """
+Code generators built on loopy produce kernels with thousands of instructions
+and hundreds of inames. :func:`make_synthetic_kernel` generates kernels of
+such sizes, with a handful of knobs controlling their shape, so that the
+scaling of loopy's processing stages can be measured and tracked (see the
+:mod:`asv` benchmarks in the ``benchmarks`` directory of the source
+distribution).
+
+.. autofunction:: make_synthetic_kernel
+"""
+
+
+# {{{ synthetic kernel generator
+
+def _make_callees(callee_depth: int, extent: int,
+                  target: TargetBase | None) -> list[TranslationUnit]:
+    import loopy as lp
+
+    callees = []
+    for level in range(callee_depth):
+        kernel_data = [lp.GlobalArg("x, y", np.float64, shape=(extent,))]
+        if level == callee_depth - 1:
+            domain = f"{{[j]: 0<=j<{extent}}}"
+            instructions = [f"y[j] = 2*x[j] + {level}"]
+        else:
+            domain = f"{{[j, k]: 0<=j, k<{extent}}}"
+            instructions = [
+                f"tmp[j] = 2*x[j] + {level}",
+                f"[k]: y[k] = callee_{level + 1}([k]: tmp[k])",
+                ]
+            kernel_data.append(
+                lp.TemporaryVariable("tmp", np.float64, shape=(extent,)))
+
+        callees.append(lp.make_function(
+            domain,
+            instructions,
+            kernel_data,
+            name=f"callee_{level}",
+            target=target,
+            seq_dependencies=True,
+            lang_version=(2018, 2)))
+
+    return callees
+
+
+def make_synthetic_kernel(
+            ninstructions: int,
+            *,
+            loop_depth: int = 2,
+            instructions_per_loop_nest: int = 10,
+            dependency_density: float = 0.5,
+            subst_rule_nesting: int = 0,
+            callee_depth: int = 0,
+            loop_extent: int = 8,
+            target: TargetBase | None = None,
+            seed: int = 0,
+        ) -> TranslationUnit:
+    """Returns a :class:`~loopy.TranslationUnit` with a synthetic kernel made
+    by :func:`~loopy.make_kernel`.
+
+    The instructions are distributed over independent loop nests of
+    *instructions_per_loop_nest* instructions each. Each loop nest has
+    its own domain with *loop_depth* inames of extent *loop_extent*,
+    so that the kernel has about ``ninstructions / instructions_per_loop_nest
+    * loop_depth`` inames. Within a loop nest, each instruction assigns a
+    private temporary, except for the last one, which writes the
+    loop nest's part of the output array ``out``.
+
+    :arg dependency_density: the probability with which each of the two
+        operands of an instruction is a temporary written by an earlier
+        instruction of the same loop nest, rather than an entry of the
+        input array ``x``. Higher densities lead to deeper dependency
+        chains.
+    :arg subst_rule_nesting: if positive, every instruction applies a
+        substitution rule whose definition nests *subst_rule_nesting* levels
+        of substitution rules.
+    :arg callee_depth: if positive, every loop nest contains a call to
+        a callee kernel, which in turn calls a chain of *callee_depth* - 1
+        further kernels.
+    :arg seed: the seed of the random number generator choosing the
+        operands of the instructions. The result is deterministic for a
+        given set of arguments.
+    """
+    import loopy as lp
+
+    if ninstructions < 1:
+        raise LoopyError("ninstructions must be positive")
+    if loop_depth < 1:
+        raise LoopyError("loop_depth must be positive")
+    if instructions_per_loop_nest < 1:
+        raise LoopyError("instructions_per_loop_nest must be positive")
+    if not 0 <= dependency_density <= 1:
+        raise LoopyError("dependency_density must be between 0 and 1")
+
+    rng = Random(seed)
+    nnests = -(-ninstructions // instructions_per_loop_nest)
+
+    domains = []
+    instructions = []
+
+    for level in range(subst_rule_nesting):
+        if level == 0:
+            instructions.append("subst_0(a) := 2*a + 1")
+        else:
+            instructions.append(
+                f"subst_{level}(a) := subst_{level - 1}(a)*a + {level}")
+
+    for inest in range(nnests):
+        inames = [f"i{inest}_{idepth}" for idepth in range(loop_depth)]
+        domains.append("{[%s]: %s}" % (
+            ", ".join(inames),
+            " and ".join(f"0<={iname}<{loop_extent}" for iname in inames)))
+
+        index = ", ".join([str(inest), *inames])
+        within = ":".join(inames)
+        ninsns_in_nest = min(instructions_per_loop_nest,
+                             ninstructions - inest*instructions_per_loop_nest)
+
+        temporaries: list[str] = []
+        for iinsn in range(ninsns_in_nest):
+            operands = [
+                rng.choice(temporaries)
+                if temporaries and rng.random() < dependency_density
+                else f"x[{index}]"
+                for _ in range(2)]
+            expr = f"{operands[0]}*{operands[1]} + {iinsn}"
+
+            if subst_rule_nesting:
+                expr = f"subst_{subst_rule_nesting - 1}({expr})"
+
+            insn_id = f"insn_{inest}_{iinsn}"
+            if iinsn == ninsns_in_nest - 1:
+                instructions.append(
+                    f"out[{index}] = {expr} {{id={insn_id}, inames={within}}}")
+            else:
+                tmp_name = f"t{inest}_{iinsn}"
+                instructions.append(
+                    f"<> {tmp_name} = {expr} {{id={insn_id}, inames={within}}}")
+                temporaries.append(tmp_name)
+
+        if callee_depth:
+            # the callee is applied to the innermost axis of the loop nest's
+            # part of the output, swept over by a separate iname
+            sweep_iname = f"j{inest}"
+            domains.append(f"{{[{sweep_iname}]: 0<={sweep_iname}<{loop_extent}}}")
+
+            outer_index = ", ".join([str(inest), *inames[:-1], sweep_iname])
+            options = [f"id=call_{inest}", f"dep=insn_{inest}_{ninsns_in_nest - 1}"]
+            if loop_depth > 1:
+                options.append(f"inames={':'.join(inames[:-1])}")
+
+            instructions.append(
+                f"[{sweep_iname}]: y[{outer_index}] = "
+                f"callee_0([{sweep_iname}]: out[{outer_index}])"
+                f" {{{', '.join(options)}}}")
+
+    shape = (nnests,) + (loop_extent,)*loop_depth
+    kernel_data: list = [
+        lp.GlobalArg("x", np.float64, shape=shape),
+        lp.GlobalArg("out", np.float64, shape=shape, is_output=True),
+        ]
+    if callee_depth:
+        kernel_data.append(
+            lp.GlobalArg("y", np.float64, shape=shape, is_output=True))
+
+    t_unit = lp.make_kernel(
+        domains, instructions, [*kernel_data, ...],
+        name="synthetic",
+        target=target,
+        lang_version=(2018, 2))
+
+    if callee_depth:
+        t_unit = lp.merge(
+            [t_unit, *_make_callees(callee_depth, loop_extent, t_unit.target)])
+
+    return t_unit
+
+# }}}
+
+# vim: foldmethod=marker
@@ -300,6 +300,26 @@ class ASTBuilderBase(Generic[ASTType], ABC):
     def emit_unroll_hint(self, value):
         raise NotImplementedError()
 
+    def emit_openmp_parallel_hint(self,
+                codegen_state: CodeGenerationState,
+                iname: InameStr
+            ) -> ASTType:
+        """Returns the directive to be placed in front of the loop over
+        *iname*, which is tagged with
+        :class:`~loopy.kernel.data.OpenMPParallelTag`.
+        """
+        from loopy.diagnostic import LoopyError
+        raise LoopyError(f"{type(self).__name__} does not support "
+                f"OpenMP-parallel loops (iname '{iname}')")
+
+    @property
+    def can_implement_induction_variables(self):
+        """Whether :meth:`emit_sequential_loop` accepts *induction_variables*,
+        a sequence of tuples ``(name, dtype, initial_value, increment)`` of
+        variables declared and advanced along with the loop's iname.
+        """
+        return False
+
     @property
     def can_implement_conditionals(self):
         return False
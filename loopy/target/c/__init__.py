@@ -355,6 +355,35 @@ def _preamble_generator(
               return x*y;
             }}""")
 
+
+def _streaming_store_preamble_generator(
+            preamble_info: PreambleInfo,
+            func_qualifier: str = "static inline"
+        ) -> Iterator[tuple[str, str]]:
+    kernel = preamble_info.kernel
+    assert isinstance(kernel.target, CFamilyTarget)
+
+    from loopy.kernel.instruction import UseStreamingStoreTag
+    if (kernel.target.streaming_stores != "sse2"
+            or not any(UseStreamingStoreTag() in insn.tags
+                       for insn in kernel.instructions)):
+        return
+
+    yield ("10_emmintrin", "#include <emmintrin.h>")
+    yield ("11_loopy_stream_float", f"""
+        {func_qualifier} void loopy_stream_float32(float *ptr, float value)
+        {{
+          _mm_stream_si32((int *) ptr,
+              _mm_cvtsi128_si32(_mm_castps_si128(_mm_set_ss(value))));
+        }}
+
+        {func_qualifier} void loopy_stream_float64(double *ptr, double value)
+        {{
+          _mm_stream_si64((long long *) ptr,
+              _mm_cvtsi128_si64(_mm_castpd_si128(_mm_set_sd(value))));
+        }}
+        """)
+
 # }}}
 
 
@@ -500,6 +529,11 @@ class CFamilyTarget(TargetBase):
     hash_fields = (*TargetBase.hash_fields, "fortran_abi")
     comparison_fields = (*TargetBase.comparison_fields, "fortran_abi")
 
+    streaming_stores: str | None = None
+    """How stores of instructions tagged with
+    :class:`~loopy.UseStreamingStoreTag` are realized, see :class:`CTarget`.
+    """
+
     def __init__(self, fortran_abi=False):
         self.fortran_abi = fortran_abi
         super().__init__()
@@ -546,6 +580,16 @@ class CFamilyTarget(TargetBase):
     # }}}
 
 
+_SSE2_STREAMING_STORE_FUNCTIONS = {
+        np.dtype(np.int32): ("_mm_stream_si32", "int"),
+        np.dtype(np.uint32): ("_mm_stream_si32", "int"),
+        np.dtype(np.int64): ("_mm_stream_si64", "long long"),
+        np.dtype(np.uint64): ("_mm_stream_si64", "long long"),
+        np.dtype(np.float32): ("loopy_stream_float32", None),
+        np.dtype(np.float64): ("loopy_stream_float64", None),
+        }
+
+
 class _ConstRestrictPointer(Pointer):
     def get_decl_pair(self):
         sub_tp, sub_decl = self.subdecl.get_decl_pair()
@@ -895,6 +939,8 @@ class CFamilyASTBuilder(ASTBuilderBase[Generable]):
         return (
                 [*super().preamble_generators(),
                     lambda preamble_info: _preamble_generator(
+                          preamble_info, self.preamble_function_qualifier),
+                    lambda preamble_info: _streaming_store_preamble_generator(
                           preamble_info, self.preamble_function_qualifier)])
 
     @property
@@ -958,6 +1004,14 @@ class CFamilyASTBuilder(ASTBuilderBase[Generable]):
         if not isinstance(function_body, Block):
             function_body = Block([function_body])
 
+        if (codegen_state.is_generating_device_code
+                and self._subkernel_has_streaming_stores(kernel, schedule_index)):
+            # non-temporal stores are weakly ordered, make them visible
+            # before returning
+            function_body = Block([
+                *function_body.contents,
+                self.get_streaming_store_fence()])
+
         fbody = FunctionBody(function_decl, function_body)
 
         if not result:
@@ -1310,12 +1364,15 @@ class CFamilyASTBuilder(ASTBuilderBase[Generable]):
             lhs_dtype = to_loopy_type(lhs_dtype.numpy_dtype[insn.assignee.name])
 
         if lhs_atomicity is None:
+            rhs_code = ecm(insn.expression, prec=PREC_NONE,
+                    type_context=rhs_type_context,
+                    needed_dtype=lhs_dtype)
+
+            if self._is_streaming_store(kernel, insn):
+                return self.emit_streaming_store(lhs_dtype, lhs_code, rhs_code)
+
             from cgen import Assign
-            return Assign(
-                    lhs_code,
-                    ecm(insn.expression, prec=PREC_NONE,
-                        type_context=rhs_type_context,
-                        needed_dtype=lhs_dtype))
+            return Assign(lhs_code, rhs_code)
 
         elif isinstance(lhs_atomicity, AtomicInit):
             assert isinstance(lhs_dtype, AtomicType)
@@ -1337,6 +1394,123 @@ class CFamilyASTBuilder(ASTBuilderBase[Generable]):
             raise ValueError("unexpected lhs atomicity type: %s"
                     % type(lhs_atomicity).__name__)
 
+    # {{{ streaming stores
+
+    def _is_streaming_store(self, kernel: LoopKernel, insn: Assignment) -> bool:
+        """Returns whether the store of *insn* is realized using a non-temporal
+        store, which is the case if *insn* is tagged with
+        :class:`~loopy.UseStreamingStoreTag`, the target has
+        :attr:`CFamilyTarget.streaming_stores` set, and the store is to a
+        global array of a supported type which is contiguous along the
+        innermost loop around *insn*.
+        """
+        from loopy.kernel.instruction import UseStreamingStoreTag
+
+        style = self.target.streaming_stores
+        if style is None or UseStreamingStoreTag() not in insn.tags:
+            return False
+
+        if (not isinstance(insn.assignee, p.Subscript)
+                or any(atomicity.var_name == insn.assignee_var_names()[0]
+                       for atomicity in insn.atomicity)):
+            return False
+
+        ary = kernel.get_var_descriptor(insn.assignee_var_names()[0])
+        if (not isinstance(ary, ArrayBase)
+                or ary.address_space != AddressSpace.GLOBAL
+                or ary.dim_tags is None
+                or not all(isinstance(dim_tag, FixedStrideArrayDimTag)
+                           for dim_tag in ary.dim_tags)
+                or not isinstance(ary.dtype, NumpyType)
+                or ary.dtype.is_complex()):
+            return False
+
+        if (style == "sse2"
+                and ary.dtype.numpy_dtype not in _SSE2_STREAMING_STORE_FUNCTIONS):
+            return False
+
+        # {{{ find innermost loop around insn
+
+        from loopy.schedule import EnterLoop, LeaveLoop, RunInstruction
+
+        assert kernel.linearization is not None
+        active_inames: list[str] = []
+        for sched_item in kernel.linearization:
+            if isinstance(sched_item, EnterLoop):
+                active_inames.append(sched_item.iname)
+            elif isinstance(sched_item, LeaveLoop):
+                active_inames.pop()
+            elif (isinstance(sched_item, RunInstruction)
+                    and sched_item.insn_id == insn.id):
+                break
+
+        # }}}
+
+        if not active_inames:
+            return False
+
+        from loopy.statistics import _get_iname_strides
+        stride = _get_iname_strides(
+                kernel, ary, insn.assignee.index_tuple,
+                [active_inames[-1]])[active_inames[-1]]
+
+        return stride == 1
+
+    def _subkernel_has_streaming_stores(
+                self, kernel: LoopKernel, schedule_index: int) -> bool:
+        from loopy.schedule import RunInstruction
+        from loopy.schedule.tools import get_block_boundaries
+
+        assert kernel.linearization is not None
+        end_index = get_block_boundaries(kernel.linearization)[schedule_index]
+
+        return any(
+                self._is_streaming_store(kernel, insn)
+                for sched_item in kernel.linearization[schedule_index:end_index]
+                if isinstance(sched_item, RunInstruction)
+                for insn in [kernel.id_to_insn[sched_item.insn_id]]
+                if isinstance(insn, Assignment))
+
+    def emit_streaming_store(self,
+                dtype: LoopyType,
+                lhs_code: Expression,
+                rhs_code: Expression
+            ) -> Generable:
+        """Returns a statement storing *rhs_code* into *lhs_code* using a
+        non-temporal store.
+        """
+        from cgen import Statement
+
+        if self.target.streaming_stores == "builtin":
+            return Statement(f"__builtin_nontemporal_store({rhs_code}, &{lhs_code})")
+
+        elif self.target.streaming_stores == "sse2":
+            assert isinstance(dtype, NumpyType)
+            func_name, ptr_ctype = _SSE2_STREAMING_STORE_FUNCTIONS[
+                    dtype.numpy_dtype]
+            if ptr_ctype is not None:
+                return Statement(
+                        f"{func_name}(({ptr_ctype} *) &{lhs_code}, {rhs_code})")
+            else:
+                return Statement(f"{func_name}(&{lhs_code}, {rhs_code})")
+
+        else:
+            raise LoopyError("unsupported streaming store style: "
+                    f"'{self.target.streaming_stores}'")
+
+    def get_streaming_store_fence(self) -> Generable:
+        """Returns a statement ordering the preceding non-temporal stores before
+        all later stores.
+        """
+        from cgen import Statement
+
+        if self.target.streaming_stores == "sse2":
+            return Statement("_mm_sfence()")
+        else:
+            return Statement("__atomic_thread_fence(__ATOMIC_SEQ_CST)")
+
+    # }}}
+
     def emit_tuple_assignment(self,
                 codegen_state: CodeGenerationState,
                 insn: MultiAssignmentBase,
@@ -1406,28 +1580,60 @@ class CFamilyASTBuilder(ASTBuilderBase[Generable]):
                 ubound: Expression,
                 inner: Generable,
                 hints: Sequence[Generable],
+                induction_variables: Sequence[
+                    tuple[str, LoopyType, Expression, Expression]] = (),
             ) -> Generable:
         ecm = codegen_state.expression_to_code_mapper
 
-        from cgen import For, InlineInitializer, Line
+        from cgen import For, Initializer, InlineInitializer, Line
         from pymbolic import var
         from pymbolic.mapper.stringifier import PREC_NONE
         from pymbolic.primitives import Comparison
 
+        start = InlineInitializer(
+                POD(self, iname_dtype, iname),
+                ecm(lbound, PREC_NONE, "i"))
+        update = "++%s" % iname
+
+        # induction variables sharing the iname's type are declared in the
+        # same initialization statement, others ahead of the loop
+        header_variables = [
+                (name, initial_value)
+                for name, dtype, initial_value, _ in induction_variables
+                if dtype == iname_dtype]
+        declarations = [
+                Initializer(
+                    POD(self, dtype, name),
+                    ecm(initial_value, PREC_NONE, "i"))
+                for name, dtype, initial_value, _ in induction_variables
+                if dtype != iname_dtype]
+
+        if header_variables:
+            start = Line(", ".join([
+                str(start),
+                *(f"{name} = {ecm(initial_value, PREC_NONE, 'i')}"
+                  for name, initial_value in header_variables)]))
+
+        if induction_variables:
+            update = ", ".join([
+                update,
+                *(f"{name} += {ecm(increment, PREC_NONE, 'i')}"
+                  for name, _, _, increment in induction_variables)])
+
         loop = For(
-                InlineInitializer(
-                    POD(self, iname_dtype, iname),
-                    ecm(lbound, PREC_NONE, "i")),
+                start,
                 ecm(
                     Comparison(
                         var(iname),
                         "<=",
                         ubound),
                     PREC_NONE, "i"),
-                Line("++%s" % iname),
+                Line(update),
                 inner)
 
-        if hints:
+        if declarations:
+            return Block([*declarations, *hints, loop])
+        elif hints:
             return Collection([*list(hints), loop])
         else:
             return loop
@@ -1461,6 +1667,11 @@ class CFamilyASTBuilder(ASTBuilderBase[Generable]):
         from cgen import Line
         return Line(f"; /*{s}*/")
 
+    @property
+    @override
+    def can_implement_induction_variables(self):
+        return True
+
     @property
     def can_implement_conditionals(self):
         return True
@@ -1544,6 +1755,27 @@ class CTarget(CFamilyTarget):
     see :class:`CFamilyTarget`.
     """
 
+    hash_fields = (*CFamilyTarget.hash_fields, "streaming_stores")
+    comparison_fields = (*CFamilyTarget.comparison_fields, "streaming_stores")
+
+    def __init__(self, fortran_abi=False, streaming_stores=None):
+        """
+        :arg streaming_stores: If not *None*, stores of instructions tagged
+            with :class:`~loopy.UseStreamingStoreTag` to global arrays that are
+            contiguous along the innermost loop around the instruction are
+            realized as non-temporal stores, followed by a fence at the end
+            of the kernel. One of ``"builtin"`` (using
+            ``__builtin_nontemporal_store``, as supported by Clang) or
+            ``"sse2"`` (using SSE2 intrinsics on x86-64, for 32- and 64-bit
+            integer and floating point types).
+        """
+        if streaming_stores not in [None, "builtin", "sse2"]:
+            raise ValueError(
+                    f"unsupported streaming store style: '{streaming_stores}'")
+
+        super().__init__(fortran_abi=fortran_abi)
+        self.streaming_stores = streaming_stores
+
     @override
     def get_device_ast_builder(self):
         return CASTBuilder(self)
@@ -1568,6 +1800,53 @@ class CASTBuilder(CFamilyASTBuilder):
         return (
                 [*super().preamble_generators(), c99_preamble_generator])
 
+    @override
+    def emit_openmp_parallel_hint(self, codegen_state, iname):
+        """Returns a ``#pragma omp parallel for`` directive for the loop over
+        *iname*. Accumulators of reductions over *iname* (see
+        :class:`~loopy.OpenMPReductionTag`) are listed in ``reduction``
+        clauses. Temporaries (which are declared at the top of the function)
+        that are only accessed within the loop are made ``private``.
+        """
+        from cgen import Pragma
+
+        from loopy.kernel.data import AddressSpace
+        from loopy.kernel.instruction import OpenMPReductionTag
+
+        kernel = codegen_state.kernel
+        loop_insn_ids = {insn.id for insn in kernel.instructions
+                if iname in kernel.insn_inames(insn)}
+
+        operator_to_vars: dict[str, set[str]] = {}
+        for insn_id in loop_insn_ids:
+            insn = kernel.id_to_insn[insn_id]
+            for tag in insn.tags_of_type(OpenMPReductionTag):
+                if iname in tag.inames:
+                    operator_to_vars.setdefault(tag.operator, set()).update(
+                            insn.assignee_var_names())
+
+        reduction_vars = frozenset().union(*operator_to_vars.values())
+
+        reader_map = kernel.reader_map()
+        writer_map = kernel.writer_map()
+
+        private_vars = sorted(
+                name for name, tv in kernel.temporary_variables.items()
+                if tv.address_space != AddressSpace.GLOBAL
+                and not tv.base_storage
+                and name not in reduction_vars
+                and writer_map.get(name, set()) & loop_insn_ids
+                and (reader_map.get(name, set())
+                     | writer_map.get(name, set())) <= loop_insn_ids)
+
+        clauses = [
+                "reduction({}:{})".format(operator, ", ".join(sorted(names)))
+                for operator, names in sorted(operator_to_vars.items())]
+        if private_vars:
+            clauses.append("private({})".format(", ".join(private_vars)))
+
+        return Pragma(" ".join(["omp parallel for", *clauses]))
+
 # }}}
 
 
@@ -1581,8 +1860,9 @@ class ExecutableCTarget(CTarget):
     """
     An executable CFamilyTarget that uses (by default) JIT compilation of C-code
     """
-    def __init__(self, compiler=None, fortran_abi=False):
-        super().__init__(fortran_abi=fortran_abi)
+    def __init__(self, compiler=None, fortran_abi=False, streaming_stores=None):
+        super().__init__(fortran_abi=fortran_abi,
+                         streaming_stores=streaming_stores)
         from loopy.target.c.c_execution import CCompiler
         self.compiler = compiler or CCompiler()
 
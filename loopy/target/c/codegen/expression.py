@@ -316,11 +316,21 @@ class ExpressionToCExpressionMapper(IdentityMapper[[str]]):
 
             else:
                 subscript, = access_info.subscripts
+
+                strength_reduced_name = (
+                        self.codegen_state.strength_reduced_subscripts.get(
+                            subscript))
+                if strength_reduced_name is not None:
+                    # maintained incrementally by the enclosing loop
+                    subscript_code = var(strength_reduced_name)
+                else:
+                    subscript_code = simplify_using_aff(
+                            self.kernel, self.rec_arith(subscript, "i"))
+
                 result = self.make_subscript(
                         ary,
                         make_var(access_info.array_name),
-                        simplify_using_aff(
-                            self.kernel, self.rec_arith(subscript, "i")))
+                        subscript_code)
 
             if access_info.vector_index is not None:
                 return self.codegen_state.ast_builder.add_vector_access(
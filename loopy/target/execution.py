@@ -943,6 +943,152 @@ class ExecutorBase:
 
 # }}}
 
+
+# {{{ value-specializing executor
+
+class ValueSpecializingExecutor(ExecutorBase):
+    """An executor that specializes the entrypoint on frequently observed
+    values of some of its integer :class:`~loopy.ValueArg` arguments. Create
+    these objects by passing *specialize_on* to
+    :meth:`loopy.TranslationUnit.executor`.
+
+    Calls are counted by the values of the arguments in *specialize_on*.
+    Once a combination of values has been seen *specialization_threshold*
+    times, a variant of the entrypoint with these values fixed (see
+    :func:`loopy.fix_parameters`) is compiled and used for all subsequent
+    calls with the same values. This makes trip counts depending on these
+    arguments known to the compiler. Calls with other values, or that do not
+    pass all arguments in *specialize_on* explicitly, use the generic
+    entrypoint.
+
+    At most *max_specializations* variants are compiled. Once that many
+    exist, calls are no longer counted.
+
+    .. attribute:: generic_executor
+
+        The executor for the unspecialized entrypoint.
+
+    .. attribute:: specialized_executors
+
+        A mapping from tuples of values of the arguments in *specialize_on*
+        to the executors of the corresponding specialized variants.
+
+    .. automethod:: __call__
+    """
+
+    def __init__(self, t_unit: TranslationUnit, entrypoint: str,
+                 executor_args: tuple[Any, ...],
+                 executor_kwargs: Mapping[str, Any],
+                 specialize_on: Sequence[str],
+                 specialization_threshold: int = 10,
+                 max_specializations: int = 8):
+        super().__init__(t_unit, entrypoint)
+
+        from loopy.kernel.data import ValueArg
+        from loopy.types import NumpyType
+
+        kernel = t_unit[entrypoint]
+        for name in specialize_on:
+            arg = kernel.arg_dict.get(name)
+            if not isinstance(arg, ValueArg):
+                raise LoopyError(f"cannot specialize on '{name}': "
+                        f"not a value argument of '{entrypoint}'")
+            if (isinstance(arg.dtype, NumpyType)
+                    and arg.dtype.numpy_dtype.kind not in "iu"):
+                raise LoopyError(f"cannot specialize on '{name}': "
+                        "not an integer argument")
+
+        if specialization_threshold < 1:
+            raise LoopyError("specialization_threshold must be positive")
+
+        self.specialize_on = tuple(specialize_on)
+        self.specialization_threshold = specialization_threshold
+        self.max_specializations = max_specializations
+
+        self.executor_args = executor_args
+        self.executor_kwargs = executor_kwargs
+
+        self.generic_executor = t_unit.target.get_kernel_executor(
+                t_unit, *executor_args, entrypoint=entrypoint, **executor_kwargs)
+        self.specialized_executors: dict[tuple[int, ...], ExecutorBase] = {}
+        self.value_counts: dict[tuple[int, ...], int] = {}
+
+    def _get_specialized_values(self, kwargs) -> tuple[int, ...] | None:
+        import numpy as np
+
+        values = []
+        for name in self.specialize_on:
+            value = kwargs.get(name)
+            if (not isinstance(value, (int, np.integer))
+                    or isinstance(value, (bool, np.bool_))):
+                return None
+            values.append(int(value))
+
+        return tuple(values)
+
+    def get_specialized_translation_unit(
+            self, values: tuple[int, ...]) -> TranslationUnit:
+        """Returns :attr:`t_unit` with the arguments in *specialize_on* of
+        the entrypoint fixed to *values*.
+        """
+        from loopy.transform.parameter import fix_parameters
+
+        return self.t_unit.with_kernel(
+                fix_parameters(self.t_unit[self.entrypoint],
+                               **dict(zip(self.specialize_on, values,
+                                          strict=True))))
+
+    def _get_specialized_executor(
+            self, values: tuple[int, ...]) -> ExecutorBase | None:
+        try:
+            return self.specialized_executors[values]
+        except KeyError:
+            pass
+
+        if len(self.specialized_executors) >= self.max_specializations:
+            # no further variants will be compiled, stop counting
+            self.value_counts.clear()
+            return None
+
+        count = self.value_counts.get(values, 0) + 1
+        if count < self.specialization_threshold:
+            self.value_counts[values] = count
+            return None
+
+        logger.info("%s: specializing on %s", self.entrypoint,
+                ", ".join(f"{name}={value}"
+                          for name, value in zip(self.specialize_on, values,
+                                                 strict=True)))
+
+        t_unit = self.get_specialized_translation_unit(values)
+        executor = t_unit.target.get_kernel_executor(
+                t_unit, *self.executor_args, entrypoint=self.entrypoint,
+                **self.executor_kwargs)
+
+        self.specialized_executors[values] = executor
+        self.value_counts.pop(values, None)
+
+        return executor
+
+    def __call__(self, *args, **kwargs):
+        """Calls the specialized variant matching the values passed for the
+        arguments in *specialize_on* if one exists (or has become due), and
+        the generic entrypoint otherwise. Takes the same arguments as the
+        :meth:`ExecutorBase.__call__` of the target's executor.
+        """
+        values = self._get_specialized_values(kwargs)
+        if values is not None:
+            executor = self._get_specialized_executor(values)
+            if executor is not None:
+                for name in self.specialize_on:
+                    del kwargs[name]
+
+                return executor(*args, **kwargs)
+
+        return self.generic_executor(*args, **kwargs)
+
+# }}}
+
 # {{{ code highlighters
 
 
@@ -540,6 +540,11 @@ class ISPCASTBuilder(CFamilyASTBuilder):
         from cgen import Assign
         return Assign(ecm(lhs, prec=PREC_NONE, type_context=None), rhs_code)
 
+    @property
+    @override
+    def can_implement_induction_variables(self):
+        return False
+
     @override
     def emit_sequential_loop(self,
                 codegen_state: CodeGenerationState,
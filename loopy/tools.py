@@ -23,6 +23,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 import collections.abc as abc
+import contextlib
 import logging
 from functools import cached_property
 from sys import intern
@@ -45,6 +46,8 @@ from .symbolic import (
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from numpy.typing import DTypeLike, NDArray
 
     from loopy.kernel import LoopKernel
@@ -60,6 +63,8 @@ V = TypeVar("V")
 
 
 T_co = TypeVar("T_co", covariant=True)
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 def update_persistent_hash(obj, key_hash, key_builder):
@@ -645,6 +650,60 @@ def intern_frozenset_of_ids(fs: abc.Iterable[str]) -> frozenset[str]:
     return frozenset(intern(s) for s in fs)
 
 
+# {{{ record helpers
+
+def get_record_copy_kwargs(
+            record: object, kwargs: dict[str, object]) -> dict[str, object]:
+    """Fills *kwargs* with the values of the :attr:`fields` of the
+    :class:`pytools.ImmutableRecord` *record* that are not already present.
+    Equivalent to :meth:`pytools.Record.get_copy_kwargs`, but reads the fields
+    from the instance dictionary first, which makes copying records with many
+    fields (such as instructions and variables) considerably cheaper.
+    """
+    instance_dict = record.__dict__
+    for f in type(record).fields:  # pyright: ignore[reportAttributeAccessIssue]
+        if f not in kwargs:
+            try:
+                kwargs[f] = instance_dict[f]
+            except KeyError:
+                with contextlib.suppress(AttributeError):
+                    kwargs[f] = getattr(record, f)
+
+    return kwargs
+
+
+def memoize_nullary_method(method: Callable[[T], R]) -> Callable[[T], R]:
+    """Like :func:`pytools.memoize_method`, but only for methods without
+    arguments. The result is stored in a single attribute of the instance
+    rather than in a per-instance dictionary, which keeps the footprint of
+    objects that exist in large numbers (such as instructions) small.
+
+    Supports cache deletion via ``method_name.clear_cache(self)``. The name of
+    the attribute is available as ``method_name.attr_name``.
+    """
+    attr_name = intern(f"_memoized_{method.__name__}")
+
+    def wrapper(obj: T) -> R:
+        try:
+            return obj.__dict__[attr_name]
+        except KeyError:
+            result = method(obj)
+            obj.__dict__[attr_name] = result
+            return result
+
+    def clear_cache(obj: T) -> None:
+        obj.__dict__.pop(attr_name, None)
+
+    from functools import update_wrapper
+    new_wrapper = update_wrapper(wrapper, method)
+    new_wrapper.clear_cache = clear_cache  # pyright: ignore[reportFunctionMemberAccess]
+    new_wrapper.attr_name = attr_name  # pyright: ignore[reportFunctionMemberAccess]
+
+    return new_wrapper
+
+# }}}
+
+
 # {{{ t_unit_to_python
 
 def _is_generated_t_unit_the_same(python_code, var_name, ref_t_unit):
@@ -908,6 +967,9 @@ def clear_in_mem_caches() -> None:
     for cache in caches:
         cache.clear_in_mem_cache()
 
+    from loopy.kernel.tools import get_set_operation_cache_manager
+    get_set_operation_cache_manager().clear()
+
 # }}}
 
 
@@ -88,8 +88,7 @@ def add_barrier(
         id = kernel.make_unique_instruction_id(based_on=id_based_on)
 
     match = parse_match(insn_before)
-    depends_on = frozenset(
-        [insn.id for insn in kernel.instructions if match(kernel, insn)])
+    depends_on = match.get_matching_insn_ids(kernel)
 
     barrier_to_add = BarrierInstruction(depends_on=depends_on,
                                         depends_on_is_final=True,
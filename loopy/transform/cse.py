@@ -0,0 +1,375 @@
+from __future__ import annotations
+
+
+__copyright__ = "Copyright (C) 2026 agent"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+
+import logging
+from collections import Counter
+from typing import TYPE_CHECKING
+
+import pymbolic.primitives as p
+
+from loopy.diagnostic import LoopyError
+from loopy.kernel.data import AddressSpace, Assignment, TemporaryVariable
+from loopy.symbolic import (
+    SubstitutionRuleExpander,
+    UncachedIdentityMapper,
+    UncachedWalkMapper,
+    get_dependencies,
+)
+from loopy.translation_unit import for_each_kernel
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from loopy.kernel import LoopKernel
+    from loopy.match import ToMatchConvertible
+    from loopy.typing import Expression
+
+
+logger = logging.getLogger(__name__)
+
+
+__doc__ = """
+.. currentmodule:: loopy
+
+.. autofunction:: eliminate_common_subexpressions
+"""
+
+
+# {{{ subexpression analysis
+
+class _FlopCounter(UncachedWalkMapper[[]]):
+    """Counts the arithmetic operations in an expression, not including those
+    in array indices.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.nflops = 0
+
+    def visit(self, expr: Expression) -> bool:
+        if isinstance(expr, (p.Sum, p.Product)):
+            self.nflops += len(expr.children) - 1
+        elif isinstance(expr, (
+                p.Quotient, p.FloorDiv, p.Remainder, p.Power, p.Call)):
+            self.nflops += 1
+
+        return True
+
+    def map_subscript(self, expr: p.Subscript) -> None:
+        pass
+
+
+def _count_flops(expr: Expression) -> int:
+    counter = _FlopCounter()
+    counter(expr)
+    return counter.nflops
+
+
+class _SubexpressionCounter(UncachedWalkMapper[[]]):
+    """Counts the occurrences of arithmetic subexpressions outside of array
+    indices and reductions, and records those that are evaluated
+    unconditionally, i.e. not only in a branch of an :class:`pymbolic.primitives.If`
+    or in a short-circuited operand of a logical operator.
+    """
+
+    def __init__(self,
+                 counts: Counter[Expression],
+                 unconditional: set[Expression]) -> None:
+        super().__init__()
+        self.counts = counts
+        self.unconditional = unconditional
+        self.conditional_depth = 0
+
+    def visit(self, expr: Expression) -> bool:
+        if isinstance(expr, (
+                p.Sum, p.Product, p.Quotient, p.FloorDiv, p.Remainder, p.Power,
+                p.Call)):
+            self.counts[expr] += 1
+            if not self.conditional_depth:
+                self.unconditional.add(expr)
+
+        return True
+
+    def rec_conditional(self, exprs: tuple[Expression, ...]) -> None:
+        self.conditional_depth += 1
+        for expr in exprs:
+            self.rec(expr)
+        self.conditional_depth -= 1
+
+    def map_if(self, expr: p.If) -> None:
+        if not self.visit(expr):
+            return
+
+        self.rec(expr.condition)
+        self.rec_conditional((expr.then, expr.else_))
+
+    def map_short_circuit(self, expr: p.LogicalAnd | p.LogicalOr) -> None:
+        if not self.visit(expr):
+            return
+
+        self.rec(expr.children[0])
+        self.rec_conditional(expr.children[1:])
+
+    map_logical_and = map_short_circuit
+    map_logical_or = map_short_circuit
+
+    def map_subscript(self, expr: p.Subscript) -> None:
+        pass
+
+    def map_reduction(self, expr, *args, **kwargs) -> None:
+        pass
+
+
+def _count_subexpressions(
+        expr: Expression) -> tuple[Counter[Expression], set[Expression]]:
+    """Returns the occurrence counts of the subexpressions of *expr* and the
+    set of those evaluated unconditionally.
+    """
+    counts: Counter[Expression] = Counter()
+    unconditional: set[Expression] = set()
+    _SubexpressionCounter(counts, unconditional)(expr)
+    return counts, unconditional
+
+
+class _SubexpressionReplacer(UncachedIdentityMapper[[]]):
+    def __init__(self, replacements: Mapping[Expression, Expression]) -> None:
+        super().__init__()
+        self.replacements = replacements
+
+    def rec(self, expr: Expression) -> Expression:
+        try:
+            return self.replacements[expr]
+        except (KeyError, TypeError):
+            return super().rec(expr)
+
+    def map_subscript(self, expr: p.Subscript) -> Expression:
+        return expr
+
+    def map_reduction(self, expr, *args, **kwargs) -> Expression:
+        return expr
+
+# }}}
+
+
+# {{{ eliminate_common_subexpressions
+
+@for_each_kernel
+def eliminate_common_subexpressions(
+            kernel: LoopKernel,
+            within: ToMatchConvertible = None,
+            min_flops: int = 1,
+            max_temporaries: int | None = None) -> LoopKernel:
+    """Computes arithmetic subexpressions that occur more than once in the
+    :class:`~loopy.Assignment` instructions matching *within* only once,
+    storing them in temporaries.
+
+    Occurrences are only merged within instructions that share their
+    :attr:`~loopy.InstructionBase.within_inames` and
+    :attr:`~loopy.InstructionBase.predicates`, and only if the variables read
+    by the subexpression are written only by instructions on which all
+    instructions containing it depend. Each eliminated subexpression becomes
+    a new instruction assigning a private scalar temporary, which depends on
+    the writers of the variables it reads. The instructions containing the
+    subexpression are made to depend on it.
+
+    Subexpressions are matched structurally. Those saving the most operations
+    are eliminated first, larger ones taking precedence among equal savings.
+    Subexpressions of array indices and of reductions are not considered.
+    Subexpressions occurring only in a branch of an :class:`~pymbolic.primitives.If`
+    or in a short-circuited operand of a logical operator in some instruction
+    are not eliminated, as they may be undefined when not evaluated.
+    Substitution rules invoked by an instruction are expanded in the
+    instruction if anything is replaced in it.
+
+    :arg within: a match expression as understood by
+        :func:`loopy.match.parse_match` selecting the instructions to consider.
+    :arg min_flops: the minimal number of arithmetic operations a
+        subexpression must contain to be eliminated.
+    :arg max_temporaries: if not *None*, the maximal number of temporaries
+        introduced for each set of instructions sharing their inames and
+        predicates, to bound the increase in register pressure.
+    """
+    from loopy.kernel import KernelState
+    if kernel.state >= KernelState.LINEARIZED:
+        raise LoopyError("eliminate_common_subexpressions cannot be applied to "
+                "a linearized kernel")
+
+    if min_flops < 1:
+        raise LoopyError("min_flops must be positive")
+
+    from loopy.match import parse_match
+    within = parse_match(within)
+
+    writer_map = {name: set(writer_ids)
+                  for name, writer_ids in kernel.writer_map().items()}
+    recursive_insn_dep_map = dict(kernel.recursive_insn_dep_map())
+    var_name_gen = kernel.get_var_name_generator()
+    insn_id_gen = kernel.get_instruction_id_generator()
+    expand_rules = SubstitutionRuleExpander(kernel.substitutions)
+
+    insns = list(kernel.instructions)
+    expanded_expressions: dict[str, Expression] = {}
+
+    groups: dict[tuple, list[str]] = {}
+    matching_insn_ids = within.get_matching_insn_ids(kernel)
+    for insn in insns:
+        if isinstance(insn, Assignment) and insn.id in matching_insn_ids:
+            groups.setdefault(
+                    (insn.within_inames, insn.predicates), []).append(insn.id)
+            expanded_expressions[insn.id] = expand_rules(insn.expression)
+
+    new_temporaries: dict[str, TemporaryVariable] = {}
+
+    def is_available_to(expr: Expression, user_ids: list[str]) -> bool:
+        for name in get_dependencies(expr):
+            for writer_id in writer_map.get(name, ()):
+                if not all(writer_id in recursive_insn_dep_map[user_id]
+                           for user_id in user_ids):
+                    return False
+        return True
+
+    for (within_inames, predicates), group_insn_ids in groups.items():
+        ntemporaries = 0
+        while max_temporaries is None or ntemporaries < max_temporaries:
+            # {{{ find the most profitable subexpression
+
+            insn_id_to_counts = {}
+            insn_id_to_unconditional = {}
+            for insn_id in group_insn_ids:
+                insn_id_to_counts[insn_id], insn_id_to_unconditional[insn_id] = (
+                        _count_subexpressions(expanded_expressions[insn_id]))
+            counts: Counter[Expression] = sum(
+                    insn_id_to_counts.values(), Counter())
+
+            best_expr = None
+            best_key = None
+            best_user_ids: list[str] = []
+            for expr, count in counts.items():
+                if count < 2 or not get_dependencies(expr):
+                    continue
+
+                nflops = _count_flops(expr)
+                if nflops < min_flops:
+                    continue
+
+                key = ((count - 1)*nflops, nflops)
+                if best_key is not None and key <= best_key:
+                    continue
+
+                user_ids = [
+                    insn_id for insn_id in group_insn_ids
+                    if expr in insn_id_to_counts[insn_id]]
+
+                # The temporary is computed ahead of its users, so only
+                # subexpressions that every user would evaluate regardless
+                # may be hoisted into it.
+                if not all(expr in insn_id_to_unconditional[insn_id]
+                           for insn_id in user_ids):
+                    continue
+
+                if not is_available_to(
+                        p.LogicalAnd((expr, *predicates)), user_ids):
+                    continue
+
+                best_expr = expr
+                best_key = key
+                best_user_ids = user_ids
+
+            if best_expr is None:
+                break
+
+            # }}}
+
+            # {{{ compute it in a new instruction
+
+            name = var_name_gen("cse")
+            new_temporaries[name] = TemporaryVariable(
+                    name=name,
+                    dtype=None,
+                    shape=(),
+                    address_space=AddressSpace.PRIVATE)
+
+            replacer = _SubexpressionReplacer({best_expr: p.Variable(name)})
+            user_ids = best_user_ids
+
+            depends_on = frozenset().union(*(
+                writer_map.get(dep, ())
+                for dep in get_dependencies(
+                    p.LogicalAnd((best_expr, *predicates)))))
+
+            new_insn = Assignment(
+                    id=insn_id_gen("cse"),
+                    assignee=p.Variable(name),
+                    expression=best_expr,
+                    within_inames=within_inames,
+                    depends_on=depends_on,
+                    predicates=predicates)
+
+            first_user_index = min(
+                    i for i, insn in enumerate(insns) if insn.id in user_ids)
+            insns.insert(first_user_index, new_insn)
+
+            writer_map[name] = {new_insn.id}
+            recursive_insn_dep_map[new_insn.id] = frozenset(depends_on).union(
+                    *(recursive_insn_dep_map[dep_id] for dep_id in depends_on))
+            expanded_expressions[new_insn.id] = best_expr
+            group_insn_ids.append(new_insn.id)
+
+            for insn_id in user_ids:
+                expanded_expressions[insn_id] = replacer(
+                        expanded_expressions[insn_id])
+                recursive_insn_dep_map[insn_id] = (
+                        recursive_insn_dep_map[insn_id]
+                        | {new_insn.id}
+                        | recursive_insn_dep_map[new_insn.id])
+
+            insns = [
+                insn.copy(
+                    expression=expanded_expressions[insn.id],
+                    depends_on=insn.depends_on | {new_insn.id})
+                if insn.id in user_ids else insn
+                for insn in insns]
+
+            ntemporaries += 1
+
+            # }}}
+
+    if not new_temporaries:
+        return kernel
+
+    logger.info("%s: eliminated %d common subexpressions",
+            kernel.name, len(new_temporaries))
+
+    return kernel.copy(
+            instructions=insns,
+            temporary_variables={
+                **kernel.temporary_variables,
+                **new_temporaries})
+
+# }}}
+
+# vim: foldmethod=marker
@@ -444,6 +444,174 @@ def add_prefetch(t_unit: TranslationUnit,
 # }}}
 
 
+# {{{ pack_tile
+
+def _get_innermost_iname(kernel: LoopKernel, inames: Sequence[str]) -> str:
+    """Returns the iname among *inames* that the loop priorities of *kernel*
+    nest innermost, or the last of *inames* if they do not determine one.
+    """
+    candidates = [
+            iname for iname in inames
+            if not any(
+                iname in priority
+                and set(priority[priority.index(iname)+1:]) & set(inames)
+                for priority in kernel.loop_priority)]
+
+    return candidates[-1] if candidates else inames[-1]
+
+
+def _make_axis_contiguous(
+            kernel: LoopKernel, temp_name: str, inner_iname: str) -> LoopKernel:
+    """Tags the axes of the temporary *temp_name* so that the axis indexed by
+    *inner_iname* in the instructions nested in it is the fastest-varying.
+    """
+    from loopy.symbolic import ArrayAccessFinder, get_dependencies
+
+    temp = kernel.temporary_variables[temp_name]
+    assert isinstance(temp.shape, tuple)
+    naxes = len(temp.shape)
+
+    access_finder = ArrayAccessFinder(temp_name)
+    inner_axes = set()
+    for insn in kernel.instructions:
+        if inner_iname not in insn.within_inames | insn.reduction_inames():
+            continue
+
+        for expr in (*insn.assignees, insn.expression):
+            for access in access_finder(expr):
+                for axis, index in enumerate(access.index_tuple):
+                    if inner_iname in get_dependencies(index):
+                        inner_axes.add(axis)
+
+    if len(inner_axes) != 1:
+        return kernel
+
+    inner_axis, = inner_axes
+    axis_order = [axis for axis in range(naxes) if axis != inner_axis]
+    axis_order.append(inner_axis)
+
+    return tag_array_axes(kernel, temp_name, ",".join(
+            f"N{naxes - 1 - axis_order.index(axis)}" for axis in range(naxes)))
+
+
+def pack_tile_for_single_kernel(kernel, callables_table, var_name,
+        sweep_inames, fetch_outer_inames=None, write_back=False,
+        inner_iname=None, alignment=64, within=None):
+    """See :func:`pack_tile` for detailed, user-facing documentation."""
+
+    assert isinstance(kernel, LoopKernel)
+
+    if isinstance(sweep_inames, str):
+        sweep_inames = [s.strip() for s in sweep_inames.split(",")]
+    else:
+        sweep_inames = list(sweep_inames)
+
+    if not sweep_inames:
+        raise LoopyError("pack_tile needs at least one sweep iname")
+
+    if inner_iname is None:
+        inner_iname = _get_innermost_iname(kernel, sweep_inames)
+    elif inner_iname not in sweep_inames:
+        raise LoopyError(f"inner iname '{inner_iname}' is not a sweep iname")
+
+    old_temp_names = set(kernel.temporary_variables)
+
+    if write_back:
+        if fetch_outer_inames is not None:
+            raise LoopyError("pack_tile determines the outer inames itself "
+                    "if write_back is set")
+
+        from loopy.transform.buffer import buffer_array_for_single_kernel
+        kernel = buffer_array_for_single_kernel(kernel, callables_table,
+                var_name, sweep_inames, within=within, default_tag=None,
+                temporary_scope=AddressSpace.PRIVATE)
+    else:
+        kernel = add_prefetch_for_single_kernel(kernel, callables_table,
+                var_name, sweep_inames, default_tag=None,
+                temporary_address_space=AddressSpace.PRIVATE,
+                fetch_outer_inames=fetch_outer_inames, within=within)
+
+    new_temp_names = set(kernel.temporary_variables) - old_temp_names
+    if len(new_temp_names) != 1:
+        raise LoopyError(f"pack_tile failed to buffer '{var_name}'")
+
+    temp_name, = new_temp_names
+
+    if alignment is not None:
+        kernel = kernel.copy(temporary_variables={
+                **kernel.temporary_variables,
+                temp_name: kernel.temporary_variables[temp_name].copy(
+                    alignment=alignment)})
+
+    return _make_axis_contiguous(kernel, temp_name, inner_iname)
+
+
+def pack_tile(t_unit: TranslationUnit,
+              var_name: str,
+              sweep_inames: str | Sequence[str],
+              *,
+              fetch_outer_inames: str | Sequence[str] | None = None,
+              write_back: bool = False,
+              inner_iname: str | None = None,
+              alignment: int | None = 64,
+              within: ToMatchConvertible = None
+          ) -> TranslationUnit:
+    """Copy the tile of *var_name* accessed across *sweep_inames* into a
+    contiguous private temporary before the loops over *sweep_inames*, the
+    way BLAS implementations pack blocks of their operands. Unlike
+    :func:`add_prefetch` with its defaults, this is aimed at CPUs: the copy is
+    performed by sequential loops, and the tile is stored so that the axis
+    indexed by *inner_iname* is contiguous. Accesses in the innermost loop
+    thereby have unit stride even if *var_name* is strided or transposed.
+
+    :arg var_name: the name of the array to pack.
+    :arg sweep_inames: a list of inames, or a comma-separated string of them,
+        whose ranges the tile covers.
+    :arg fetch_outer_inames: the inames within which the copy is performed.
+        If *None*, make an educated guess. Only supported if *write_back* is
+        *False*.
+    :arg write_back: if *True*, *var_name* may be written within the loops
+        over *sweep_inames*, and the tile is copied back after them using
+        :func:`buffer_array`. Otherwise, the tile is packed using
+        :func:`add_prefetch`.
+    :arg inner_iname: the iname of *sweep_inames* whose loop is innermost.
+        Defaults to the one nested innermost by the kernel's loop priorities,
+        or the last of *sweep_inames*.
+    :arg alignment: the alignment of the temporary in bytes, or *None*.
+    :arg within: a stack match as understood by
+        :func:`loopy.match.parse_stack_match` to select the instructions
+        whose accesses to *var_name* are to use the tile.
+    """
+    assert isinstance(t_unit, TranslationUnit)
+
+    new_callables = {}
+    for func_id, in_knl_callable in t_unit.callables_table.items():
+        if isinstance(in_knl_callable, CallableKernel):
+            new_subkernel = pack_tile_for_single_kernel(
+                    in_knl_callable.subkernel, t_unit.callables_table,
+                    var_name=var_name,
+                    sweep_inames=sweep_inames,
+                    fetch_outer_inames=fetch_outer_inames,
+                    write_back=write_back,
+                    inner_iname=inner_iname,
+                    alignment=alignment,
+                    within=within)
+            in_knl_callable = in_knl_callable.copy(
+                    subkernel=new_subkernel)
+
+        elif isinstance(in_knl_callable, ScalarCallable):
+            pass
+        else:
+            raise NotImplementedError("Unknown type of callable %s." % (
+                type(in_knl_callable).__name__))
+
+        new_callables[func_id] = in_knl_callable
+
+    return t_unit.copy(callables_table=constantdict(new_callables))
+
+# }}}
+
+
 # {{{ change variable kinds
 
 @for_each_kernel
@@ -696,7 +864,7 @@ def set_argument_order(kernel, arg_names):
         arg_names = arg_names.split(",")
 
     new_args = []
-    old_arg_dict = kernel.arg_dict.copy()
+    old_arg_dict = dict(kernel.arg_dict)
 
     for arg_name in arg_names:
         try:
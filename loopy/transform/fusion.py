@@ -434,7 +434,7 @@ def fuse_kernels(kernels, suffixes=None, data_flow=None):
 
     # {{{ realize data_flow dependencies
 
-    id_to_insn = result.id_to_insn.copy()
+    id_to_insn = dict(result.id_to_insn)
 
     for var_name, from_kernel, to_kernel in data_flow:
         from_writer_ids = frozenset(
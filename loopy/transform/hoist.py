@@ -0,0 +1,465 @@
+from __future__ import annotations
+
+
+__copyright__ = "Copyright (C) 2026 agent"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+
+import logging
+from typing import TYPE_CHECKING
+
+import pymbolic.primitives as p
+from islpy import dim_type
+
+from loopy.diagnostic import LoopyError
+from loopy.kernel.data import AddressSpace, Assignment, TemporaryVariable
+from loopy.symbolic import (
+    Reduction,
+    SubstitutionRuleExpander,
+    UncachedIdentityMapper,
+    get_dependencies,
+)
+from loopy.translation_unit import TranslationUnit, for_each_kernel
+
+
+if TYPE_CHECKING:
+    from loopy.kernel import LoopKernel
+    from loopy.match import ToMatchConvertible
+    from loopy.typing import Expression
+
+
+logger = logging.getLogger(__name__)
+
+
+__doc__ = """
+.. currentmodule:: loopy
+
+.. autofunction:: hoist_invariants
+"""
+
+
+# {{{ invariant hoisting mapper
+
+_ARITHMETIC_NODE_TYPES = (
+        p.Sum, p.Product, p.Quotient, p.FloorDiv, p.Remainder, p.Power,
+        p.Call, Reduction)
+
+
+class _InvariantHoister(UncachedIdentityMapper[[frozenset[str], frozenset[str]]]):
+    """Replaces subexpressions of an instruction's expression that vary with
+    only some of the loops around their point of evaluation by temporaries
+    assigned in the loops they do vary with.
+
+    The mapper's extra arguments are *scope*, the inames around the point
+    of evaluation (including those of enclosing reductions), and *within*,
+    the inames of the instruction into which the expression is being
+    evaluated. Hoisted assignments may only be placed in a subset of the
+    latter.
+    """
+
+    def __init__(self, kernel: LoopKernel) -> None:
+        super().__init__()
+        self.kernel = kernel
+        self.writer_map = kernel.writer_map()
+        self.recursive_insn_dep_map = kernel.recursive_insn_dep_map()
+        self.var_name_gen = kernel.get_var_name_generator()
+        self.insn_id_gen = kernel.get_instruction_id_generator()
+
+        self.new_temporaries: dict[str, TemporaryVariable] = {}
+
+        # the sets of inames around instructions, from which the admissible
+        # loop nestings are determined
+        self.within_inames_sets = {insn.within_inames for insn in kernel.instructions}
+
+        # per-instruction state, see hoist_from
+        self.insn: Assignment | None = None
+        self.predicate_inames: frozenset[str] = frozenset()
+        self.hoisted_insns: list[Assignment] = []
+        self.hoisted_insn_ids: set[str] = set()
+
+    # {{{ analysis
+
+    def close_over_domain_parameters(self, inames: frozenset[str]) -> frozenset[str]:
+        """Adds the inames on which the loop bounds of *inames* depend."""
+        kernel = self.kernel
+        all_inames = kernel.all_inames()
+
+        result = set(inames)
+        queue = list(inames)
+        while queue:
+            iname = queue.pop()
+            home_domain = kernel.domains[kernel.get_home_domain_index(iname)]
+            for par in home_domain.get_var_names(dim_type.param):
+                if par in all_inames and par not in result:
+                    result.add(par)
+                    queue.append(par)
+
+        return frozenset(result)
+
+    def get_variant_inames(self,
+                expr: Expression, scope: frozenset[str]) -> frozenset[str] | None:
+        """Returns the inames in *scope* with which the value of *expr* may
+        vary, or *None* if *expr* cannot be moved away from the current
+        instruction at all.
+        """
+        assert self.insn is not None
+        kernel = self.kernel
+
+        deps = get_dependencies(expr)
+        variant = set(deps & scope)
+
+        for name in deps:
+            for writer_id in self.writer_map.get(name, ()):
+                # Reading a variable is only safe to move if all of its
+                # writers are known to happen before the instruction.
+                if writer_id not in self.recursive_insn_dep_map[self.insn.id]:
+                    return None
+
+                variant.update(
+                    kernel.id_to_insn[writer_id].within_inames & scope)
+
+        return self.close_over_domain_parameters(frozenset(variant))
+
+    def can_nest(self, outer_inames: frozenset[str],
+                 inner_inames: frozenset[str]) -> bool:
+        """Returns whether the loops over *inner_inames* can be nested inside
+        those over *outer_inames* in every instruction.
+        """
+        for inner_iname in inner_inames:
+            for within_inames in self.within_inames_sets:
+                if (inner_iname in within_inames
+                        and not outer_inames <= within_inames):
+                    return False
+
+        for priority in self.kernel.loop_priority:
+            for i, iname in enumerate(priority):
+                if (iname in inner_inames
+                        and outer_inames & frozenset(priority[i+1:])):
+                    return False
+
+        return True
+
+    def get_hoisting_target(self,
+                expr: Expression,
+                scope: frozenset[str],
+                within: frozenset[str]) -> frozenset[str] | None:
+        """Returns the inames of the loop nest into which *expr* can be
+        hoisted, or *None* if it cannot be hoisted out of *scope*.
+        """
+        if not isinstance(expr, p.ExpressionNode):
+            return None
+        if not get_dependencies(expr):
+            # constant subexpressions are left to the compiler
+            return None
+
+        variant = self.get_variant_inames(expr, scope)
+        if variant is None:
+            return None
+
+        variant = variant | (self.predicate_inames & scope)
+        if (variant <= within
+                and variant != scope
+                and self.can_nest(variant, scope - variant)):
+            return variant
+        else:
+            return None
+
+    # }}}
+
+    # {{{ hoisting
+
+    def hoist(self, expr: Expression, target: frozenset[str]) -> Expression:
+        assert self.insn is not None
+        insn = self.insn
+        kernel = self.kernel
+
+        writer_ids = frozenset().union(*(
+            self.writer_map.get(name, ()) for name in get_dependencies(expr)))
+
+        outer_hoisted_insn_ids = self.hoisted_insn_ids
+        self.hoisted_insn_ids = set()
+        expr = self.rec(expr, target, target)
+        inner_hoisted_insn_ids = self.hoisted_insn_ids
+        self.hoisted_insn_ids = outer_hoisted_insn_ids
+
+        hoisted_out_inames = insn.within_inames - target
+        depends_on = frozenset(
+            dep_id for dep_id in insn.depends_on
+            if not (kernel.id_to_insn[dep_id].within_inames & hoisted_out_inames)
+            ) | writer_ids | inner_hoisted_insn_ids
+
+        name = self.var_name_gen(f"{insn.id}_invariant")
+        self.new_temporaries[name] = TemporaryVariable(
+                name=name,
+                dtype=None,
+                shape=(),
+                address_space=AddressSpace.PRIVATE)
+
+        hoisted_insn = Assignment(
+                id=self.insn_id_gen(f"{insn.id}_invariant"),
+                assignee=p.Variable(name),
+                expression=expr,
+                within_inames=target,
+                depends_on=depends_on,
+                predicates=insn.predicates,
+                tags=insn.tags)
+
+        self.hoisted_insns.append(hoisted_insn)
+        self.within_inames_sets.add(target)
+        self.hoisted_insn_ids.add(hoisted_insn.id)
+
+        return p.Variable(name)
+
+    def hoist_from(self, insn: Assignment) -> list[Assignment]:
+        """Returns *insn* with its invariant subexpressions replaced, preceded
+        by the instructions computing them.
+        """
+        self.insn = insn
+        self.hoisted_insns = []
+        self.hoisted_insn_ids = set()
+
+        predicate_inames = frozenset()
+        for pred in insn.predicates:
+            pred_variant = self.get_variant_inames(pred, insn.within_inames)
+            if pred_variant is None:
+                return [insn]
+            predicate_inames = predicate_inames | pred_variant
+        self.predicate_inames = predicate_inames
+
+        expr = SubstitutionRuleExpander(self.kernel.substitutions)(insn.expression)
+        new_expr = self.rec(expr, insn.within_inames, insn.within_inames)
+
+        if not self.hoisted_insns:
+            return [insn]
+
+        return [
+            *self.hoisted_insns,
+            insn.copy(
+                expression=new_expr,
+                depends_on=insn.depends_on | frozenset(self.hoisted_insn_ids))
+            ]
+
+    # }}}
+
+    # {{{ mapper methods
+
+    def rec(self,
+            expr: Expression,
+            scope: frozenset[str],
+            within: frozenset[str]) -> Expression:
+        if isinstance(expr, _ARITHMETIC_NODE_TYPES):
+            target = self.get_hoisting_target(expr, scope, within)
+            if target is not None:
+                return self.hoist(expr, target)
+
+        return super().rec(expr, scope, within)
+
+    def map_reduction(self,
+                expr: Reduction,
+                scope: frozenset[str],
+                within: frozenset[str]) -> Expression:
+        new_inner = self.rec(expr.expr, scope | frozenset(expr.inames), within)
+        if new_inner is expr.expr:
+            return expr
+
+        return Reduction(expr.operation, tuple(expr.inames), new_inner,
+                allow_simultaneous=expr.allow_simultaneous)
+
+    def map_associative(self,
+                expr: p.Sum | p.Product,
+                scope: frozenset[str],
+                within: frozenset[str]) -> Expression:
+        # Children with a common hoisting target are gathered into a single
+        # hoisted sum or product. This reassociates the operation.
+        children = expr.children
+        targets = [self.get_hoisting_target(child, scope, within)
+                   for child in children]
+
+        replacements: dict[int, Expression | None] = {}
+        remaining = [i for i, target in enumerate(targets) if target is not None]
+        while remaining:
+            group_target = max(
+                    (targets[i] for i in remaining),
+                    key=len)
+            group = [i for i in remaining if targets[i] <= group_target]
+            remaining = [i for i in remaining if i not in group]
+
+            if len(group) < 2:
+                continue
+
+            replacements[group[0]] = self.hoist(
+                    type(expr)(tuple(children[i] for i in group)),
+                    group_target)
+            replacements.update(dict.fromkeys(group[1:]))
+
+        new_children = []
+        for i, child in enumerate(children):
+            if i in replacements:
+                if replacements[i] is not None:
+                    new_children.append(replacements[i])
+            else:
+                new_children.append(self.rec(child, scope, within))
+
+        if len(new_children) == 1:
+            return new_children[0]
+        if all(new_child is child
+               for new_child, child in zip(new_children, children, strict=True)):
+            return expr
+
+        return type(expr)(tuple(new_children))
+
+    map_sum = map_associative
+    map_product = map_associative
+
+    # Only the condition of an 'if' and the first operand of a short-circuiting
+    # operator are evaluated unconditionally. Hoisting code out of the other
+    # operands would evaluate it where the original expression does not,
+    # e.g. a division guarded against a zero divisor.
+
+    def map_if(self,
+                expr: p.If,
+                scope: frozenset[str],
+                within: frozenset[str]) -> Expression:
+        new_condition = self.rec(expr.condition, scope, within)
+        if new_condition is expr.condition:
+            return expr
+
+        return p.If(new_condition, expr.then, expr.else_)
+
+    def map_short_circuit(self,
+                expr: p.LogicalAnd | p.LogicalOr,
+                scope: frozenset[str],
+                within: frozenset[str]) -> Expression:
+        first, *rest = expr.children
+        new_first = self.rec(first, scope, within)
+        if new_first is first:
+            return expr
+
+        return type(expr)((new_first, *rest))
+
+    map_logical_and = map_short_circuit
+    map_logical_or = map_short_circuit
+
+    # }}}
+
+# }}}
+
+
+# {{{ hoist_invariants
+
+@for_each_kernel
+def _hoist_invariants(kernel: LoopKernel, within: ToMatchConvertible) -> LoopKernel:
+    from loopy.kernel import KernelState
+    if kernel.state >= KernelState.LINEARIZED:
+        raise LoopyError("hoist_invariants cannot be applied to "
+                "a linearized kernel")
+
+    from loopy.match import parse_match
+    within = parse_match(within)
+
+    matching_insn_ids = within.get_matching_insn_ids(kernel)
+    hoister = _InvariantHoister(kernel)
+
+    new_insns = []
+    for insn in kernel.instructions:
+        if isinstance(insn, Assignment) and insn.id in matching_insn_ids:
+            new_insns.extend(hoister.hoist_from(insn))
+        else:
+            new_insns.append(insn)
+
+    if not hoister.new_temporaries:
+        return kernel
+
+    logger.info("%s: hoisted %d loop-invariant subexpressions",
+            kernel.name, len(hoister.new_temporaries))
+
+    return kernel.copy(
+            instructions=new_insns,
+            temporary_variables={
+                **kernel.temporary_variables,
+                **hoister.new_temporaries})
+
+
+def _log_op_counts(before: TranslationUnit, after: TranslationUnit) -> None:
+    from loopy.statistics import get_op_map
+
+    for entrypoint in before.entrypoints:
+        # Counting with a sub-group size of one yields per-work-item counts,
+        # which need no knowledge of the device.
+        try:
+            op_count_before = get_op_map(before, subgroup_size=1,
+                    entrypoint=entrypoint).sum()
+            op_count_after = get_op_map(after, subgroup_size=1,
+                    entrypoint=entrypoint).sum()
+        except LoopyError as e:
+            logger.info("%s: could not estimate operation counts: %s",
+                    entrypoint, e)
+        else:
+            logger.info("%s: operation count reduced from %s to %s",
+                    entrypoint, op_count_before, op_count_after)
+
+
+def hoist_invariants(kernel, within: ToMatchConvertible = None):
+    """Moves subexpressions of the :class:`~loopy.Assignment` instructions
+    matching *within* that do not vary with some of the loops around them
+    into temporaries, which are computed in only the loops they do vary with.
+
+    A subexpression is hoisted if it involves arithmetic and depends on
+    neither an iname nor a variable written in one of the loops it is hoisted
+    out of. Variables read by it must be written only by instructions on which
+    the instruction depends, so that moving the read does not change its
+    result. Subexpressions may be hoisted out of reductions, e.g. geometric
+    factors out of a sum over quadrature points. Each hoisted subexpression
+    becomes a new instruction assigning a private scalar temporary. The new
+    instruction inherits the predicates and those dependencies of the original
+    instruction that are not nested in loops it is hoisted out of, and the
+    original instruction is made to depend on it.
+
+    Terms of sums and factors of products that can be hoisted into the same
+    loop nest are hoisted jointly. Like reassociating compiler optimizations,
+    this may change the result of floating point computations within rounding.
+
+    Substitution rules invoked by an instruction are expanded in the
+    instruction if anything is hoisted from it.
+
+    :arg within: a match expression as understood by
+        :func:`loopy.match.parse_match` selecting the instructions from which
+        subexpressions are hoisted.
+
+    If *kernel* is a :class:`~loopy.TranslationUnit` and the logger of this
+    module is enabled for :data:`logging.INFO`, the operation counts as
+    obtained by :func:`~loopy.get_op_map` before and after the
+    transformation are logged as an estimate of the saved work. This requires
+    the types of all variables to be known.
+    """
+    result = _hoist_invariants(kernel, within)
+
+    if (isinstance(kernel, TranslationUnit)
+            and result is not kernel
+            and logger.isEnabledFor(logging.INFO)):
+        _log_op_counts(kernel, result)
+
+    return result
+
+# }}}
+
+# vim: foldmethod=marker
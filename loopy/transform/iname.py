@@ -25,6 +25,7 @@ THE SOFTWARE.
 
 
 from collections.abc import Collection, Iterable, Mapping, Sequence
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any, TypeAlias
 
 from typing_extensions import override
@@ -261,7 +262,8 @@ def _split_iname_backend(
 
     # {{{ return the same kernel if no kernel matches
 
-    if not any(within(kernel, insn) for insn in kernel.instructions):
+    matching_insn_ids = within.get_matching_insn_ids(kernel)
+    if not matching_insn_ids:
         return kernel
 
     # }}}
@@ -305,8 +307,8 @@ def _split_iname_backend(
 
     new_insns = []
     for insn in kernel.instructions:
-        if iname_to_split in insn.within_inames and (
-                within(kernel, insn)):
+        if (iname_to_split in insn.within_inames
+                and insn.id in matching_insn_ids):
             new_within_inames = (
                     (insn.within_inames.copy()
                     - frozenset([iname_to_split]))
@@ -582,7 +584,8 @@ def join_inames(kernel, inames, new_iname=None, tag=None,
 
     # {{{ return the same kernel if no kernel matches
 
-    if not any(within(kernel, insn) for insn in kernel.instructions):
+    matching_insn_ids = within.get_matching_insn_ids(kernel)
+    if not matching_insn_ids:
         return kernel
 
     # }}}
@@ -665,7 +668,7 @@ def join_inames(kernel, inames, new_iname=None, tag=None,
     new_insns = [
             insn.copy(
                 within_inames=subst_within_inames(insn.within_inames)) if
-            within(kernel, insn) else insn for insn in kernel.instructions]
+            insn.id in matching_insn_ids else insn for insn in kernel.instructions]
 
     kernel = (kernel
             .copy(
@@ -1145,16 +1148,19 @@ def has_schedulable_iname_nesting(kernel):
 
 # {{{ remove unused inames
 
+def _get_insn_used_inames(insn):
+    return (insn.within_inames
+            | insn.reduction_inames()
+            | insn.sub_array_ref_inames())
+
+
 def get_used_inames(kernel):
     import loopy as lp
     exp_kernel = lp.expand_subst(kernel)
 
     used_inames = set()
     for insn in exp_kernel.instructions:
-        used_inames.update(
-                insn.within_inames
-                | insn.reduction_inames()
-                | insn.sub_array_ref_inames())
+        used_inames.update(_get_insn_used_inames(insn))
 
     return used_inames
 
@@ -1184,10 +1190,12 @@ def remove_unused_inames(kernel, inames=None):
 
     # }}}
 
-    # {{{ remove them
+    return _project_out_inames(kernel, unused_inames)
+
 
+def _project_out_inames(kernel, inames):
     domains = kernel.domains
-    for iname in sorted(unused_inames):
+    for iname in sorted(inames):
         new_domains = []
 
         for dom in domains:
@@ -1201,11 +1209,68 @@ def remove_unused_inames(kernel, inames=None):
 
         domains = new_domains
 
-    kernel = kernel.copy(domains=domains)
+    return kernel.copy(domains=domains)
 
-    # }}}
 
-    return kernel
+class _UsedInameTracker:
+    """Determines the inames used by kernels within a
+    :class:`loopy.transform.session.TransformationSession`. The inames used
+    by each instruction are remembered, so that only the instructions changed
+    by a transformation are examined anew.
+    """
+
+    def __init__(self) -> None:
+        # maps kernel names to the substitution rules, an expander for them
+        # and a mapping from instruction ids to the instructions last seen
+        # and the inames they use
+        self.kernel_name_to_state: dict[str, tuple[
+            Mapping[str, Any], Any, dict[str, tuple[Any, frozenset[str]]]]] = {}
+
+    def get_used_inames(self, kernel: LoopKernel) -> frozenset[str]:
+        """Returns the same inames as :func:`get_used_inames`."""
+        try:
+            substitutions, expander, insn_id_to_used_inames = (
+                    self.kernel_name_to_state[kernel.name])
+        except KeyError:
+            substitutions = None
+
+        if substitutions is not kernel.substitutions:
+            # mirrors expand_subst
+            from loopy.match import parse_stack_match
+            from loopy.symbolic import RuleAwareSubstitutionRuleExpander
+            expander = RuleAwareSubstitutionRuleExpander(
+                    SubstitutionRuleMappingContext(
+                        kernel.substitutions, kernel.get_var_name_generator()),
+                    kernel.substitutions,
+                    parse_stack_match(None))
+            insn_id_to_used_inames = {}
+
+        new_insn_id_to_used_inames = {}
+        for insn in kernel.instructions:
+            try:
+                old_insn, insn_used_inames = insn_id_to_used_inames[insn.id]
+            except KeyError:
+                old_insn = None
+
+            if old_insn is not insn:
+                exp_insn = insn
+                if kernel.substitutions:
+                    exp_insn = insn.with_transformed_expressions(
+                            lambda expr, insn=insn: expander(expr, kernel, insn))
+                insn_used_inames = frozenset(_get_insn_used_inames(exp_insn))
+
+            new_insn_id_to_used_inames[insn.id] = (insn, insn_used_inames)
+
+        self.kernel_name_to_state[kernel.name] = (
+                kernel.substitutions, expander, new_insn_id_to_used_inames)
+
+        return frozenset().union(*(
+            insn_used_inames
+            for _, insn_used_inames in new_insn_id_to_used_inames.values()))
+
+
+_USED_INAME_TRACKER: ContextVar[_UsedInameTracker | None] = (
+        ContextVar("loopy_used_iname_tracker", default=None))
 
 
 def remove_any_newly_unused_inames(transformation_func):
@@ -1217,6 +1282,25 @@ def remove_any_newly_unused_inames(transformation_func):
         # check for remove_unused_inames argument, default: True
         remove_newly_unused_inames = kwargs.pop("remove_newly_unused_inames", True)
 
+        used_iname_tracker = _USED_INAME_TRACKER.get()
+        if used_iname_tracker is not None:
+            # within a transformation session, only the instructions changed
+            # since the last transformation are examined for used inames
+            transformed_kernel = transformation_func(kernel, *args, **kwargs)
+
+            if not remove_newly_unused_inames or transformed_kernel is kernel:
+                return transformed_kernel
+
+            inames_already_unused = (
+                    kernel.all_inames()
+                    - used_iname_tracker.get_used_inames(kernel))
+
+            return _project_out_inames(
+                    transformed_kernel,
+                    transformed_kernel.all_inames()
+                    - inames_already_unused
+                    - used_iname_tracker.get_used_inames(transformed_kernel))
+
         if remove_newly_unused_inames:
             # call transform
             transformed_kernel = transformation_func(kernel, *args, **kwargs)
@@ -1592,7 +1676,8 @@ def find_unused_axis_tag(
 
     from loopy.match import parse_match
     match = parse_match(insn_match)
-    insns = [insn for insn in kernel.instructions if match(kernel, insn)]
+    insns = [kernel.id_to_insn[insn_id]
+             for insn_id in match.get_matching_insn_ids(kernel)]
 
     for insn in insns:
         for iname in insn.within_inames:
@@ -1776,11 +1861,12 @@ def add_inames_to_insn(kernel, inames, insn_match):
 
     from loopy.match import parse_match
     match = parse_match(insn_match)
+    matching_insn_ids = match.get_matching_insn_ids(kernel)
 
     new_instructions = []
 
     for insn in kernel.instructions:
-        if match(kernel, insn):
+        if insn.id in matching_insn_ids:
             new_instructions.append(
                     insn.copy(within_inames=insn.within_inames | inames))
         else:
@@ -1819,11 +1905,12 @@ def remove_inames_from_insn(kernel: LoopKernel, inames: frozenset[str],
 
     from loopy.match import parse_match
     match = parse_match(insn_match)
+    matching_insn_ids = match.get_matching_insn_ids(kernel)
 
     new_instructions = []
 
     for insn in kernel.instructions:
-        if match(kernel, insn):
+        if insn.id in matching_insn_ids:
             new_inames = insn.within_inames - inames
             if new_inames == insn.within_inames:
                 raise LoopyError(f"Inames {inames} not found in instruction "
@@ -1860,11 +1947,12 @@ def remove_predicates_from_insn(kernel, predicates, insn_match):
 
     from loopy.match import parse_match
     match = parse_match(insn_match)
+    matching_insn_ids = match.get_matching_insn_ids(kernel)
 
     new_instructions = []
 
     for insn in kernel.instructions:
-        if match(kernel, insn):
+        if insn.id in matching_insn_ids:
             new_predicates = insn.predicates - predicates
             new_instructions.append(
                 insn.copy(predicates=frozenset(new_predicates)))
@@ -2380,11 +2468,12 @@ def add_inames_for_unused_hw_axes(kernel: LoopKernel,
 
     from loopy.match import parse_match
     within = parse_match(within)
+    matching_insn_ids = within.get_matching_insn_ids(kernel)
 
     new_insns: list[InstructionBase] = []
 
     for insn in kernel.instructions:
-        if within(kernel, insn):
+        if insn.id in matching_insn_ids:
             within_tags = frozenset().union(*(kernel.inames[iname].tags
                 for iname in insn.within_inames))
             missing_local_axes = [i for i in range(n_local_axes)
@@ -56,7 +56,10 @@ def find_instructions_in_single_kernel(
     assert isinstance(kernel, LoopKernel)
     from loopy.match import parse_match
     match = parse_match(insn_match)
-    return [insn for insn in kernel.instructions if match(kernel, insn)]
+    index = kernel.get_instruction_match_index()
+    return [kernel.id_to_insn[insn_id]
+            for insn_id in index.in_kernel_order(
+                match.get_matching_insn_ids(kernel))]
 
 
 def find_instructions(
@@ -88,11 +91,12 @@ def map_instructions(kernel: LoopKernel, insn_match: ToMatchConvertible,
                      f: Callable[[InstructionBase], InstructionBase]) -> LoopKernel:
     from loopy.match import parse_match
     match = parse_match(insn_match)
+    matching_insn_ids = match.get_matching_insn_ids(kernel)
 
     new_insns = []
 
     for insn in kernel.instructions:
-        if match(kernel, insn):
+        if insn.id in matching_insn_ids:
             new_insns.append(f(insn))
         else:
             new_insns.append(insn)
@@ -218,7 +222,7 @@ def remove_instructions(kernel, insn_ids):
     if isinstance(insn_ids, MatchExpressionBase):
         within = insn_ids
 
-        insn_ids = {insn.id for insn in kernel.instructions if within(kernel, insn)}
+        insn_ids = set(within.get_matching_insn_ids(kernel))
 
     assert isinstance(insn_ids, set)
     id_to_insn = kernel.id_to_insn
@@ -349,9 +353,11 @@ def tag_instructions(kernel, new_tag, within: ToMatchConvertible = None):
     from loopy.kernel.creation import _normalize_tags
     new_tags = _normalize_tags([new_tag])
 
+    matching_insn_ids = within.get_matching_insn_ids(kernel)
+
     new_insns = []
     for insn in kernel.instructions:
-        if within(kernel, insn):
+        if insn.id in matching_insn_ids:
             new_insns.append(
                     insn.copy(tags=insn.tags | new_tags))
         else:
@@ -0,0 +1,435 @@
+from __future__ import annotations
+
+
+__copyright__ = "Copyright (C) 2026 agent"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+
+import itertools
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from loopy.diagnostic import LoopyAdvisory, LoopyError, warn_with_kernel
+from loopy.kernel import LoopKernel
+from loopy.kernel.function_interface import CallableKernel
+from loopy.symbolic import CombineMapper, get_dependencies
+from loopy.translation_unit import TranslationUnit
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+
+__doc__ = """
+.. currentmodule:: loopy
+
+.. autoclass:: ArrayLayout
+
+.. autofunction:: apply_array_layout
+
+.. autofunction:: rank_array_layouts
+
+.. autofunction:: choose_array_layouts
+"""
+
+
+DEFAULT_SPLIT_LENGTHS = (4, 8)
+
+
+# {{{ layouts
+
+@dataclass(frozen=True)
+class ArrayLayout:
+    """A layout of an array, obtained from its current one by optionally
+    splitting one of its axes with :func:`loopy.split_array_axis` and then
+    ordering its axes with :func:`loopy.tag_array_axes`. For instance, for an
+    array of shape ``(nelements, nfields)``, ``"N1,N0"`` is an
+    interleaved (array-of-structures) layout and ``"N0,N1"`` a
+    structure-of-arrays layout, while splitting axis 0 with
+    *split_length* 4 and tagging with ``"N2,N0,N1"`` gives a blocked
+    layout that stores the fields of four consecutive elements next to each
+    other (array-of-structures-of-arrays).
+
+    .. attribute:: dim_tags
+
+        The dimension tags, as accepted by :func:`loopy.tag_array_axes`, of
+        the axes of the array after the split, if any.
+
+    .. attribute:: split_axis
+
+        The index of the axis to split, or *None*.
+
+    .. attribute:: split_length
+
+        The length of the inner axis resulting from the split.
+    """
+
+    dim_tags: str
+    split_axis: int | None = None
+    split_length: int | None = None
+
+
+def apply_array_layout(kernel, var_name: str, layout: ArrayLayout):
+    """Returns *kernel* with the array *var_name* (a temporary variable or an
+    argument) stored in *layout*, rewriting its accesses accordingly.
+    """
+    from loopy.transform.data import tag_array_axes
+    from loopy.transform.padding import split_array_axis
+
+    if layout.split_axis is not None:
+        kernel = split_array_axis(kernel, var_name, layout.split_axis,
+                                  layout.split_length)
+
+    return tag_array_axes(kernel, var_name, layout.dim_tags)
+
+
+def _get_layout_candidates(
+            ary, split_lengths: Sequence[int]) -> list[ArrayLayout]:
+    """Returns the layouts of *ary* obtained by all orderings of its axes,
+    with and without splitting one of them by one of *split_lengths*,
+    starting with the current layout.
+    """
+    def nesting_orders(naxes):
+        return [",".join(f"N{level}" for level in levels)
+                for levels in itertools.permutations(range(naxes))]
+
+    naxes = len(ary.shape)
+    current_dim_tags = None
+    if all(dim_tag.layout_nesting_level is not None for dim_tag in ary.dim_tags):
+        current_dim_tags = ",".join(
+                f"N{dim_tag.layout_nesting_level}" for dim_tag in ary.dim_tags)
+
+    result = [ArrayLayout(dim_tags) for dim_tags in nesting_orders(naxes)]
+    if current_dim_tags is not None:
+        result.remove(ArrayLayout(current_dim_tags))
+        result.insert(0, ArrayLayout(current_dim_tags))
+
+    # keep the number of orderings of the split axes manageable
+    if naxes > 3:
+        return result
+
+    for split_axis, split_length in itertools.product(
+            range(naxes), split_lengths):
+        axis_length = ary.shape[split_axis]
+        if isinstance(axis_length, int) and (
+                axis_length <= split_length or axis_length % split_length):
+            continue
+
+        result.extend(
+                ArrayLayout(dim_tags, split_axis, split_length)
+                for dim_tags in nesting_orders(naxes + 1))
+
+    return result
+
+# }}}
+
+
+# {{{ scoring
+
+def _get_innermost_inames(
+            kernel: LoopKernel,
+            linearized_kernel: LoopKernel) -> dict[str, str]:
+    """Returns a mapping from the ids of the instructions of *kernel* to the
+    iname along which their accesses are expected to be contiguous, i.e. the
+    iname tagged ``l.0`` or ``vec`` if there is one, or else the one of the
+    most deeply nested loop in *linearized_kernel*, which may also be a
+    reduction iname.
+    """
+    from loopy.kernel.data import LocalInameTag, VectorizeTag
+    from loopy.schedule import EnterLoop, LeaveLoop
+
+    assert linearized_kernel.linearization is not None
+
+    iname_to_depth: dict[str, int] = {}
+    depth = 0
+    for sched_item in linearized_kernel.linearization:
+        if isinstance(sched_item, EnterLoop):
+            depth += 1
+            iname_to_depth[sched_item.iname] = max(
+                    depth, iname_to_depth.get(sched_item.iname, 0))
+        elif isinstance(sched_item, LeaveLoop):
+            depth -= 1
+
+    def is_contiguous_tag(tag):
+        return (isinstance(tag, VectorizeTag)
+                or (isinstance(tag, LocalInameTag) and tag.axis == 0))
+
+    result = {}
+    for insn in kernel.instructions:
+        inames = insn.within_inames | insn.reduction_inames()
+
+        contiguous_inames = sorted(
+                iname for iname in inames
+                if any(is_contiguous_tag(tag) for tag in kernel.iname_tags(iname)))
+        if contiguous_inames:
+            result[insn.id] = contiguous_inames[0]
+            continue
+
+        looped_inames = [iname for iname in inames if iname in iname_to_depth]
+        if looped_inames:
+            result[insn.id] = max(
+                    sorted(looped_inames), key=lambda iname: iname_to_depth[iname])
+
+    return result
+
+
+class _IntegerDivisionOfInameFinder(CombineMapper[bool, []]):
+    """Finds whether an expression contains an integer division or remainder
+    of an expression depending on :attr:`iname`, which stride analysis
+    does not model.
+    """
+
+    def __init__(self, iname: str) -> None:
+        super().__init__()
+        self.iname = iname
+
+    def combine(self, values) -> bool:
+        return any(values)
+
+    def map_floor_div(self, expr) -> bool:
+        return (self.iname in get_dependencies(expr)
+                or super().map_floor_div(expr))
+
+    map_remainder = map_floor_div
+
+    def map_variable(self, expr) -> bool:
+        return False
+
+    def map_constant(self, expr) -> bool:
+        return False
+
+
+def _get_unit_stride_fraction(
+            kernel: LoopKernel,
+            var_name: str,
+            insn_id_to_iname: Mapping[str, str]) -> float:
+    """Returns the fraction of the accesses to *var_name* in *kernel* that
+    move with unit stride along the iname given by *insn_id_to_iname* for
+    their instruction, among those that move along it at all.
+    """
+    from loopy.statistics import _get_iname_strides
+    from loopy.symbolic import simplify_using_aff
+    from loopy.transform.padding import _get_array_accesses
+
+    ary = kernel.get_var_descriptor(var_name)
+
+    nunit_stride = 0
+    nvarying = 0
+    for insn, access in _get_array_accesses(kernel):
+        if access.aggregate.name != var_name or insn.id not in insn_id_to_iname:
+            continue
+
+        iname = insn_id_to_iname[insn.id]
+        index = tuple(simplify_using_aff(kernel, idx) for idx in access.index_tuple)
+        if iname not in get_dependencies(index):
+            continue
+
+        if _IntegerDivisionOfInameFinder(iname)(index):
+            stride = None
+        else:
+            stride = _get_iname_strides(kernel, ary, index, [iname])[iname]
+
+        if stride == 0:
+            continue
+
+        nvarying += 1
+        if stride in [1, -1]:
+            nunit_stride += 1
+
+    return nunit_stride / nvarying if nvarying else 1.0
+
+
+def _rank_array_layouts_in_kernel(
+            kernel: LoopKernel,
+            insn_id_to_iname: Mapping[str, str],
+            var_name: str,
+            split_lengths: Sequence[int]) -> list[tuple[float, ArrayLayout]]:
+    from loopy.kernel.array import ArrayBase, FixedStrideArrayDimTag
+
+    ary = kernel.get_var_descriptor(var_name)
+    if (not isinstance(ary, ArrayBase)
+            or ary.shape is None
+            or ary.dim_tags is None
+            or not ary.shape
+            or not all(isinstance(dim_tag, FixedStrideArrayDimTag)
+                       for dim_tag in ary.dim_tags)):
+        raise LoopyError(f"cannot choose a layout for '{var_name}': its axes "
+                "must have known lengths and fixed strides")
+
+    from loopy.transform.data import tag_array_axes
+    from loopy.transform.padding import split_array_axis
+
+    # the split rewrites the accesses, share it among the axis orderings
+    split_kernels: dict[tuple[int | None, int | None], LoopKernel] = {
+            (None, None): kernel}
+
+    result = []
+    for layout in _get_layout_candidates(ary, split_lengths):
+        split_key = (layout.split_axis, layout.split_length)
+        if split_key not in split_kernels:
+            split_kernels[split_key] = split_array_axis(
+                    kernel, var_name, layout.split_axis, layout.split_length)
+
+        candidate_kernel = tag_array_axes(
+                split_kernels[split_key], var_name, layout.dim_tags)
+
+        result.append((
+                _get_unit_stride_fraction(
+                    candidate_kernel, var_name, insn_id_to_iname),
+                layout))
+
+    # sort is stable: among equally good layouts, keep the current one
+    return sorted(result, key=lambda score_and_layout: -score_and_layout[0])
+
+# }}}
+
+
+# {{{ layout exploration
+
+def _get_linearized_kernels(kernel) -> dict[str, LoopKernel]:
+    if isinstance(kernel, LoopKernel):
+        if kernel.linearization is None:
+            raise LoopyError("choosing array layouts requires a translation "
+                    "unit or a linearized kernel")
+        return {kernel.name: kernel}
+
+    from loopy.preprocess import preprocess_program
+    from loopy.schedule import linearize
+    linearized_t_unit = linearize(preprocess_program(kernel))
+
+    return {
+            name: clbl.subkernel
+            for name, clbl in linearized_t_unit.callables_table.items()
+            if isinstance(clbl, CallableKernel)}
+
+
+def rank_array_layouts(
+            kernel: TranslationUnit | LoopKernel,
+            var_name: str,
+            split_lengths: Sequence[int] = DEFAULT_SPLIT_LENGTHS
+        ) -> list[tuple[float, ArrayLayout]]:
+    """Returns a list of tuples ``(score, layout)`` of candidate
+    :class:`ArrayLayout` instances for the array *var_name* of *kernel*'s
+    default entrypoint (or of *kernel*, if it is a linearized
+    :class:`LoopKernel`), from best to worst.
+
+    The candidates are all orderings of the array's axes, with and without
+    one of its axes split by one of *split_lengths*, if it is divisible by
+    it. The score of a layout is the fraction of the accesses to the array
+    that have unit stride (as determined for
+    :func:`~loopy.get_mem_access_map`) along the iname with which they are
+    expected to be contiguous, among the ones that vary along that iname.
+    That iname is the one tagged ``l.0`` or ``vec``, if there is one, or
+    else the one of the innermost loop around the access. Equally good
+    layouts are ranked in the order given above, starting with the current
+    one.
+    """
+    linearized_kernels = _get_linearized_kernels(kernel)
+
+    if isinstance(kernel, TranslationUnit):
+        kernel = kernel.default_entrypoint
+
+    return _rank_array_layouts_in_kernel(
+            kernel,
+            _get_innermost_inames(kernel, linearized_kernels[kernel.name]),
+            var_name, split_lengths)
+
+
+def _choose_array_layouts_in_kernel(
+            kernel: LoopKernel,
+            linearized_kernel: LoopKernel,
+            var_names: Sequence[str] | None,
+            split_lengths: Sequence[int]) -> LoopKernel:
+    from loopy.kernel.array import FixedStrideArrayDimTag
+
+    if var_names is None:
+        var_names = [
+                name for name, tv in sorted(kernel.temporary_variables.items())
+                if tv.shape
+                and tv.dim_tags is not None
+                and all(isinstance(dim_tag, FixedStrideArrayDimTag)
+                        for dim_tag in tv.dim_tags)]
+
+    insn_id_to_iname = _get_innermost_inames(kernel, linearized_kernel)
+
+    for var_name in var_names:
+        (_, best_layout), *_ = _rank_array_layouts_in_kernel(
+                kernel, insn_id_to_iname, var_name, split_lengths)
+
+        new_kernel = apply_array_layout(kernel, var_name, best_layout)
+
+        old_ary = kernel.get_var_descriptor(var_name)
+        new_ary = new_kernel.get_var_descriptor(var_name)
+        if new_ary == old_ary:
+            continue
+
+        kernel = new_kernel
+
+        if var_name in kernel.arg_dict:
+            strides = tuple(dim_tag.stride for dim_tag in new_ary.dim_tags)
+            warn_with_kernel(kernel, "array_layout_changed",
+                    f"layout of argument '{var_name}' changed to {best_layout}: "
+                    f"callers must now pass an array of shape {new_ary.shape} "
+                    f"with strides {strides} (in entries) instead of one of "
+                    f"shape {old_ary.shape}", LoopyAdvisory)
+
+    return kernel
+
+
+def choose_array_layouts(
+            kernel: TranslationUnit | LoopKernel,
+            var_names: Sequence[str] | str | None = None,
+            split_lengths: Sequence[int] = DEFAULT_SPLIT_LENGTHS):
+    """Stores each of the arrays *var_names* in the best layout according to
+    :func:`rank_array_layouts`, using :func:`apply_array_layout`.
+
+    For arguments whose layout is changed, a
+    :class:`~loopy.diagnostic.LoopyAdvisory` is emitted describing the shape
+    and strides of the arrays that callers need to pass instead.
+
+    :arg var_names: a sequence of names of temporary variables and
+        arguments (or a comma-separated string). Defaults to all temporary
+        variables with axes of known length and fixed stride. Arguments are
+        only considered if named here, since changing their layout changes
+        the calling convention of the kernel.
+    """
+    if isinstance(var_names, str):
+        var_names = [name.strip() for name in var_names.split(",") if name.strip()]
+
+    linearized_kernels = _get_linearized_kernels(kernel)
+
+    if isinstance(kernel, TranslationUnit):
+        t_unit = kernel
+        for name, clbl in kernel.callables_table.items():
+            if isinstance(clbl, CallableKernel):
+                t_unit = t_unit.with_kernel(_choose_array_layouts_in_kernel(
+                        clbl.subkernel, linearized_kernels[name], var_names,
+                        split_lengths))
+
+        return t_unit
+
+    return _choose_array_layouts_in_kernel(
+            kernel, kernel, var_names, split_lengths)
+
+# }}}
+
+# vim: foldmethod=marker
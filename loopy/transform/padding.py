@@ -24,6 +24,8 @@ THE SOFTWARE.
 """
 
 
+from dataclasses import dataclass
+from math import gcd
 from typing import TYPE_CHECKING, Any, Literal, TypeAlias, cast
 
 import pymbolic.primitives as p
@@ -523,4 +525,270 @@ def add_padding(kernel, variable, axis, align_bytes):
 # }}}
 
 
+# {{{ cache set conflicts
+
+@dataclass(frozen=True)
+class CacheGeometry:
+    """Describes a set-associative cache.
+
+    .. attribute:: size
+
+        The capacity of the cache in bytes.
+
+    .. attribute:: associativity
+
+        The number of lines in each set of the cache.
+
+    .. attribute:: line_size
+
+        The size of a cache line in bytes.
+    """
+
+    size: int
+    associativity: int
+    line_size: int = 64
+
+    @property
+    def nsets(self) -> int:
+        return self.size // (self.associativity * self.line_size)
+
+    def get_nsets_touched(self, stride: int) -> int:
+        """Returns the number of sets touched by a sequence of accesses *stride*
+        bytes apart.
+        """
+        # addresses one set stride apart map to the same set
+        set_stride = self.nsets * self.line_size
+        return set_stride // max(gcd(stride, set_stride), self.line_size)
+
+
+@dataclass(frozen=True)
+class CacheConflict:
+    """Describes an access to an array in a loop whose successive iterations
+    map to only a fraction of the sets of a cache, so that the lines they
+    touch evict each other before the cache is full.
+
+    .. attribute:: variable
+    .. attribute:: iname
+    .. attribute:: stride
+
+        The distance in bytes between the accesses in successive iterations
+        of the loop over :attr:`iname`.
+
+    .. attribute:: cache
+
+        The :class:`CacheGeometry` of the affected cache.
+
+    .. attribute:: nsets_touched
+
+        The number of sets of :attr:`cache` touched by the loop.
+    """
+
+    variable: str
+    iname: str
+    stride: int
+    cache: CacheGeometry
+    nsets_touched: int
+
+
+def _get_array_accesses(kernel):
+    from loopy.kernel.data import MultiAssignmentBase
+    from loopy.symbolic import ArrayAccessFinder, SubstitutionRuleExpander
+
+    expand_rules = SubstitutionRuleExpander(kernel.substitutions)
+    access_finder = ArrayAccessFinder()
+
+    for insn in kernel.instructions:
+        if not isinstance(insn, MultiAssignmentBase):
+            continue
+
+        for expr in (*insn.assignees, insn.expression):
+            for access in access_finder(expand_rules(expr)):
+                yield insn, access
+
+
+def _find_cache_conflicts_in_kernel(kernel, typed_kernel, caches, variables=None):
+    from loopy.diagnostic import StaticValueFindingError
+    from loopy.kernel.array import ArrayBase, FixedStrideArrayDimTag
+    from loopy.kernel.data import HardwareConcurrentTag
+    from loopy.statistics import _get_iname_strides
+
+    result = []
+    for insn, access in _get_array_accesses(kernel):
+        name = access.aggregate.name
+        if variables is not None and name not in variables:
+            continue
+
+        ary = typed_kernel.get_var_descriptor(name)
+        if (not isinstance(ary, ArrayBase)
+                or ary.dtype is None
+                or ary.dim_tags is None
+                or not all(isinstance(dim_tag, FixedStrideArrayDimTag)
+                           for dim_tag in ary.dim_tags)):
+            continue
+
+        inames = [
+                iname
+                for iname in sorted(insn.within_inames | insn.reduction_inames())
+                if not kernel.iname_tags_of_type(iname, HardwareConcurrentTag)]
+
+        iname_to_stride = _get_iname_strides(
+                kernel, ary, access.index_tuple, inames)
+
+        for iname, stride in iname_to_stride.items():
+            if not isinstance(stride, int) or stride == 0:
+                continue
+
+            stride = abs(stride) * ary.dtype.itemsize
+
+            try:
+                trip_count = kernel.get_constant_iname_length(iname)
+            except StaticValueFindingError:
+                trip_count = None
+
+            for cache in caches:
+                nsets_touched = cache.get_nsets_touched(stride)
+                if (nsets_touched < cache.nsets
+                        and (trip_count is None
+                             or trip_count > nsets_touched * cache.associativity)):
+                    conflict = CacheConflict(
+                            variable=name, iname=iname, stride=stride,
+                            cache=cache, nsets_touched=nsets_touched)
+                    if conflict not in result:
+                        result.append(conflict)
+
+    return result
+
+
+def find_cache_conflicts(kernel, caches):
+    """Returns a list of :class:`CacheConflict` instances describing the
+    array accesses in *kernel* whose strides along a loop (obtained as by
+    :func:`~loopy.get_mem_access_map`) make successive iterations use only
+    a fraction of the sets of one of *caches*, which are
+    :class:`CacheGeometry` instances.
+
+    Only accesses with strides that are known integers are considered,
+    as well as only loops whose iterations either have no known count or
+    touch more lines than fit into the sets they map to. Loops implemented
+    by hardware axes are not considered. The types of the arrays must be
+    known or inferable.
+    """
+    if isinstance(kernel, TranslationUnit):
+        from loopy.type_inference import infer_unknown_types
+        typed_t_unit = infer_unknown_types(kernel, expect_completion=False)
+
+        return [
+                conflict
+                for name, clbl in kernel.callables_table.items()
+                if isinstance(clbl, CallableKernel)
+                for conflict in _find_cache_conflicts_in_kernel(
+                    clbl.subkernel, typed_t_unit[name], caches)]
+
+    return _find_cache_conflicts_in_kernel(kernel, kernel, caches)
+
+
+def _pad_fastest_axis(ary, padding):
+    """Returns a copy of the temporary *ary*, whose axes all have
+    :class:`~loopy.kernel.array.FixedStrideArrayDimTag` tags with integer
+    strides, with *padding* entries of storage added to its fastest-varying
+    axis.
+    """
+    axes = sorted(range(len(ary.shape)), key=lambda axis: ary.dim_tags[axis].stride)
+
+    storage_shape = list(ary.shape)
+    storage_shape[axes[0]] += padding
+
+    new_dim_tags = list(ary.dim_tags)
+    stride = ary.dim_tags[axes[0]].stride
+    for axis in axes:
+        new_dim_tags[axis] = ary.dim_tags[axis].copy(stride=stride)
+        stride *= storage_shape[axis]
+
+    return ary.copy(dim_tags=tuple(new_dim_tags),
+                    storage_shape=tuple(storage_shape))
+
+
+def _add_padding_to_avoid_cache_conflicts_in_kernel(
+        kernel, typed_kernel, caches, max_padding):
+    from loopy.diagnostic import LoopyAdvisory, warn_with_kernel
+
+    conflicts = _find_cache_conflicts_in_kernel(kernel, typed_kernel, caches)
+
+    new_temporaries = dict(kernel.temporary_variables)
+
+    for name in sorted({conflict.variable for conflict in conflicts}):
+        ary = typed_kernel.get_var_descriptor(name)
+        line_size = max(cache.line_size for cache in caches)
+        granularity = max(1, line_size // ary.dtype.itemsize)
+
+        if name not in kernel.temporary_variables:
+            strides = ", ".join(
+                    f"{conflict.stride} bytes along '{conflict.iname}'"
+                    for conflict in conflicts if conflict.variable == name)
+            warn_with_kernel(kernel, "cache_conflict",
+                    f"strides of '{name}' ({strides}) cause cache set "
+                    "conflicts, consider padding its fastest-varying axis "
+                    f"to a multiple of {granularity} entries that is not a "
+                    "multiple of a large power of two",
+                    LoopyAdvisory)
+            continue
+
+        temp = kernel.temporary_variables[name]
+        if not all(isinstance(length, int) for length in temp.shape):
+            continue
+
+        for padding in range(granularity, max_padding + 1, granularity):
+            padded_temp = _pad_fastest_axis(temp, padding)
+            padded_kernel = kernel.copy(temporary_variables={
+                    **kernel.temporary_variables, name: padded_temp})
+            padded_typed_kernel = typed_kernel.copy(temporary_variables={
+                    **typed_kernel.temporary_variables,
+                    name: _pad_fastest_axis(ary, padding)})
+
+            if not _find_cache_conflicts_in_kernel(
+                    padded_kernel, padded_typed_kernel, caches,
+                    variables={name}):
+                new_temporaries[name] = padded_temp
+                break
+        else:
+            warn_with_kernel(kernel, "cache_conflict",
+                    f"could not find a padding of temporary '{name}' of at "
+                    f"most {max_padding} entries that avoids cache set "
+                    "conflicts", LoopyAdvisory)
+
+    return kernel.copy(temporary_variables=new_temporaries)
+
+
+def add_padding_to_avoid_cache_conflicts(kernel, caches, max_padding=256):
+    """Pads the fastest-varying axis of the temporary arrays that have accesses
+    found by :func:`find_cache_conflicts` with the least number of entries,
+    among multiples of the cache line size, that avoids the conflicts. For
+    arguments, whose layout is chosen by the caller, a
+    :class:`~loopy.diagnostic.LoopyAdvisory` suggesting a padding is
+    emitted instead.
+
+    Only temporaries of constant shape with fixed strides are padded.
+
+    :arg caches: a sequence of :class:`CacheGeometry` instances.
+    :arg max_padding: the maximal number of entries to pad by.
+    """
+    if isinstance(kernel, TranslationUnit):
+        from loopy.type_inference import infer_unknown_types
+        typed_t_unit = infer_unknown_types(kernel, expect_completion=False)
+
+        t_unit = kernel
+        for name, clbl in kernel.callables_table.items():
+            if isinstance(clbl, CallableKernel):
+                t_unit = t_unit.with_kernel(
+                        _add_padding_to_avoid_cache_conflicts_in_kernel(
+                            clbl.subkernel, typed_t_unit[name], caches,
+                            max_padding))
+
+        return t_unit
+
+    return _add_padding_to_avoid_cache_conflicts_in_kernel(
+            kernel, kernel, caches, max_padding)
+
+# }}}
+
+
 # vim: foldmethod=marker
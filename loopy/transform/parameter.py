@@ -26,15 +26,26 @@ THE SOFTWARE.
 
 from typing import TYPE_CHECKING
 
-import islpy as isl
+from constantdict import constantdict
 
-from loopy.kernel import LoopKernel
-from loopy.symbolic import RuleAwareSubstitutionMapper, SubstitutionRuleMappingContext
+import islpy as isl
+from islpy import dim_type
+
+from loopy.diagnostic import LoopyError
+from loopy.kernel import KernelState, LoopKernel
+from loopy.symbolic import (
+    RuleAwareIdentityMapper,
+    RuleAwareSubstitutionMapper,
+    SubstitutionRuleMappingContext,
+)
 from loopy.translation_unit import for_each_kernel
 
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
     from loopy.match import ToStackMatchConvertible
+    from loopy.typing import Expression
 
 
 __doc__ = """
@@ -44,6 +55,8 @@ __doc__ = """
 .. autofunction:: fix_parameters
 
 .. autofunction:: assume
+
+.. autofunction:: multiversion
 """
 
 
@@ -174,4 +187,183 @@ def fix_parameters(
 
 # }}}
 
+
+# {{{ multiversion
+
+class _VersionInameRenamer(RuleAwareIdentityMapper):
+    def __init__(self, rule_mapping_context,
+            insn_id_to_iname_map: Mapping[str, Mapping[str, str]]):
+        super().__init__(rule_mapping_context)
+
+        self.insn_id_to_iname_map = insn_id_to_iname_map
+
+    def _get_iname_map(self, expn_state):
+        return self.insn_id_to_iname_map[expn_state.instruction.id]
+
+    def map_reduction(self, expr, expn_state):
+        iname_map = self._get_iname_map(expn_state)
+
+        from loopy.symbolic import Reduction
+        return Reduction(expr.operation,
+                    tuple(iname_map.get(iname, iname)
+                          if iname not in expn_state.arg_context
+                          else iname
+                          for iname in expr.inames),
+                    self.rec(expr.expr, expn_state),
+                    expr.allow_simultaneous)
+
+    def map_variable(self, expr, expn_state):
+        new_name = self._get_iname_map(expn_state).get(expr.name)
+
+        if new_name is None or expr.name in expn_state.arg_context:
+            return super().map_variable(expr, expn_state)
+        else:
+            from pymbolic import var
+            return var(new_name)
+
+    def map_instruction(self, kernel, insn):
+        iname_map = self.insn_id_to_iname_map[insn.id]
+        return insn.copy(within_inames=frozenset(
+                iname_map.get(iname, iname) for iname in insn.within_inames))
+
+
+def _rename_dims(domain: isl.BasicSet, name_map: Mapping[str, str]
+                 ) -> isl.BasicSet:
+    for dt in [dim_type.set, dim_type.param]:
+        for i in range(domain.dim(dt)):
+            new_name = name_map.get(domain.get_dim_name(dt, i))
+            if new_name is not None:
+                domain = domain.set_dim_name(dt, i, new_name)
+
+    return domain
+
+
+@for_each_kernel
+def multiversion(
+            kernel: LoopKernel,
+            conditions: Sequence[str | Expression],
+            suffixes: Sequence[str] | None = None,
+        ) -> LoopKernel:
+    """Returns a kernel containing a copy of the instructions of *kernel* for
+    each entry of *conditions*, plus a generic copy. Exactly one of the
+    copies is executed, selected by a cascade of run-time checks: the copy
+    for the first condition that holds, or the generic copy if none does.
+
+    Within the code for each copy, affine conditions are known to hold (and
+    those of earlier copies known not to hold), much like with
+    :func:`assume`. For example, after splitting an iname by 8, the copy for
+    ``n % 8 == 0`` has no remainder handling.
+
+    :arg conditions: a sequence of conditions on :ref:`domain-parameters`
+        and :class:`~loopy.ValueArg` arguments, either as expressions or as
+        strings such as ``"n % 8 == 0 and n <= 64"``.
+    :arg suffixes: if given, a sequence of one more string than there are
+        *conditions*. The inames and instruction IDs of each copy (the
+        generic one last) are suffixed with the corresponding entry.
+        Defaults to ``v0``, ``v1``, ... and ``generic``.
+
+    The copies are distinguished by their inames, so that transformations
+    may be applied to them individually afterwards.
+    """
+    assert isinstance(kernel, LoopKernel)
+
+    if kernel.state >= KernelState.LINEARIZED:
+        raise LoopyError("cannot multiversion a linearized kernel")
+
+    from loopy.kernel.data import ValueArg
+    from loopy.symbolic import get_dependencies, parse
+
+    conditions = [parse(cond) if isinstance(cond, str) else cond
+                  for cond in conditions]
+
+    if suffixes is None:
+        suffixes = [*(f"v{i}" for i in range(len(conditions))), "generic"]
+    if len(suffixes) != len(conditions) + 1:
+        raise LoopyError("'suffixes' must have one more entry than 'conditions'")
+
+    parameters = kernel.outer_params() | {
+            arg.name for arg in kernel.args if isinstance(arg, ValueArg)}
+    for cond in conditions:
+        unknown_names = get_dependencies(cond) - parameters
+        if unknown_names:
+            raise LoopyError(f"condition '{cond}' refers to "
+                    f"'{', '.join(sorted(unknown_names))}', which are not "
+                    f"parameters of kernel '{kernel.name}'")
+
+    from pymbolic.primitives import LogicalNot
+
+    all_inames = sorted(kernel.all_inames())
+    insn_id_gen = kernel.get_instruction_id_generator()
+    var_name_gen = kernel.get_var_name_generator()
+
+    new_insns = []
+    new_domains = [dom for dom in kernel.domains if not dom.dim(dim_type.set)]
+    new_inames = {}
+    new_loop_priority = set()
+    new_slab_increments = {}
+    insn_id_to_iname_map = {}
+
+    prev_version_sinks: frozenset[str] = frozenset()
+    for iversion, suffix in enumerate(suffixes):
+        predicates = frozenset(
+                LogicalNot(cond) for cond in conditions[:iversion])
+        if iversion < len(conditions):
+            predicates = predicates | {conditions[iversion]}
+
+        iname_map = {iname: var_name_gen(f"{iname}_{suffix}")
+                     for iname in all_inames}
+        insn_id_map = {insn.id: insn_id_gen(f"{insn.id}_{suffix}")
+                       for insn in kernel.instructions}
+
+        version_insns = []
+        for insn in kernel.instructions:
+            # Executing the versions in order keeps each version contiguous
+            # in the schedule, enclosed by a single check.
+            depends_on = (
+                    frozenset(insn_id_map[dep] for dep in insn.depends_on)
+                    if insn.depends_on else prev_version_sinks)
+
+            version_insns.append(insn.copy(
+                    id=insn_id_map[insn.id],
+                    depends_on=depends_on,
+                    no_sync_with=frozenset(
+                        (insn_id_map.get(insn_id, insn_id), scope)
+                        for insn_id, scope in insn.no_sync_with),
+                    predicates=insn.predicates | predicates))
+            insn_id_to_iname_map[insn_id_map[insn.id]] = iname_map
+
+        prev_version_sinks = frozenset(insn.id for insn in version_insns) - {
+                dep for insn in version_insns for dep in insn.depends_on}
+        new_insns.extend(version_insns)
+
+        new_domains.extend(
+                _rename_dims(dom, iname_map) for dom in kernel.domains
+                if dom.dim(dim_type.set))
+        new_inames.update(
+                (iname_map[name], iname.copy(name=iname_map[name]))
+                for name, iname in kernel.inames.items()
+                if name in iname_map)
+        new_loop_priority.update(
+                tuple(iname_map[iname] for iname in prio)
+                for prio in kernel.loop_priority)
+        new_slab_increments.update(
+                (iname_map[iname], incr)
+                for iname, incr in kernel.iname_slab_increments.items())
+
+    rule_mapping_context = SubstitutionRuleMappingContext(
+            kernel.substitutions, var_name_gen)
+    renamer = _VersionInameRenamer(rule_mapping_context, insn_id_to_iname_map)
+
+    kernel = rule_mapping_context.finish_kernel(
+            renamer.map_kernel(kernel.copy(instructions=new_insns),
+                               map_tvs=False, map_args=False))
+
+    return kernel.copy(
+            domains=new_domains,
+            inames=constantdict(new_inames),
+            loop_priority=frozenset(new_loop_priority),
+            iname_slab_increments=constantdict(new_slab_increments))
+
+# }}}
+
 # vim: foldmethod=marker
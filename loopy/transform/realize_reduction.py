@@ -58,6 +58,7 @@ if TYPE_CHECKING:
     from pytools.tag import Tag
 
     from loopy.kernel import LoopKernel
+    from loopy.library.reduction import ReductionOperation
     from loopy.types import LoopyType
     from loopy.typing import InameStr
 
@@ -177,6 +178,22 @@ class _ReductionRealizationContext:
                 surrounding_insn_add_depends_on=set(),
                 surrounding_insn_add_no_sync_with=set())
 
+    def get_invariant_surrounding_predicates(self) -> frozenset[Expression]:
+        """Returns the surrounding predicates that only depend on parameters
+        of the kernel, i.e. that may be evaluated anywhere.
+        """
+        from loopy.kernel.data import ValueArg
+        from loopy.symbolic import get_dependencies
+
+        kernel = self.orig_kernel
+        parameters = (kernel.outer_params()
+                | {arg.name for arg in kernel.args if isinstance(arg, ValueArg)}
+                ) - kernel.get_written_variables()
+
+        return frozenset(
+                pred for pred in self.surrounding_predicates
+                if get_dependencies(pred) <= parameters)
+
     def get_insn_kwargs(self) -> InsnKwargs:
         return {
                 "within_inames": (
@@ -201,16 +218,19 @@ class _InameClassification:
     sequential: tuple[str, ...]
     local_parallel: tuple[str, ...]
     nonlocal_parallel: tuple[str, ...]
+    openmp_parallel: tuple[str, ...]
 
 
 def _classify_reduction_inames(red_realize_ctx, inames):
     sequential = []
     local_par = []
     nonlocal_par = []
+    openmp_par = []
 
     from loopy.kernel.data import (
         ConcurrentTag,
         LocalInameTagBase,
+        OpenMPParallelTag,
         UnrolledIlpTag,
         UnrollTag,
         filter_iname_tags_by_type,
@@ -233,11 +253,15 @@ def _classify_reduction_inames(red_realize_ctx, inames):
         elif filter_iname_tags_by_type(iname_tags, ConcurrentTag):
             nonlocal_par.append(iname)
 
+        elif filter_iname_tags_by_type(iname_tags, OpenMPParallelTag):
+            openmp_par.append(iname)
+
         else:
             sequential.append(iname)
 
     return _InameClassification(
-            tuple(sequential), tuple(local_par), tuple(nonlocal_par))
+            tuple(sequential), tuple(local_par), tuple(nonlocal_par),
+            tuple(openmp_par))
 
 
 def _add_params_to_domain(domain: isl.BasicSet, param_names: Sequence[InameStr]):
@@ -1000,7 +1024,8 @@ def expand_inner_reduction(
 
 # {{{ reduction type: sequential
 
-def map_reduction_seq(red_realize_ctx, expr, nresults, arg_dtypes, reduction_dtypes):
+def map_reduction_seq(red_realize_ctx, expr, nresults, arg_dtypes, reduction_dtypes,
+        openmp_reduction_operator=None):
     orig_kernel = red_realize_ctx.orig_kernel
 
     acc_var_names = _make_temporaries(
@@ -1034,11 +1059,13 @@ def map_reduction_seq(red_realize_ctx, expr, nresults, arg_dtypes, reduction_dty
             # Do not inherit predicates: Those might read variables
             # that may not yet be set, and we don't have a great way
             # of figuring out what the dependencies of the accumulator
-            # initializer should be.
+            # initializer should be. Predicates that only read parameters
+            # of the kernel are safe to inherit.
 
             # This way, we may initialize a few too many accumulators,
             # but that's better than being incorrect.
             # https://github.com/inducer/loopy/issues/231
+            predicates=red_realize_ctx.get_invariant_surrounding_predicates(),
             )
 
     red_realize_ctx.additional_insns.append(init_insn)
@@ -1084,10 +1111,19 @@ def map_reduction_seq(red_realize_ctx, expr, nresults, arg_dtypes, reduction_dty
             red_realize_ctx.boxed_callables_table[0],
             orig_kernel.target)
 
+    tags = frozenset()
+    if openmp_reduction_operator is not None:
+        # the update runs within OpenMP-parallel loops, the accumulators
+        # need to be combined across threads by a reduction clause
+        from loopy.kernel.instruction import OpenMPReductionTag
+        tags = frozenset([
+            OpenMPReductionTag(openmp_reduction_operator, frozenset(expr.inames))])
+
     reduction_insn = make_assignment(
             id=update_id,
             assignees=acc_vars,
             expression=expression,
+            tags=tags,
             **update_red_realize_ctx.get_insn_kwargs())
 
     red_realize_ctx.additional_insns.append(reduction_insn)
@@ -1213,11 +1249,13 @@ def map_reduction_local(
             # Do not inherit predicates: Those might read variables
             # that may not yet be set, and we don't have a great way
             # of figuring out what the dependencies of the accumulator
-            # initializer should be.
+            # initializer should be. Predicates that only read parameters
+            # of the kernel are safe to inherit.
 
             # This way, we may initialize a few too many accumulators,
             # but that's better than being incorrect.
             # https://github.com/inducer/loopy/issues/231
+            predicates=red_realize_ctx.get_invariant_surrounding_predicates(),
             )
     red_realize_ctx.additional_insns.append(init_insn)
 
@@ -1365,6 +1403,235 @@ def map_reduction_local(
 # }}}
 
 
+# {{{ reduction type: OpenMP-parallel
+
+def _get_openmp_reduction_operator(
+            operation: ReductionOperation,
+            reduction_dtypes: Sequence[LoopyType | None],
+        ) -> str | None:
+    """Returns the OpenMP reduction identifier implementing *operation*, or
+    *None* if OpenMP has no built-in reduction for it.
+    """
+    from loopy.library.reduction import (
+        AllReductionOperation,
+        AnyReductionOperation,
+        MaxReductionOperation,
+        MinReductionOperation,
+        ProductReductionOperation,
+        SumReductionOperation,
+    )
+    from loopy.types import NumpyType
+
+    # OpenMP's built-in reductions only apply to arithmetic (non-complex)
+    # types
+    if not all(isinstance(dtype, NumpyType) and dtype.numpy_dtype.kind in "biuf"
+            for dtype in reduction_dtypes):
+        return None
+
+    for op_type, omp_operator in [
+            (SumReductionOperation, "+"),
+            (ProductReductionOperation, "*"),
+            (MaxReductionOperation, "max"),
+            (MinReductionOperation, "min"),
+            (AnyReductionOperation, "||"),
+            (AllReductionOperation, "&&"),
+            ]:
+        if type(operation) is op_type:
+            return omp_operator
+
+    return None
+
+
+def map_reduction_openmp(
+            red_realize_ctx: _ReductionRealizationContext,
+            expr: Reduction,
+            nresults: int,
+            arg_dtypes: Sequence[LoopyType | None],
+            reduction_dtypes: Sequence[LoopyType | None],
+        ):
+    """Realizes a reduction over a single OpenMP-parallel iname for which no
+    OpenMP reduction clause exists: each iteration of the parallel loop
+    stores its contribution into a partial result array, which is then
+    combined by a sequential loop once the parallel loop has finished.
+    """
+    orig_kernel = red_realize_ctx.orig_kernel
+
+    red_iname, = expr.inames
+
+    from loopy.diagnostic import StaticValueFindingError
+    from loopy.isl_helpers import static_min_of_pw_aff
+    from loopy.symbolic import pw_aff_to_expr
+    try:
+        size = _get_int_iname_size(orig_kernel, red_iname)
+        lbound = pw_aff_to_expr(
+                static_min_of_pw_aff(
+                    orig_kernel.get_iname_bounds(red_iname).lower_bound_pw_aff,
+                    constants_only=True))
+    except StaticValueFindingError as e:
+        raise LoopyError("OpenMP-parallel reduction over '%s' with operation "
+                "'%s' requires the iname to have constant bounds to size the "
+                "array of partial results. Split the iname to obtain one "
+                "of constant length (e.g. using split_iname with "
+                "inner_tag='omp' and split_reduction_outward)."
+                % (red_iname, expr.operation)) from e
+
+    from pymbolic import var
+
+    neutral_var_names = _make_temporaries(
+            red_realize_ctx=red_realize_ctx,
+            name_based_on="neutral_"+red_iname,
+            nvars=nresults,
+            shape=(),
+            dtypes=reduction_dtypes,
+            address_space=AddressSpace.PRIVATE)
+
+    partial_var_names = _make_temporaries(
+            red_realize_ctx=red_realize_ctx,
+            name_based_on="partial_"+red_iname,
+            nvars=nresults,
+            shape=(size,),
+            dtypes=reduction_dtypes,
+            address_space=AddressSpace.PRIVATE)
+
+    acc_var_names = _make_temporaries(
+            red_realize_ctx=red_realize_ctx,
+            name_based_on="acc_"+red_iname,
+            nvars=nresults,
+            shape=(),
+            dtypes=reduction_dtypes,
+            address_space=AddressSpace.PRIVATE)
+
+    partial_vars = tuple(var(n) for n in partial_var_names)
+    partial_index = var(red_iname) - lbound if lbound else var(red_iname)
+    acc_vars = tuple(var(n) for n in acc_var_names)
+
+    neutral, red_realize_ctx.boxed_callables_table[0] = \
+            expr.operation.neutral_element(*arg_dtypes,
+                    callables_table=red_realize_ctx.boxed_callables_table[0],
+                    target=orig_kernel.target)
+
+    # Do not inherit predicates for the initializers, see map_reduction_seq.
+    init_neutral_id = red_realize_ctx.insn_id_gen(
+            f"{red_realize_ctx.id_prefix}_{red_iname}_init_neutral")
+    init_neutral_insn = make_assignment(
+            id=init_neutral_id,
+            assignees=tuple(var(nvn) for nvn in neutral_var_names),
+            expression=neutral,
+            within_inames=red_realize_ctx.surrounding_within_inames,
+            within_inames_is_final=True,
+            depends_on=frozenset(),
+            predicates=red_realize_ctx.get_invariant_surrounding_predicates(),
+            )
+    red_realize_ctx.additional_insns.append(init_neutral_insn)
+
+    init_id = red_realize_ctx.insn_id_gen(
+            f"{red_realize_ctx.id_prefix}_{red_iname}_init")
+    init_insn = make_assignment(
+            id=init_id,
+            assignees=acc_vars,
+            expression=neutral,
+            within_inames=red_realize_ctx.surrounding_within_inames,
+            within_inames_is_final=True,
+            depends_on=frozenset(),
+            predicates=red_realize_ctx.get_invariant_surrounding_predicates(),
+            )
+    red_realize_ctx.additional_insns.append(init_insn)
+
+    # {{{ store partial results within the parallel loop
+
+    transfer_red_realize_ctx = red_realize_ctx.new_subinstruction(
+            within_inames=(
+                    red_realize_ctx.surrounding_within_inames
+                    | frozenset([red_iname])),
+            depends_on=(
+                red_realize_ctx.surrounding_depends_on
+                | frozenset([init_neutral_id])))
+
+    reduction_expr = red_realize_ctx.mapper(
+            expr.expr, red_realize_ctx=transfer_red_realize_ctx,
+            nresults=1)
+
+    if nresults > 1 and not isinstance(reduction_expr, tuple):
+        get_args_insn_id = red_realize_ctx.insn_id_gen(
+                f"{red_realize_ctx.id_prefix}_{red_iname}_get")
+
+        reduction_expr = expand_inner_reduction(
+                red_realize_ctx=red_realize_ctx,
+                id=get_args_insn_id,
+                expr=reduction_expr,
+                nresults=nresults,
+                depends_on=red_realize_ctx.surrounding_depends_on,
+                within_inames=transfer_red_realize_ctx.surrounding_within_inames,
+                predicates=red_realize_ctx.surrounding_predicates,
+                )
+
+        transfer_red_realize_ctx.surrounding_insn_add_depends_on.add(
+                get_args_insn_id)
+
+    expression, red_realize_ctx.boxed_callables_table[0] = expr.operation(
+            arg_dtypes,
+            _strip_if_scalar(
+                neutral_var_names,
+                tuple(var(nvn) for nvn in neutral_var_names)),
+            reduction_expr,
+            red_realize_ctx.boxed_callables_table[0],
+            orig_kernel.target)
+
+    transfer_id = red_realize_ctx.insn_id_gen(
+            f"{red_realize_ctx.id_prefix}_{red_iname}_transfer")
+    transfer_insn = make_assignment(
+            id=transfer_id,
+            assignees=tuple(
+                partial_var[partial_index]
+                for partial_var in partial_vars),
+            expression=expression,
+            **transfer_red_realize_ctx.get_insn_kwargs())
+    red_realize_ctx.additional_insns.append(transfer_insn)
+
+    # }}}
+
+    # {{{ combine partial results
+
+    combine_iname = red_realize_ctx.var_name_gen("red_"+red_iname)
+    red_realize_ctx.domains.append(_make_slab_set(combine_iname, size))
+
+    expression, red_realize_ctx.boxed_callables_table[0] = expr.operation(
+            arg_dtypes,
+            _strip_if_scalar(acc_vars, acc_vars),
+            _strip_if_scalar(acc_vars, tuple(
+                partial_var[var(combine_iname)]
+                for partial_var in partial_vars)),
+            red_realize_ctx.boxed_callables_table[0],
+            orig_kernel.target)
+
+    combine_id = red_realize_ctx.insn_id_gen(
+            f"{red_realize_ctx.id_prefix}_{red_iname}_combine")
+    combine_insn = make_assignment(
+            id=combine_id,
+            assignees=acc_vars,
+            expression=expression,
+            within_inames=(
+                red_realize_ctx.surrounding_within_inames
+                | frozenset([combine_iname])),
+            within_inames_is_final=True,
+            depends_on=frozenset([init_id, transfer_id]),
+            predicates=red_realize_ctx.surrounding_predicates,
+            )
+    red_realize_ctx.additional_insns.append(combine_insn)
+
+    # }}}
+
+    red_realize_ctx.surrounding_insn_add_depends_on.add(combine_id)
+
+    if nresults == 1:
+        assert len(acc_vars) == 1
+        return acc_vars[0]
+    else:
+        return acc_vars
+
+# }}}
+
+
 # {{{ utils (stateful)
 
 @memoize_on_first_arg
@@ -1475,11 +1742,13 @@ def map_scan_seq(red_realize_ctx, expr, nresults, arg_dtypes,
             # Do not inherit predicates: Those might read variables
             # that may not yet be set, and we don't have a great way
             # of figuring out what the dependencies of the accumulator
-            # initializer should be.
+            # initializer should be. Predicates that only read parameters
+            # of the kernel are safe to inherit.
 
             # This way, we may initialize a few too many accumulators,
             # but that's better than being incorrect.
             # https://github.com/inducer/loopy/issues/231
+            predicates=red_realize_ctx.get_invariant_surrounding_predicates(),
             )
 
     red_realize_ctx.additional_insns.append(init_insn)
@@ -1635,11 +1904,13 @@ def map_scan_local(red_realize_ctx, expr, nresults, arg_dtypes,
             # Do not inherit predicates: Those might read variables
             # that may not yet be set, and we don't have a great way
             # of figuring out what the dependencies of the accumulator
-            # initializer should be.
+            # initializer should be. Predicates that only read parameters
+            # of the kernel are safe to inherit.
 
             # This way, we may initialize a few too many accumulators,
             # but that's better than being incorrect.
             # https://github.com/inducer/loopy/issues/231
+            predicates=red_realize_ctx.get_invariant_surrounding_predicates(),
             )
     red_realize_ctx.additional_insns.append(init_insn)
 
@@ -1831,6 +2102,7 @@ def map_reduction(
     n_sequential = len(iname_classes.sequential)
     n_local_par = len(iname_classes.local_parallel)
     n_nonlocal_par = len(iname_classes.nonlocal_parallel)
+    n_openmp_par = len(iname_classes.openmp_parallel)
 
     really_force_scan = red_realize_ctx.force_scan and (
             len(expr.inames) != 1
@@ -1877,6 +2149,27 @@ def map_reduction(
                 "before code generation."
                 % ", ".join(expr.inames))
 
+    if n_local_par and n_openmp_par:
+        raise LoopyError("Reduction over '%s' contains both local-parallel "
+                "and OpenMP-parallel inames. It must be split "
+                "(using split_reduction_{in,out}ward) "
+                "before code generation."
+                % ", ".join(expr.inames))
+
+    openmp_reduction_operator = None
+    if n_openmp_par:
+        openmp_reduction_operator = _get_openmp_reduction_operator(
+                expr.operation, reduction_dtypes)
+
+        if openmp_reduction_operator is None and (
+                n_sequential or n_openmp_par > 1):
+            raise LoopyError("Reduction over '%s' contains OpenMP-parallel "
+                    "inames, but its operation '%s' has no OpenMP reduction "
+                    "clause. It must be split (using "
+                    "split_reduction_{in,out}ward) so that the OpenMP-parallel "
+                    "iname is reduced over by itself before code generation."
+                    % (", ".join(expr.inames), expr.operation))
+
     if n_nonlocal_par:
         bad_inames = iname_classes.nonlocal_parallel
         raise LoopyError("the only form of parallelism supported "
@@ -1890,7 +2183,7 @@ def map_reduction(
 
     red_realize_ctx.changes_made()
 
-    if n_local_par == 0 and n_sequential == 0:
+    if n_local_par == 0 and n_sequential == 0 and n_openmp_par == 0:
         warn_with_kernel(red_realize_ctx.kernel, "empty_reduction",
                 "Empty reduction found (no inames to reduce over). "
                 "Eliminating.")
@@ -1906,13 +2199,15 @@ def map_reduction(
         assert red_realize_ctx.force_scan or red_realize_ctx.automagic_scans_ok
 
         # We require the "scan" iname to be tagged sequential.
-        if n_sequential:
+        if n_sequential and not n_openmp_par:
             sweep_iname = scan_param.sweep_iname
             sweep_class = _classify_reduction_inames(red_realize_ctx, (sweep_iname,))
 
             sequential = sweep_iname in sweep_class.sequential
             parallel = sweep_iname in sweep_class.local_parallel
-            bad_parallel = sweep_iname in sweep_class.nonlocal_parallel
+            bad_parallel = (
+                    sweep_iname in sweep_class.nonlocal_parallel
+                    or sweep_iname in sweep_class.openmp_parallel)
 
             if sweep_iname not in red_realize_ctx.surrounding_within_inames:
                 _error_if_force_scan_on(LoopyError,
@@ -1937,7 +2232,7 @@ def map_reduction(
             # fallthrough to reduction implementation
 
         else:
-            assert n_local_par > 0
+            assert n_local_par > 0 or n_openmp_par > 0
             scan_iname, = expr.inames
             _error_if_force_scan_on(LoopyError,
                     "Scan iname '%s' is parallel tagged: this is not allowed "
@@ -1946,11 +2241,16 @@ def map_reduction(
 
             # fallthrough to reduction implementation
 
-    if n_sequential:
+    if n_openmp_par and openmp_reduction_operator is None:
+        return map_reduction_openmp(
+                red_realize_ctx,
+                expr, nresults, arg_dtypes, reduction_dtypes)
+    elif n_sequential or n_openmp_par:
         assert n_local_par == 0
         return map_reduction_seq(
                 red_realize_ctx,
-                expr, nresults, arg_dtypes, reduction_dtypes)
+                expr, nresults, arg_dtypes, reduction_dtypes,
+                openmp_reduction_operator=openmp_reduction_operator)
     else:
         assert n_local_par > 0
         return map_reduction_local(
@@ -2223,6 +2523,15 @@ def realize_reduction(t_unit: TranslationUnit,
     to realize candidate reductions as scans using the specified iname as the
     outer (sweep) iname.
 
+    Reductions over inames tagged with
+    :class:`~loopy.kernel.data.OpenMPParallelTag` are realized sequentially
+    with their update instruction tagged with
+    :class:`~loopy.OpenMPReductionTag` if OpenMP has a reduction clause for
+    the operation (sum, product, max, min, any and all of non-complex
+    types). Otherwise, the reduction must be over a single such iname of
+    constant length, and each iteration stores its contribution into an
+    array of partial results that is combined after the parallel loop.
+
     :arg insn_id_filter: Can be one of:
         - An instance of :class:`str` specifying the ID of the instruction
           whose reductions are to be realized.
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+
+__copyright__ = "Copyright (C) 2026 agent"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from loopy.kernel import LoopKernel
+from loopy.transform.iname import _USED_INAME_TRACKER, _UsedInameTracker
+from loopy.translation_unit import TranslationUnit
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+__doc__ = """
+Scripts tuning a kernel frequently apply a long sequence of
+transformations::
+
+    session = lp.TransformationSession(t_unit)
+    session.apply(lp.split_iname, "i", 16)
+    session.apply(lp.rename_iname, "i_inner", "ii")
+    ...
+    t_unit = session.commit()
+
+Within a session, transformations that remove the inames they render unused
+(such as :func:`loopy.rename_inames`) only examine the instructions that
+changed since the previous transformation to find those inames, rather than
+rescanning the whole kernel at each step. Information that
+:class:`~loopy.LoopKernel` derives from its instructions, domains and
+variables is carried over from one transformation to the next as long as
+its inputs remain unchanged.
+
+.. autoclass:: TransformationSession
+"""
+
+
+KernelOrTUnitT = TypeVar("KernelOrTUnitT", LoopKernel, TranslationUnit)
+
+
+# {{{ transformation session
+
+class TransformationSession(Generic[KernelOrTUnitT]):
+    """Applies a sequence of transformations to a :class:`~loopy.LoopKernel`
+    or a :class:`~loopy.TranslationUnit`.
+
+    The result is the same as when applying the transformations directly.
+
+    .. attribute:: current
+
+        The result of the transformations applied so far.
+
+    .. attribute:: ntransformations
+
+        The number of transformations applied so far.
+
+    .. automethod:: apply
+    .. automethod:: commit
+    """
+
+    def __init__(self, kernel_or_t_unit: KernelOrTUnitT) -> None:
+        self.current = kernel_or_t_unit
+        self.ntransformations = 0
+        self._used_iname_tracker = _UsedInameTracker()
+
+    def apply(self,
+              transform: Callable[..., KernelOrTUnitT],
+              *args: Any, **kwargs: Any) -> TransformationSession[KernelOrTUnitT]:
+        """Applies *transform* to the current kernel or translation unit,
+        passing *args* and *kwargs* as further arguments.
+
+        :returns: *self*, to allow chaining calls.
+        """
+        token = _USED_INAME_TRACKER.set(self._used_iname_tracker)
+        try:
+            self.current = transform(self.current, *args, **kwargs)
+        finally:
+            _USED_INAME_TRACKER.reset(token)
+
+        self.ntransformations += 1
+        return self
+
+    def commit(self) -> KernelOrTUnitT:
+        """Ends the session and returns the result of all transformations
+        applied during it.
+        """
+        self._used_iname_tracker = _UsedInameTracker()
+        return self.current
+
+# }}}
+
+# vim: foldmethod=marker
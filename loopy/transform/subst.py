@@ -90,6 +90,7 @@ def extract_subst(kernel, subst_name, template, parameters=(),
 
     from loopy.match import parse_match
     within = parse_match(within)
+    matching_insn_ids = within.get_matching_insn_ids(kernel)
 
     var_name_gen = kernel.get_var_name_generator()
 
@@ -144,7 +145,7 @@ def extract_subst(kernel, subst_name, template, parameters=(),
 
     from loopy.kernel.instruction import MultiAssignmentBase
     for insn in kernel.instructions:
-        if isinstance(insn, MultiAssignmentBase) and within(kernel, insn):
+        if isinstance(insn, MultiAssignmentBase) and insn.id in matching_insn_ids:
             dfmapper(insn.assignees)
             dfmapper(insn.expression)
 
@@ -203,7 +204,7 @@ def extract_subst(kernel, subst_name, template, parameters=(),
             raise ValueError("assignment LHS not understood")
 
     for insn in kernel.instructions:
-        if within(kernel, insn):
+        if insn.id in matching_insn_ids:
             new_insns.append(insn.with_transformed_expressions(
                 cbmapper, assignee_f=transform_assignee))
         else:
@@ -0,0 +1,449 @@
+from __future__ import annotations
+
+
+__copyright__ = "Copyright (C) 2026 agent"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+
+import itertools
+import logging
+from typing import TYPE_CHECKING
+
+import islpy as isl
+from islpy import dim_type
+
+from loopy.diagnostic import (
+    LoopyError,
+    UnableToDetermineAccessRangeError,
+    warn_with_kernel,
+)
+from loopy.kernel.data import MultiAssignmentBase
+from loopy.kernel.function_interface import CallableKernel
+from loopy.symbolic import ArrayAccessFinder, SubstitutionRuleExpander
+from loopy.translation_unit import TranslationUnit
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from loopy.kernel import LoopKernel
+    from loopy.kernel.instruction import InstructionBase
+
+
+logger = logging.getLogger(__name__)
+
+
+__doc__ = """
+.. currentmodule:: loopy
+
+.. autofunction:: auto_tile
+"""
+
+
+DEFAULT_TILE_SIZES = (4, 8, 16, 32, 64, 128, 256)
+
+
+# {{{ band detection
+
+def _get_band_inames(kernel: LoopKernel, insn: InstructionBase) -> frozenset[str]:
+    return frozenset(iname for iname in insn.within_inames
+                     if not kernel.iname_tags(iname))
+
+
+def _find_perfectly_nested_band(kernel: LoopKernel) -> tuple[str, ...]:
+    """Returns the largest set of untagged inames for which every instruction
+    is nested either in all or in none of them, ordered as they occur in the
+    kernel's domains.
+    """
+    band: frozenset[str] = frozenset()
+
+    for start_insn in kernel.instructions:
+        candidate = _get_band_inames(kernel, start_insn)
+
+        changed = True
+        while changed:
+            changed = False
+            for insn in kernel.instructions:
+                if (insn.within_inames & candidate
+                        and not candidate <= insn.within_inames):
+                    candidate = candidate & insn.within_inames
+                    changed = True
+
+        if len(candidate) > len(band):
+            band = candidate
+
+    return tuple(
+            iname
+            for dom in kernel.domains
+            for iname in dom.get_var_names(dim_type.set)
+            if iname in band)
+
+# }}}
+
+
+# {{{ footprint estimation
+
+def _count_points_estimate(set_: isl.Set) -> int:
+    """Returns the number of points in the bounded set *set_*, estimated by the
+    bounding boxes of its disjoint pieces.
+    """
+    result = 0
+    for bset in set_.coalesce().make_disjoint().get_basic_sets():
+        bset = isl.Set.from_basic_set(bset)
+        npoints = 1
+        for i in range(bset.dim(dim_type.set)):
+            npoints *= (
+                    bset.dim_max_val(i).to_python()
+                    - bset.dim_min_val(i).to_python() + 1)
+        result += npoints
+
+    return result
+
+
+class _FootprintEstimator:
+    """Estimates the number of bytes of array data accessed by one tile of
+    a band of inames.
+
+    .. attribute:: extents
+
+        A mapping from the band's inames to their (maximal) number of
+        iterations.
+    """
+
+    def __init__(self,
+                kernel: LoopKernel,
+                typed_kernel: LoopKernel,
+                band: Sequence[str],
+                parameters: Mapping[str, int]) -> None:
+        self.typed_kernel = typed_kernel
+        self.band = band
+
+        band_insns = [insn for insn in kernel.instructions
+                      if set(band) <= insn.within_inames]
+
+        # Inames shared with instructions outside of the band must enclose it,
+        # as must those prioritized before one of its inames. All others are
+        # conservatively assumed to be nested inside the band.
+        outer_inames: set[str] = set()
+        for insn in kernel.instructions:
+            if not set(band) <= insn.within_inames:
+                outer_inames.update(insn.within_inames)
+        for priority in kernel.loop_priority:
+            for i, iname in enumerate(priority):
+                if set(priority[i+1:]) & set(band):
+                    outer_inames.add(iname)
+        outer_inames -= set(band)
+
+        expand_rules = SubstitutionRuleExpander(kernel.substitutions)
+
+        self.domains_and_accesses: list[tuple[isl.Set, frozenset]] = []
+        self.extents = dict.fromkeys(band, 0)
+
+        for insn in band_insns:
+            if not isinstance(insn, MultiAssignmentBase):
+                raise LoopyError(f"auto_tile: instruction '{insn.id}' in the "
+                        "band is not an assignment")
+
+            insn_inames = insn.within_inames | insn.reduction_inames()
+            domain = (kernel.get_inames_domain(insn_inames)
+                      .project_out_except(insn_inames, [dim_type.set]))
+
+            for i in range(domain.dim(dim_type.param)):
+                param_name = domain.get_dim_name(dim_type.param, i)
+                try:
+                    value = parameters[param_name]
+                except KeyError:
+                    raise LoopyError(f"auto_tile needs a value for parameter "
+                            f"'{param_name}' to evaluate footprints, pass it "
+                            "in 'parameters'") from None
+                domain = domain.fix_val(dim_type.param, i, value)
+
+            if not domain.is_bounded():
+                raise LoopyError("auto_tile: the domain of instruction "
+                        f"'{insn.id}' is unbounded")
+
+            var_dict = domain.get_var_dict()
+            for iname in band:
+                _, idx = var_dict[iname]
+                self.extents[iname] = max(
+                        self.extents[iname],
+                        domain.dim_max_val(idx).to_python()
+                        - domain.to_set().dim_min_val(idx).to_python() + 1)
+
+            # place the tile in the first iteration of the enclosing loops
+            for iname in sorted(outer_inames & insn_inames):
+                _, idx = var_dict[iname]
+                domain = domain.fix_val(
+                        dim_type.set, idx, domain.to_set().dim_min_val(idx))
+
+            access_finder = ArrayAccessFinder()
+            accesses = frozenset().union(*(
+                    access_finder(expand_rules(expr))
+                    for expr in (*insn.assignees, insn.expression)))
+
+            self.domains_and_accesses.append((domain, accesses))
+
+    def __call__(self, tile_sizes: Mapping[str, int]) -> int:
+        """Returns the estimated number of bytes accessed by the first tile of
+        the band with *tile_sizes* iterations along each of its inames.
+        """
+        from loopy.isl_helpers import make_slab
+        from loopy.symbolic import get_access_map
+
+        footprints: dict[str, isl.Set] = {}
+
+        for domain, accesses in self.domains_and_accesses:
+            var_dict = domain.get_var_dict()
+            tile = domain
+            for iname, size in tile_sizes.items():
+                _, idx = var_dict[iname]
+                start = tile.to_set().dim_min_val(idx).to_python()
+                tile = tile & make_slab(tile.space, iname, start, start + size)
+
+            for access in accesses:
+                name = access.aggregate.name
+                index = (access.index if isinstance(access.index, tuple)
+                         else (access.index,))
+
+                try:
+                    footprint = get_access_map(tile, index).range()
+                except (isl.Error, TypeError, UnableToDetermineAccessRangeError):
+                    # Likely: index was non-linear, nothing we can do.
+                    continue
+
+                if name in footprints:
+                    footprints[name] = footprints[name] | footprint
+                else:
+                    footprints[name] = footprint
+
+        result = 0
+        for name, footprint in footprints.items():
+            dtype = self.typed_kernel.get_var_descriptor(name).dtype
+            if dtype is None:
+                raise LoopyError(f"auto_tile needs the type of '{name}' to "
+                        "evaluate footprints")
+            result += (dtype.numpy_dtype.itemsize
+                       * _count_points_estimate(footprint))
+
+        return result
+
+# }}}
+
+
+# {{{ auto_tile
+
+def _auto_tile_kernel(
+            kernel: LoopKernel,
+            typed_kernel: LoopKernel,
+            cache_sizes: Sequence[int],
+            inames: Sequence[str] | str | None,
+            parameters: Mapping[str, int] | None,
+            tile_sizes: Sequence[int]) -> LoopKernel:
+    if not cache_sizes:
+        raise LoopyError("auto_tile needs at least one cache size")
+
+    if inames is None:
+        band = _find_perfectly_nested_band(kernel)
+        if not band:
+            raise LoopyError(f"{kernel.name}: auto_tile found no perfectly "
+                    "nested band of untagged inames")
+    else:
+        if isinstance(inames, str):
+            inames = [iname.strip() for iname in inames.split(",")]
+        band = tuple(inames)
+
+        for insn in kernel.instructions:
+            if (insn.within_inames & set(band)
+                    and not set(band) <= insn.within_inames):
+                raise LoopyError(f"inames {', '.join(band)} do not form a "
+                        f"perfectly nested band: instruction '{insn.id}' is "
+                        "nested in only some of them")
+
+    for iname in band:
+        if kernel.iname_tags(iname):
+            raise LoopyError(f"auto_tile cannot tile tagged iname '{iname}'")
+
+    estimate_footprint = _FootprintEstimator(
+            kernel, typed_kernel, band, parameters or {})
+
+    # {{{ choose tile sizes
+
+    # level_tile_sizes[i] maps each iname tiled for cache level i to its
+    # tile size
+    level_tile_sizes: list[dict[str, int]] = []
+    prev_sizes: dict[str, int | None] = dict.fromkeys(band, 1)
+
+    for cache_size in cache_sizes:
+        options_per_iname = []
+        for iname in band:
+            prev_size = prev_sizes[iname]
+            if prev_size is None:
+                options = [None]
+            else:
+                options = [
+                        size for size in tile_sizes
+                        if size % prev_size == 0 and size > prev_size
+                        and size < estimate_footprint.extents[iname]]
+                if prev_size > 1:
+                    options.append(prev_size)
+                options.append(None)
+            options_per_iname.append(options)
+
+        best_sizes = None
+        best_key = None
+        for sizes in itertools.product(*options_per_iname):
+            tile = {iname: size for iname, size in zip(band, sizes, strict=True)
+                    if size is not None}
+            if not tile:
+                continue
+
+            nbytes = estimate_footprint(tile)
+            if nbytes == 0:
+                # no footprint could be determined, nothing to go by
+                continue
+            if nbytes > cache_size:
+                continue
+
+            niterations = 1
+            for iname, size in zip(band, sizes, strict=True):
+                niterations *= (
+                        estimate_footprint.extents[iname] if size is None
+                        else size)
+
+            key = (niterations / nbytes, niterations)
+            if best_key is None or key > best_key:
+                best_sizes = sizes
+                best_key = key
+
+        if best_sizes is None:
+            continue
+
+        new_sizes = dict(zip(band, best_sizes, strict=True))
+        if new_sizes == prev_sizes:
+            continue
+
+        logger.info("%s: tiling %s with sizes %s for a %d byte cache",
+                kernel.name, ", ".join(band),
+                ", ".join(str(size) for size in best_sizes), cache_size)
+
+        level_tile_sizes.append({
+                iname: size for iname, size in new_sizes.items()
+                if size is not None and size != prev_sizes[iname]})
+        prev_sizes = new_sizes
+
+    if not level_tile_sizes:
+        warn_with_kernel(kernel, "auto_tile_no_fit",
+                f"auto_tile found no tiling of {', '.join(band)} whose "
+                "footprint fits into any of the caches, not tiling")
+        return kernel
+
+    # }}}
+
+    # {{{ block the loop nest
+
+    from loopy.transform.iname import prioritize_loops, split_iname
+
+    point_inames = {iname: iname for iname in band}
+    tile_loop_levels: list[list[str]] = []
+
+    for sizes in reversed(level_tile_sizes):
+        tile_inames = []
+        for iname in band:
+            if iname not in sizes:
+                continue
+
+            vng = kernel.get_var_name_generator()
+            outer_iname = vng(point_inames[iname] + "_outer")
+            inner_iname = vng(point_inames[iname] + "_inner")
+            kernel = split_iname(kernel, point_inames[iname], sizes[iname],
+                    outer_iname=outer_iname, inner_iname=inner_iname)
+
+            tile_inames.append(outer_iname)
+            point_inames[iname] = inner_iname
+
+        tile_loop_levels.append(tile_inames)
+
+    return prioritize_loops(kernel, [
+            *(iname for tile_inames in tile_loop_levels for iname in tile_inames),
+            *(point_inames[iname] for iname in band)])
+
+    # }}}
+
+
+def auto_tile(
+            kernel: TranslationUnit | LoopKernel,
+            cache_sizes: Sequence[int],
+            inames: Sequence[str] | str | None = None,
+            parameters: Mapping[str, int] | None = None,
+            tile_sizes: Sequence[int] = DEFAULT_TILE_SIZES):
+    """Blocks a perfectly nested band of loops for the cache hierarchy
+    described by *cache_sizes*.
+
+    For each cache level, tile sizes for the inames of the band are chosen
+    among *tile_sizes* so that the estimated amount of array data accessed by
+    one tile fits into the cache, maximizing the number of iterations per
+    byte accessed. Each tile size is a multiple of the one chosen for the next
+    smaller cache level. Inames may also be left untiled at a level, in which
+    case one tile spans all their iterations. The band is then blocked with
+    :func:`loopy.split_iname` and :func:`loopy.prioritize_loops`, with the
+    loops over the tiles of the largest cache outermost. Cache levels into
+    which no tiling fits are skipped. If there are no others, the kernel is
+    returned unchanged.
+
+    The data accessed by a tile is estimated by the bounding boxes of the
+    footprints of its array accesses, for the first tile of the band. Loops
+    enclosing the band are assumed to be in their first iteration, and all
+    other loops of the band's instructions, including reductions, to run
+    in their entirety within the tile. The types of the accessed arrays must
+    be known or inferable. Accesses whose footprint cannot be determined,
+    such as those with non-affine indices, are ignored.
+
+    :arg cache_sizes: the capacities of the caches in bytes, from the
+        smallest to the largest.
+    :arg inames: a sequence of inames (or a comma-separated string) forming
+        a perfectly nested band, i.e. such that every instruction is nested
+        in either all or none of them. Defaults to the largest such band of
+        untagged inames. The order of the inames is kept within the blocked
+        loop nest.
+    :arg parameters: a mapping from the names of the kernel's domain
+        parameters to values for which to evaluate footprints.
+    :arg tile_sizes: the candidate tile sizes.
+    """
+    if isinstance(kernel, TranslationUnit):
+        from loopy.type_inference import infer_unknown_types
+        typed_t_unit = infer_unknown_types(kernel, expect_completion=False)
+
+        t_unit = kernel
+        for name, clbl in kernel.callables_table.items():
+            if isinstance(clbl, CallableKernel):
+                t_unit = t_unit.with_kernel(_auto_tile_kernel(
+                        clbl.subkernel, typed_t_unit[name], cache_sizes,
+                        inames, parameters, tile_sizes))
+
+        return t_unit
+
+    return _auto_tile_kernel(
+            kernel, kernel, cache_sizes, inames, parameters, tile_sizes)
+
+# }}}
+
+# vim: foldmethod=marker
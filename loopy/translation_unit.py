@@ -57,6 +57,8 @@ from loopy.symbolic import (
 
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from loopy.kernel import LoopKernel
     from loopy.target import TargetBase
     from loopy.target.execution import ExecutorBase
@@ -343,7 +345,11 @@ class TranslationUnit:
                              " determined.")
 
     def executor(self,
-                 *args, entrypoint: str | None = None, **kwargs) -> ExecutorBase:
+                 *args, entrypoint: str | None = None,
+                 specialize_on: Sequence[str] | None = None,
+                 specialization_threshold: int = 10,
+                 max_specializations: int = 8,
+                 **kwargs) -> ExecutorBase:
         """Return an object that hosts caches of compiled code for execution (i.e.
         a subclass of :class:`ExecutorBase`, specific to an execution
         environment (e.g. an OpenCL context) and a given entrypoint.
@@ -352,6 +358,13 @@ class TranslationUnit:
             Defaults to :attr:`default_entrypoint`.
             An error will result if multiple entrypoints exist and no
             entrypoint is specified.
+        :arg specialize_on: If given, a sequence of names of integer
+            :class:`~loopy.ValueArg` arguments of the entrypoint. A
+            :class:`~loopy.target.execution.ValueSpecializingExecutor` is
+            returned, which compiles variants of the entrypoint specialized
+            to values of these arguments that were passed at least
+            *specialization_threshold* times, up to *max_specializations*
+            variants.
 
         The variable arguments to this are target-specific. The
         :class:`PyOpenCLTarget` takes a :class:`~pyopencl.Context` or a
@@ -380,6 +393,14 @@ class TranslationUnit:
                         "Maybe you want to invoke 'with_entrypoints' before "
                         "calling the translation unit?")
 
+        if specialize_on:
+            from loopy.target.execution import ValueSpecializingExecutor
+            return ValueSpecializingExecutor(
+                    self, entrypoint, args, kwargs,
+                    specialize_on=specialize_on,
+                    specialization_threshold=specialization_threshold,
+                    max_specializations=max_specializations)
+
         return self.target.get_kernel_executor(self, *args,
                                                entrypoint=entrypoint, **kwargs)
 
@@ -29,7 +29,8 @@ THE SOFTWARE.
 
 import logging
 from collections.abc import Iterable, Mapping, Sequence
-from typing import TYPE_CHECKING, Any, Literal, cast, overload
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal, TypeAlias, cast, overload
 
 import numpy as np
 from typing_extensions import override
@@ -51,10 +52,11 @@ from loopy.symbolic import (
     ResolvedFunction,
     RuleAwareIdentityMapper,
     SubArrayRef,
-    SubstitutionRuleExpander,
     SubstitutionRuleMappingContext,
     TaggedVariable,
     TypeCast,
+    WalkMapper,
+    get_dependencies,
     parse_tagged_name,
 )
 from loopy.translation_unit import (
@@ -107,29 +109,74 @@ def get_return_types_as_tuple(arg_id_to_dtype):
 class FunctionNameChanger(RuleAwareIdentityMapper):
     """
     Changes the names of scoped functions in calls of expressions according to
-    the mapping ``calls_to_new_functions``
+    the mapping ``calls_to_new_functions``.
+
+    The mapping is keyed by ``(context, call)``, where *context* is *None* for
+    calls appearing directly in the kernel and ``(rule_name, arg_dtypes)`` for
+    calls appearing in the body of a substitution rule invoked with arguments
+    of types *arg_dtypes*. For invocations of substitution rules, the mapping
+    holds the argument types of the invocation (see
+    :meth:`TypeInferenceMapper.map_subst_rule_invocation`).
     """
 
-    def __init__(self, rule_mapping_context, calls_to_new_names,
-            subst_expander):
+    def __init__(self, rule_mapping_context, calls_to_new_names):
         super().__init__(rule_mapping_context)
         self.calls_to_new_names = calls_to_new_names
-        self.subst_expander = subst_expander
 
-    def map_call(self, expr, expn_state):
-        name, tag = parse_tagged_name(expr.function)
+    def map_variable(self, expr, expn_state, context=None):
+        name, tags = parse_tagged_name(expr)
 
         if name not in self.rule_mapping_context.old_subst_rules:
-            expanded_expr = self.subst_expander(expn_state.apply_arg_context(expr))
-            if expanded_expr in self.calls_to_new_names:
+            return super().map_variable(expr, expn_state, context)
+        else:
+            return self.map_subst_rule_invocation(
+                    expr, name, tags, (), expn_state, context)
+
+    map_tagged_variable = map_variable
+
+    def map_call(self, expr, expn_state, context=None):
+        name, tags = parse_tagged_name(expr.function)
+
+        if name not in self.rule_mapping_context.old_subst_rules:
+            new_name = self.calls_to_new_names.get((context, expr))
+            if new_name is not None:
                 return type(expr)(
-                        ResolvedFunction(self.calls_to_new_names[expanded_expr]),
-                        tuple(self.rec(child, expn_state)
+                        ResolvedFunction(new_name),
+                        tuple(self.rec(child, expn_state, context)
                               for child in expr.parameters))
             else:
-                return super().map_call(expr, expn_state)
+                return super().map_call(expr, expn_state, context)
         else:
-            return self.map_subst_rule(name, tag, expr.parameters, expn_state)
+            return self.map_subst_rule_invocation(
+                    expr, name, tags, expr.parameters, expn_state, context)
+
+    def map_subst_rule_invocation(self, expr, name, tags, arguments,
+                                  expn_state, context):
+        # Unlike RuleAwareIdentityMapper.map_subst_rule, the arguments and the
+        # rule body are mapped in different contexts.
+        rule = self.rule_mapping_context.old_subst_rules[name]
+        rule_context = (name, self.calls_to_new_names.get((context, expr)))
+
+        rec_arguments = tuple(self.rec(arg, expn_state, context)
+                              for arg in arguments)
+
+        from loopy.match import ConcreteMatchable
+        new_expn_state = expn_state.copy(
+                stack=(*expn_state.stack, ConcreteMatchable(name, tags)),
+                arg_context=self.make_new_arg_context(
+                    name, rule.arguments, rec_arguments, expn_state.arg_context))
+
+        result = self.rec(rule.expression, new_expn_state, rule_context)
+
+        new_name = self.rule_mapping_context.register_subst_rule(
+                name, rule.arguments, result)
+
+        sym = TaggedVariable(new_name, tags) if tags else Variable(new_name)
+
+        if arguments:
+            return sym(*rec_arguments)
+        else:
+            return sym
 
     def map_call_with_kwargs(self, expr):
         # See https://github.com/inducer/loopy/pull/323
@@ -138,14 +185,16 @@ class FunctionNameChanger(RuleAwareIdentityMapper):
 
 def change_names_of_pymbolic_calls(
             kernel: LoopKernel,
-            pymbolic_calls_to_new_names: Mapping[p.Call, CallableId]
+            pymbolic_calls_to_new_names: Mapping[
+                tuple[SubstRuleContext | None, p.Call | p.Variable],
+                CallableId | tuple[LoopyType | None, ...]],
         ):
     """
     Returns a copy of *kernel* with the names of pymbolic calls changed
     according to the mapping given by *pymbolic_calls_new_names*.
 
-    :arg pymbolic_calls_to_new_names: A mapping from instances of
-        :class:`pymbolic.primitives.Call` to :class:`str`.
+    :arg pymbolic_calls_to_new_names: A mapping from ``(context, call)``
+        to :class:`str`, as described in :class:`FunctionNameChanger`.
 
     **Example: **
 
@@ -176,8 +225,8 @@ def change_names_of_pymbolic_calls(
 
         .. code::
 
-            {Call(ResolvedFunction(Variable('sin')), (Subscript(Variable('x'),
-            Variable('i')),))": 'sin_1'}
+            {(None, Call(ResolvedFunction(Variable('sin')),
+            (Subscript(Variable('x'), Variable('i')),))): 'sin_1'}
 
         - The following *kernel* is returned --
 
@@ -204,9 +253,8 @@ def change_names_of_pymbolic_calls(
     """
     rule_mapping_context = SubstitutionRuleMappingContext(
                     kernel.substitutions, kernel.get_var_name_generator())
-    subst_expander = SubstitutionRuleExpander(kernel.substitutions)
     name_changer = FunctionNameChanger(rule_mapping_context,
-            pymbolic_calls_to_new_names, subst_expander)
+            pymbolic_calls_to_new_names)
 
     return rule_mapping_context.finish_kernel(
             name_changer.map_kernel(kernel))
@@ -216,22 +264,64 @@ def change_names_of_pymbolic_calls(
 
 # {{{ type inference mapper
 
+SubstRuleContext: TypeAlias = "tuple[str, tuple[LoopyType | None, ...]]"
+
+
+@dataclass(frozen=True)
+class _SubstRuleTypeInferenceResult:
+    dtypes: tuple[LoopyType, ...] | tuple[tuple[LoopyType, ...], ...]
+    symbols_with_unknown_types: frozenset[str]
+    calls_to_new_calls: Mapping[
+            tuple[SubstRuleContext | None, p.Call | p.Variable],
+            ReductionOpFunction | p.Variable | tuple[LoopyType | None, ...]]
+
+
 class TypeInferenceMapper(CombineMapper[Sequence[LoopyType], []]):
+    """
+    Substitution rule invocations are not expanded. Instead, the body of
+    each invoked rule is inferred once per signature of argument types
+    and the result is memoized in :attr:`subst_rule_type_cache`, see
+    :meth:`map_subst_rule_invocation`.
+
+    .. attribute:: subst_rule_type_cache
+
+        A mapping from ``(rule_name, arg_dtypes, return_tuple)`` to the
+        outcome of inferring the type of the rule's body. Shared between
+        copies of the mapper made by :meth:`copy`. As the outcome depends on
+        the types of the kernel's variables, the cache must be cleared by the
+        user whenever one of them changes.
+
+    .. automethod:: map_subst_rule_invocation
+    """
+
     kernel: LoopKernel
     clbl_inf_ctx: CallablesInferenceContext
     symbols_with_unknown_types: set[str]
     new_assignments: dict[str, TemporaryVariable | KernelArgument]
-    old_calls_to_new_calls: dict[p.Call, ReductionOpFunction | p.Variable]
-
-    def __init__(self, kernel, clbl_inf_ctx, new_assignments=None):
+    old_calls_to_new_calls: dict[
+            tuple[SubstRuleContext | None, p.Call | p.Variable],
+            ReductionOpFunction | p.Variable | tuple[LoopyType | None, ...]]
+    subst_rule_context: SubstRuleContext | None
+    subst_rule_arg_types: Mapping[str, Sequence[LoopyType]]
+    subst_rule_type_cache: dict[
+            tuple[str, tuple[LoopyType | None, ...], bool],
+            _SubstRuleTypeInferenceResult]
+
+    def __init__(self, kernel, clbl_inf_ctx, new_assignments=None,
+                 subst_rule_type_cache=None):
         self.kernel = kernel
         assert isinstance(clbl_inf_ctx, CallablesInferenceContext)
         if new_assignments is None:
             new_assignments = {}
+        if subst_rule_type_cache is None:
+            subst_rule_type_cache = {}
         self.new_assignments = new_assignments
         self.symbols_with_unknown_types = set()
         self.clbl_inf_ctx = clbl_inf_ctx
         self.old_calls_to_new_calls = {}
+        self.subst_rule_context = None
+        self.subst_rule_arg_types = {}
+        self.subst_rule_type_cache = subst_rule_type_cache
         super().__init__()
 
     @overload
@@ -303,11 +393,18 @@ class TypeInferenceMapper(CombineMapper[Sequence[LoopyType], []]):
     # /!\ Introduce caches with care--numpy.float32(x) and numpy.float64(x)
     # are Python-equal (for many common constants such as integers).
 
+    @override
+    def get_cache_key(self, expr, *args, **kwargs):
+        # The type of an expression in a substitution rule's body depends on
+        # the types bound to the rule's arguments.
+        return (self.subst_rule_context,
+                super().get_cache_key(expr, *args, **kwargs))
+
     def copy(self, clbl_inf_ctx=None):
         if clbl_inf_ctx is None:
             clbl_inf_ctx = self.clbl_inf_ctx
         return type(self)(self.kernel, clbl_inf_ctx,
-                self.new_assignments)
+                self.new_assignments, self.subst_rule_type_cache)
 
     def with_assignments(self, names_to_vars):
         new_ass = self.new_assignments.copy()
@@ -493,6 +590,12 @@ class TypeInferenceMapper(CombineMapper[Sequence[LoopyType], []]):
     def map_call(self, expr: p.Call, return_tuple: bool = False):  # pyright: ignore[reportIncompatibleMethodOverride]
         identifier = expr.function
 
+        if isinstance(identifier, Variable):
+            name, _ = parse_tagged_name(identifier)
+            if name in self.kernel.substitutions:
+                return self.map_subst_rule_invocation(
+                        expr, name, expr.parameters, return_tuple)
+
         if not isinstance(identifier, ResolvedFunction):
             # function not resolved => exit
             return []
@@ -518,7 +621,8 @@ class TypeInferenceMapper(CombineMapper[Sequence[LoopyType], []]):
                     identifier.function,
                     in_knl_callable))
 
-        self.old_calls_to_new_calls[expr] = new_function_id
+        self.old_calls_to_new_calls[self.subst_rule_context, expr] = (
+                new_function_id)
 
         new_arg_id_to_dtype = in_knl_callable.arg_id_to_dtype
 
@@ -534,12 +638,81 @@ class TypeInferenceMapper(CombineMapper[Sequence[LoopyType], []]):
 
         return []
 
+    def map_subst_rule_invocation(self,
+                expr: p.Call | p.Variable,
+                name: str,
+                arguments: Sequence[Expression],
+                return_tuple: bool = False,
+            ) -> Sequence[LoopyType] | Sequence[tuple[LoopyType, ...]]:
+        """Infers the type of the invocation *expr* of the substitution
+        rule *name* with *arguments*. The body of the rule is traversed only
+        once for each signature of argument types, with the rule's arguments
+        bound to the types of *arguments*.
+        """
+        arg_dtypes = tuple(
+                dtypes[0] if (dtypes := self.rec(arg)) else None
+                for arg in arguments)
+
+        self.old_calls_to_new_calls[self.subst_rule_context, expr] = arg_dtypes
+
+        cache_key = (name, arg_dtypes, return_tuple)
+        try:
+            result = self.subst_rule_type_cache[cache_key]
+        except KeyError:
+            rule = self.kernel.substitutions[name]
+            if len(rule.arguments) != len(arguments):
+                raise LoopyError("number of arguments to '%s' does not match "
+                        "definition" % name) from None
+
+            outer_state = (self.subst_rule_context, self.subst_rule_arg_types,
+                    self.old_calls_to_new_calls, self.symbols_with_unknown_types)
+
+            self.subst_rule_context = (name, arg_dtypes)
+            self.subst_rule_arg_types = {
+                    arg_name: [] if dtype is None else [dtype]
+                    for arg_name, dtype in zip(
+                        rule.arguments, arg_dtypes, strict=True)}
+            self.old_calls_to_new_calls = {}
+            self.symbols_with_unknown_types = set()
+
+            try:
+                if return_tuple:
+                    # FIXME: type ignore because the return_tuple scheme is broken
+                    dtypes = self.rec(rule.expression, return_tuple=True)  # pyright: ignore[reportCallIssue]
+                else:
+                    dtypes = self.rec(rule.expression)
+
+                result = _SubstRuleTypeInferenceResult(
+                        dtypes=tuple(dtypes),
+                        symbols_with_unknown_types=frozenset(
+                            self.symbols_with_unknown_types),
+                        calls_to_new_calls=self.old_calls_to_new_calls)
+            finally:
+                (self.subst_rule_context, self.subst_rule_arg_types,
+                    self.old_calls_to_new_calls,
+                    self.symbols_with_unknown_types) = outer_state
+
+            self.subst_rule_type_cache[cache_key] = result
+
+        self.old_calls_to_new_calls.update(result.calls_to_new_calls)
+        self.symbols_with_unknown_types.update(result.symbols_with_unknown_types)
+
+        return list(result.dtypes)
+
     def map_call_with_kwargs(self, expr):
         # See https://github.com/inducer/loopy/pull/323
         raise NotImplementedError
 
     @override
     def map_variable(self, expr: p.Variable | TaggedVariable):  # pyright: ignore[reportIncompatibleMethodOverride]
+        name, _ = parse_tagged_name(expr)
+
+        if name in self.subst_rule_arg_types:
+            return self.subst_rule_arg_types[name]
+
+        if name in self.kernel.substitutions:
+            return self.map_subst_rule_invocation(expr, name, ())
+
         if expr.name in self.kernel.all_inames():
             return [self.kernel.index_dtype]
 
@@ -696,6 +869,11 @@ class TypeReader(TypeInferenceMapper):
         self.kernel = kernel
         self.callables = callables
         self.new_assignments = new_assignments
+        self.symbols_with_unknown_types = set()
+        self.old_calls_to_new_calls = {}
+        self.subst_rule_context = None
+        self.subst_rule_arg_types = {}
+        self.subst_rule_type_cache = {}
         CombineMapper.__init__(self)
 
     # {{{ disabled interface
@@ -781,7 +959,7 @@ class TypeReader(TypeInferenceMapper):
 
 # {{{ infer single variable
 
-def _infer_var_type(kernel, var_name, type_inf_mapper, subst_expander):
+def _infer_var_type(kernel, var_name, type_inf_mapper):
 
     if var_name in kernel.all_params():
         return [kernel.index_dtype], [], {}, (
@@ -801,7 +979,7 @@ def _infer_var_type(kernel, var_name, type_inf_mapper, subst_expander):
         if not isinstance(writer_insn, lp.MultiAssignmentBase):
             continue
 
-        expr = subst_expander(writer_insn.expression)
+        expr = writer_insn.expression
 
         debug("             via expr %s", expr)
         if isinstance(writer_insn, lp.Assignment):
@@ -844,6 +1022,66 @@ def _infer_var_type(kernel, var_name, type_inf_mapper, subst_expander):
 # }}}
 
 
+# {{{ substitution rule dependencies
+
+class _SubstRuleInvocationCollector(WalkMapper[[]]):
+    def __init__(self, rules: Mapping[str, Any]) -> None:
+        super().__init__()
+        self.rules = rules
+        self.invoked_rules: set[str] = set()
+
+    @override
+    def map_variable(self, expr: p.Variable) -> None:
+        name, _ = parse_tagged_name(expr)
+        if name in self.rules:
+            self.invoked_rules.add(name)
+
+    map_tagged_variable = map_variable  # pyright: ignore[reportAssignmentType]
+
+
+def _get_invoked_subst_rule_names(
+            expr: Expression, rules: Mapping[str, Any]
+        ) -> frozenset[str]:
+    if not rules:
+        return frozenset()
+
+    collector = _SubstRuleInvocationCollector(rules)
+    collector(expr)
+    return frozenset(collector.invoked_rules)
+
+
+def _get_subst_rule_read_dependency_names(
+            kernel: LoopKernel
+        ) -> dict[str, frozenset[str]]:
+    """Returns a mapping from the name of each substitution rule of *kernel*
+    to the names read by the rule's body, including those read by the rules it
+    invokes.
+    """
+    result: dict[str, frozenset[str]] = {}
+
+    def get_deps(name: str) -> frozenset[str]:
+        try:
+            return result[name]
+        except KeyError:
+            pass
+
+        rule = kernel.substitutions[name]
+        deps = get_dependencies(rule.expression) - frozenset(rule.arguments)
+        for invoked_name in _get_invoked_subst_rule_names(
+                rule.expression, kernel.substitutions):
+            deps = deps | get_deps(invoked_name)
+
+        result[name] = deps
+        return deps
+
+    for name in kernel.substitutions:
+        get_deps(name)
+
+    return result
+
+# }}}
+
+
 class _DictUnionView:
     def __init__(self, children):
         self.children = children
@@ -880,11 +1118,6 @@ def infer_unknown_types_for_a_single_kernel(
     import time
     start_time = time.time()
 
-    unexpanded_kernel = kernel
-    if kernel.substitutions:
-        from loopy.transform.subst import expand_subst
-        kernel = expand_subst(kernel)
-
     new_temp_vars = dict(kernel.temporary_variables)
     new_arg_dict = dict(kernel.arg_dict)
 
@@ -910,11 +1143,23 @@ def infer_unknown_types_for_a_single_kernel(
 
     writer_map = kernel.writer_map()
 
+    subst_rule_read_deps = _get_subst_rule_read_dependency_names(kernel)
+
+    def get_read_dependency_names(insn_id: str) -> frozenset[str]:
+        insn = kernel.id_to_insn[insn_id]
+        result = frozenset(insn.read_dependency_names())
+        if isinstance(insn, MultiAssignmentBase) and subst_rule_read_deps:
+            for rule_name in _get_invoked_subst_rule_names(
+                    insn.expression, kernel.substitutions):
+                result = result | subst_rule_read_deps[rule_name]
+
+        return result
+
     dep_graph: dict[str, set[str]] = {
             written_var: {
                 read_var
                 for insn_id in writer_map.get(written_var, [])
-                for read_var in kernel.id_to_insn[insn_id].read_dependency_names()
+                for read_var in get_read_dependency_names(insn_id)
                 if read_var in names_for_type_inference}
             for written_var in names_for_type_inference}
 
@@ -933,9 +1178,6 @@ def infer_unknown_types_for_a_single_kernel(
     type_inf_mapper = TypeInferenceMapper(kernel, clbl_inf_ctx,
             item_lookup)
 
-    from loopy.symbolic import SubstitutionRuleExpander
-    subst_expander = SubstitutionRuleExpander(kernel.substitutions)
-
     # {{{ work on type inference queue
 
     from loopy.kernel.data import KernelArgument, TemporaryVariable
@@ -968,11 +1210,13 @@ def infer_unknown_types_for_a_single_kernel(
             try:
                 (result, symbols_with_unknown_types,
                         new_old_calls_to_new_calls, clbl_inf_ctx) = (
-                        _infer_var_type(
-                                kernel, item.name, type_inf_mapper, subst_expander))
+                        _infer_var_type(kernel, item.name, type_inf_mapper))
             except DependencyTypeInferenceFailure:
                 result = ()
                 symbols_with_unknown_types = ()
+                # The callables registered while filling the cache are lost
+                # along with the aborted inference context.
+                type_inf_mapper.subst_rule_type_cache.clear()
             type_inf_mapper = type_inf_mapper.copy(
                     clbl_inf_ctx=clbl_inf_ctx)
 
@@ -984,6 +1228,7 @@ def infer_unknown_types_for_a_single_kernel(
                     debug("     changed from: %s", item.dtype)
                     changed_during_last_queue_run = True
                     touched_variable_names.add(name)
+                    type_inf_mapper.subst_rule_type_cache.clear()
 
                     if isinstance(item, TemporaryVariable):
                         new_temp_vars[name] = item.copy(dtype=new_dtype)
@@ -1104,7 +1349,7 @@ def infer_unknown_types_for_a_single_kernel(
                     "Untyped separation-related variables: "
                     f"{', '.join(touched_sep_names)}")
 
-    pre_type_specialized_knl = unexpanded_kernel.copy(
+    pre_type_specialized_knl = kernel.copy(
             temporary_variables=new_temp_vars,
             args=[new_arg_dict[arg.name] for arg in kernel.args],
             )
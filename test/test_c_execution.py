@@ -21,6 +21,7 @@ THE SOFTWARE.
 """
 
 import logging
+import platform
 
 import numpy as np
 import pytest
@@ -366,6 +367,159 @@ def test_scalar_global_args():
     assert out == (n*(n-1)/2)
 
 
+def test_value_specializing_executor():
+    knl = lp.make_kernel(
+            "{[i]: 0<=i<n}",
+            "out[i] = 2*a[i]",
+            [lp.GlobalArg("a, out", np.float64, shape="n"),
+             lp.ValueArg("n", np.int32)],
+            target=lp.ExecutableCTarget())
+
+    executor = knl.executor(specialize_on=["n"], specialization_threshold=2)
+
+    for n in [16, 16, 5, 16, 16]:
+        a = np.arange(n, dtype=np.float64)
+        _evt, (out,) = executor(a=a, n=np.int32(n))
+        assert np.array_equal(out, 2*a)
+
+    assert set(executor.specialized_executors) == {(16,)}
+    assert executor.value_counts == {(5,): 1}
+
+    specialized_executor = executor.specialized_executors[16,]
+    code = specialized_executor.get_code(specialized_executor.entrypoint)
+    assert "i <= 15" in code
+    assert "n" not in specialized_executor.t_unit[executor.entrypoint].arg_dict
+
+    # calls are no longer counted once max_specializations is reached
+    executor = knl.executor(specialize_on=["n"], specialization_threshold=1,
+                            max_specializations=1)
+    for n in [16, 5, 7, 5]:
+        a = np.arange(n, dtype=np.float64)
+        _evt, (out,) = executor(a=a, n=np.int32(n))
+        assert np.array_equal(out, 2*a)
+
+    assert set(executor.specialized_executors) == {(16,)}
+    assert executor.value_counts == {}
+
+    with pytest.raises(lp.LoopyError):
+        knl.executor(specialize_on=["a"])
+
+
+def test_pack_tile():
+    knl = lp.make_kernel(
+            "{[i, j, k]: 0<=i, j, k<n}",
+            "c[i, j] = c[i, j] + a[i, k]*b[k, j]",
+            [lp.GlobalArg("a, b, c", np.float64, shape=("n", "n")), ...],
+            target=lp.ExecutableCTarget())
+
+    for iname in ["i", "j", "k"]:
+        knl = lp.split_iname(knl, iname, 16)
+
+    # the innermost loop runs along the columns of b
+    packed_knl = lp.prioritize_loops(knl,
+            "j_outer,k_outer,i_outer,i_inner,j_inner,k_inner")
+    packed_knl = lp.pack_tile(packed_knl, "b", "k_inner,j_inner",
+            fetch_outer_inames="j_outer,k_outer")
+    b_fetch = packed_knl.default_entrypoint.temporary_variables["b_fetch"]
+    assert b_fetch.address_space == lp.AddressSpace.PRIVATE
+    assert b_fetch.alignment == 64
+    assert [dim_tag.stride for dim_tag in b_fetch.dim_tags] == [1, 16]
+
+    rng = np.random.default_rng(seed=11)
+    a, b, c = rng.random((3, 37, 37))
+
+    _evt, (out,) = packed_knl(a=a, b=b, c=c.copy())
+    assert np.allclose(out, c + a @ b)
+
+    packed_knl = lp.prioritize_loops(knl,
+            "i_outer,j_outer,k_outer,i_inner,j_inner,k_inner")
+    packed_knl = lp.pack_tile(packed_knl, "c", "i_inner,j_inner", write_back=True)
+
+    _evt, (out,) = packed_knl(a=a, b=b, c=c.copy())
+    assert np.allclose(out, c + a @ b)
+
+
+@pytest.mark.skipif(platform.machine() != "x86_64",
+                    reason="SSE2 streaming stores need x86-64")
+def test_streaming_stores():
+    knl = lp.make_kernel(
+            "{[i, j]: 0<=i<n and 0<=j<16}",
+            """
+            out[i, j] = 2*a[i, j] {tags=!streaming_store}
+            out_t[j, i] = 3*a[i, j] {tags=!streaming_store}
+            iout[i, j] = 5 {tags=!streaming_store}
+            """,
+            [lp.GlobalArg("a, out, out_t", np.float64, shape=lp.auto),
+             lp.GlobalArg("iout", np.int32, shape=lp.auto), ...],
+            target=lp.ExecutableCTarget(streaming_stores="sse2"))
+    knl = lp.prioritize_loops(knl, "i,j")
+
+    code = lp.generate_code_v2(knl).device_code()
+    assert "loopy_stream_float64(&out[16 * i + j]" in code
+    assert "_mm_stream_si32((int *) &iout[16 * i + j], 5)" in code
+    # not contiguous along the innermost loop
+    assert "out_t[n * j + i] = " in code
+    assert code.count("_mm_sfence()") == 1
+
+    a = np.random.default_rng(seed=12).random((37, 16))
+    _evt, (out, out_t, iout) = knl(a=a)
+    assert np.allclose(out, 2*a)
+    assert np.allclose(out_t, 3*a.T)
+    assert (iout == 5).all()
+
+    code = lp.generate_code_v2(
+            knl.copy(target=lp.CTarget(streaming_stores="builtin"))).device_code()
+    assert "__builtin_nontemporal_store(5, &iout[16 * i + j])" in code
+    assert "__atomic_thread_fence(__ATOMIC_SEQ_CST)" in code
+
+    code = lp.generate_code_v2(knl.copy(target=lp.CTarget())).device_code()
+    assert "out[16 * i + j] = " in code
+
+
+def test_openmp_reductions():
+    from loopy.target.c.c_execution import CCompiler
+    target = lp.ExecutableCTarget(compiler=CCompiler(
+        cflags=["-std=c99", "-O3", "-fPIC", "-fopenmp"],
+        ldflags=["-shared", "-fopenmp"]))
+
+    knl = lp.make_kernel(
+            "{[i, j, k]: 0<=i<n and 0<=j<16 and 0<=k<m}",
+            """
+            s = sum(i, a[i])
+            out[i] = sum(j, b[i, j])
+            z = sum(k, c[k])
+            """,
+            [lp.GlobalArg("a, b", np.float64, shape=lp.auto),
+             lp.GlobalArg("c", np.complex128, shape=lp.auto), ...],
+            target=target)
+    knl = lp.tag_inames(knl, "i:omp")
+    # complex sums have no OpenMP reduction clause
+    knl = lp.split_iname(knl, "k", 4, inner_tag="omp")
+    knl = lp.split_reduction_outward(knl, "k_inner")
+
+    code = lp.generate_code_v2(knl).device_code()
+    assert "#pragma omp parallel for reduction(+:acc_i) private(acc_j)" in code
+    assert "#pragma omp parallel for private(acc_k_outer)" in code
+    assert "partial_k_inner[k_inner] = " in code
+
+    rng = np.random.default_rng(seed=12)
+    a = rng.random(1000)
+    b = rng.random((1000, 16))
+    c = rng.random(1001) + 1j*rng.random(1001)
+    _evt, (out, s, z) = knl(a=a, b=b, c=c)
+    assert np.allclose(s, a.sum())
+    assert np.allclose(out, b.sum(axis=1))
+    assert np.allclose(z, c.sum())
+
+    knl = lp.make_kernel(
+            "{[i]: 0<=i<n}", "out[i] = 2*a[i]",
+            [lp.GlobalArg("a, out", np.float64, shape=lp.auto), ...],
+            target=lp.OpenCLTarget())
+    knl = lp.tag_inames(knl, "i:omp")
+    with pytest.raises(lp.LoopyError, match="OpenMP"):
+        lp.generate_code_v2(knl)
+
+
 if __name__ == "__main__":
     import sys
     if len(sys.argv) > 1:
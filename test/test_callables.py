@@ -981,6 +981,79 @@ def test_check_bounds_with_caller_assumptions(ctx_factory: cl.CtxFactory):
                         parameters={"N": 15})
 
 
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_check_bounds_in_process_pool(max_workers):
+    import islpy as isl
+
+    from loopy.check import check_bounds
+    from loopy.diagnostic import LoopyIndexError
+
+    arange = lp.make_function(
+        "{[i]: 0<=i<n}",
+        """
+        y[i] = i
+        """, name="arange")
+
+    knl = lp.make_kernel(
+        "{[i, j]: 0<=i<20 and 0<=j<10}",
+        """
+        [i]: Y[i] = arange(N)
+        Z[j] = 2*j
+        [i]: W[i] = arange(N)
+        """,
+        [lp.GlobalArg("Y,W", shape=(20,)), lp.GlobalArg("Z", shape=(10,)),
+         lp.ValueArg("N", dtype=np.int32)],
+        name="epoint")
+
+    knl = lp.merge([knl, arange])
+    serial_knl = knl
+    knl = lp.set_options(knl, bounds_check_max_workers=max_workers)
+
+    # the number of workers does not affect caching
+    from loopy.tools import LoopyKeyBuilder
+    assert LoopyKeyBuilder()(knl) == LoopyKeyBuilder()(serial_knl)
+
+    with pytest.raises(LoopyIndexError):
+        check_bounds(lp.preprocess_kernel(knl))
+
+    knl = knl.with_kernel(lp.assume(knl.default_entrypoint,
+                                    isl.BasicSet("[N] -> { : N <= 20}")))
+    check_bounds(lp.preprocess_kernel(knl))
+
+
+@pytest.mark.parametrize("target", [lp.PyOpenCLTarget(), lp.ExecutableCTarget()])
+def test_generate_code_in_process_pool(target):
+    callees = [
+        lp.make_function(
+            "{[i]: 0<=i<10}",
+            f"y[i] = {k}*x[i] + sin(x[i])",
+            [lp.GlobalArg("x,y", np.float64, shape=(10,))],
+            name=f"callee_{k}", target=target)
+        for k in range(4)]
+
+    knl = lp.make_kernel(
+        "{[i, j]: 0<=i<10 and 0<=j<4}",
+        [f"[i]: Y{k}[j, i] = callee_{k}([i]: X[j, i])" for k in range(4)],
+        [lp.GlobalArg("X", np.float64, shape=(4, 10)),
+         *[lp.GlobalArg(f"Y{k}", np.float64, shape=(4, 10)) for k in range(4)]],
+        target=target)
+
+    t_unit = lp.merge([knl, *callees])
+
+    with lp.CacheMode(False):
+        serial_cgr = lp.generate_code_v2(t_unit)
+        parallel_cgr = lp.generate_code_v2(
+            lp.set_options(t_unit, codegen_max_workers=3))
+
+    assert parallel_cgr.device_code() == serial_cgr.device_code()
+    assert parallel_cgr.host_code() == serial_cgr.host_code()
+
+    # the number of workers does not affect caching
+    from loopy.tools import LoopyKeyBuilder
+    assert (LoopyKeyBuilder()(lp.set_options(t_unit, codegen_max_workers=3))
+            == LoopyKeyBuilder()(t_unit))
+
+
 def test_callee_with_auto_offset(ctx_factory: cl.CtxFactory):
 
     ctx = ctx_factory()
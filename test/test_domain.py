@@ -248,7 +248,7 @@ def test_independent_multi_domain(ctx_factory: cl.CtxFactory):
             inner_tag="l.0")
     knl = lp.split_iname(knl, "j", 16, outer_tag="g.0",
             inner_tag="l.0")
-    assert knl["loopy_kernel"].parents_per_domain() == 2*[None]
+    assert knl["loopy_kernel"].parents_per_domain() == 2*(None,)
 
     n = 50
     _evt, (a, b) = knl(queue, n=n, out_host=True)
@@ -628,6 +628,67 @@ def test_fortran_subroutines():
     print(lp.generate_code_v2(t_unit).device_code())
 
 
+def test_parse_fortran_incremental(monkeypatch):
+    if not lp.CACHING_ENABLED:
+        pytest.skip("incremental translation relies on the disk cache")
+
+    from uuid import uuid4
+
+    from loopy.frontend.fortran.translator import F2LoopyTranslator
+
+    translated = []
+    make_kernels = F2LoopyTranslator.make_kernels
+
+    def make_kernels_and_record(self, seq_dependencies):
+        result = make_kernels(self, seq_dependencies)
+        translated.extend(name for t_unit in result
+                          for name in t_unit.callables_table)
+        return result
+
+    monkeypatch.setattr(F2LoopyTranslator, "make_kernels", make_kernels_and_record)
+
+    def make_source(factor):
+        return f"""
+            ! {uuid4()}
+            subroutine twice(n, a)
+              implicit none
+              real*8  a(n)
+              integer i,n
+
+              do i=1,n
+                a(i) = a(i) * 2
+              end do
+            end subroutine
+
+            ! {uuid4()}
+            subroutine scale_cross(n, a, i)
+              implicit none
+              integer i, n
+              real*8  a(n,n)
+
+              a(i, i) = {factor} * a(i, i)
+              call twice(n, a(1:n, i))
+            end subroutine
+            """
+
+    source = make_source(3)
+    t_unit = lp.parse_fortran(source)
+    assert sorted(translated) == ["scale_cross", "twice"]
+
+    # memoized as a whole
+    translated.clear()
+    assert lp.parse_fortran(source) == t_unit
+    assert not translated
+
+    # only the changed subroutine is re-translated
+    changed_source = source.replace("a(i, i) = 3", "a(i, i) = 5")
+    changed_t_unit = lp.parse_fortran(changed_source)
+    assert translated == ["scale_cross"]
+
+    with lp.CacheMode(False):
+        assert lp.parse_fortran(changed_source) == changed_t_unit
+
+
 def test_domain_fusion_imperfectly_nested():
     fortran_src = """
         subroutine imperfect(n, m, a, b)
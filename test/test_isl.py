@@ -111,6 +111,36 @@ def test_qpolynomrial_to_expr():
     assert flatten(expr) == flatten((4*i + 6*j + 3*k) // 12)
 
 
+def test_profile_isl_calls():
+    import loopy as lp
+    from loopy.isl_profiling import profile_isl_calls
+
+    orig_dim_max = isl.BasicSet.__dict__["dim_max"]
+    orig_universe = isl.BasicSet.__dict__["universe"]
+
+    knl = lp.make_kernel(
+        "{[i, j]: 0<=i<n and 0<=j<i}",
+        "y[i] = sum(j, a[i, j])",
+        lang_version=(2018, 2))
+    knl = lp.add_dtypes(knl, {"a": "float64"})
+
+    with profile_isl_calls() as profile:
+        knl = lp.split_iname(knl, "j", 4)
+        lp.generate_code_v2(knl)
+
+        # static methods keep working while instrumented
+        isl.BasicSet.universe(knl.default_entrypoint.domains[0].space)
+
+    by_entrypoint = profile.by_entrypoint()
+    assert by_entrypoint["loopy.transform.iname.split_iname"].ncalls > 0
+    assert by_entrypoint["loopy.codegen.generate_code_v2"].nconstraints > 0
+    assert "<outside loopy>" in by_entrypoint
+    assert "split_iname" in profile.report()
+
+    assert isl.BasicSet.__dict__["dim_max"] is orig_dim_max
+    assert isl.BasicSet.__dict__["universe"] is orig_universe
+
+
 if __name__ == "__main__":
     import sys
     if len(sys.argv) > 1:
@@ -94,6 +94,41 @@ def test_complicated_subst(ctx_factory: cl.CtxFactory):
         assert substs_with_letter == how_many
 
 
+def test_type_inference_without_subst_expansion():
+    # Each rule invokes the previous one twice, so that expanding the rules
+    # would result in 2**nlevels calls to sin.
+    nlevels = 16
+    rules = ["s0(a) := sin(a)"] + [
+        f"s{k}(a) := s{k-1}(a) + s{k-1}(2*a)" for k in range(1, nlevels)]
+
+    t_unit = lp.make_kernel(
+            "{[i]: 0<=i<n}",
+            [*rules,
+             f"<> t = s{nlevels-1}(x[i]) * scale",
+             f"y[i] = t + s{nlevels-1}(z[i])",
+             "<> scale = 2*u"],
+            [
+                lp.GlobalArg("x", np.float32, shape=("n",)),
+                lp.GlobalArg("z", np.float64, shape=("n",)),
+                lp.ValueArg("u", np.float32),
+                "...",
+                ])
+    t_unit = lp.infer_unknown_types(t_unit)
+    knl = t_unit.default_entrypoint
+
+    from loopy.types import to_loopy_type
+    assert knl.temporary_variables["scale"].dtype == to_loopy_type(np.float32)
+    assert knl.temporary_variables["t"].dtype == to_loopy_type(np.float32)
+    assert knl.arg_dict["y"].dtype == to_loopy_type(np.float64)
+
+    # sin is specialized once per argument type
+    sin_arg_dtypes = {
+        clbl.arg_id_to_dtype[0] for clbl in t_unit.callables_table.values()
+        if clbl.name == "sin"}
+    assert sin_arg_dtypes == {to_loopy_type(np.float32),
+                              to_loopy_type(np.float64)}
+
+
 def test_type_inference_no_artificial_doubles():
     prog = lp.make_kernel(
             "{[i]: 0<=i<n}",
@@ -3708,6 +3743,40 @@ def test_loop_imperfect_nest_priorities_in_v2_scheduler():
     lp.generate_code_v2(knl)
 
 
+def test_pre_schedule_check_memoization():
+    from loopy.check import pre_schedule_checks
+    from loopy.diagnostic import LoopyIndexError, LoopyWarning
+
+    knl = lp.make_kernel(
+        "{[i]: 0<=i<20}",
+        """
+        y[i] = x[i]
+        """,
+        [lp.GlobalArg("x", shape=(10,), dtype=np.float64), ...])
+    knl = lp.preprocess_kernel(knl)
+
+    with pytest.raises(LoopyIndexError):
+        pre_schedule_checks(knl)
+
+    knl = lp.set_options(knl, enforce_array_accesses_within_bounds=False)
+
+    # warnings must be re-emitted when the checks' outcome is memoized
+    for _ in range(2):
+        with pytest.warns(LoopyWarning, match="array_access_out_of_bounds"):
+            pre_schedule_checks(knl)
+
+    # check_bounds is skipped altogether for production builds
+    knl = lp.set_options(knl, enforce_array_accesses_within_bounds=True,
+                         skip_expensive_checks=True)
+    pre_schedule_checks(knl)
+
+    # ... which does not change the kernel as far as caching is concerned
+    from loopy.tools import LoopyKeyBuilder
+    checked_knl = lp.set_options(knl, skip_expensive_checks=False)
+    assert checked_knl == knl
+    assert LoopyKeyBuilder()(checked_knl) == LoopyKeyBuilder()(knl)
+
+
 if __name__ == "__main__":
     import sys
     if len(sys.argv) > 1:
@@ -338,6 +338,217 @@ def test_memoize_on_disk_with_pym_expr():
     assert cached_result == uncached_result
 
 
+def test_set_operation_cache_manager():
+    import islpy as isl
+    from islpy import dim_type
+
+    from loopy.kernel.tools import SetOperationCacheManager
+
+    cm = SetOperationCacheManager(max_entries=2)
+    dom = isl.BasicSet("[n] -> {[i, j]: 0<=i<n and 0<=j<i}")
+
+    assert cm.dim_max(dom, 1).plain_is_equal(dom.dim_max(1))
+    assert cm.dim_max(dom, 1).plain_is_equal(dom.dim_max(1))
+    # equal, but not identical set objects hit the cache
+    cm.dim_max(isl.BasicSet(str(dom)), 1)
+    assert (cm.hits, cm.misses) == (2, 1)
+    assert cm.hit_rate == pytest.approx(2/3)
+
+    cm.dim_min(dom, 0)
+    cm.dim_min(dom, 1)
+    assert cm.nentries == 2
+
+    # dim_max(dom, 1) was evicted as the least recently used entry
+    cm.dim_max(dom, 1)
+    assert cm.misses == 4
+
+    # sets differing only in the names of their dimensions do not share
+    # results
+    set_ij = isl.BasicSet("{[i, j]: 0<=i<2 and 0<=j<3}")
+    set_ji = isl.BasicSet("{[j, i]: 0<=j<2 and 0<=i<3}")
+    assert cm.eliminate_except(set_ij, ("i",), (dim_type.set,)) == (
+            set_ij.eliminate(dim_type.set, 1, 1))
+    assert cm.eliminate_except(set_ji, ("i",), (dim_type.set,)) == (
+            set_ji.eliminate(dim_type.set, 0, 1))
+
+    cm.clear()
+    assert (cm.nentries, cm.hits, cm.misses) == (0, 0, 0)
+
+
+def test_set_operation_cache_shared_across_kernel_copies():
+    knl = lp.make_kernel("{[i]: 0<=i<n}", "y[i] = i")
+    knl = knl.default_entrypoint
+
+    knl_copy = knl.copy(name="other_name")
+    assert knl_copy.cache_manager is knl.cache_manager
+
+    from pickle import dumps, loads
+    assert loads(dumps(knl)).cache_manager is knl.cache_manager
+
+
+def test_lazy_toplevel_imports():
+    import subprocess
+    import sys
+
+    # {{{ benchmark 'import loopy' in a fresh interpreter
+
+    lazy_modules = [
+            "loopy.auto_test", "loopy.codegen", "loopy.frontend.fortran",
+            "loopy.statistics", "loopy.target.c", "loopy.target.pyopencl",
+            "loopy.transform.precompute", "pyopencl"]
+
+    script = f"""
+import sys
+from time import perf_counter
+
+start = perf_counter()
+import loopy
+print(perf_counter() - start)
+print(*[name for name in {lazy_modules!r} if name in sys.modules])
+"""
+    output = subprocess.check_output(
+            [sys.executable, "-c", script], text=True).split("\n")
+
+    logger.info("'import loopy' took %s s", output[0])
+    assert output[1] == ""
+
+    # }}}
+
+    assert set(lp.__all__) <= set(dir(lp))
+    for name in lp.__all__:
+        assert getattr(lp, name) is not None
+
+    from loopy.transform.precompute import precompute
+    assert lp.precompute is precompute
+
+    # submodules remain accessible as attributes
+    assert lp.target.c.CTarget is lp.CTarget
+
+    with pytest.raises(AttributeError):
+        lp.no_such_attribute  # noqa: B018
+
+
+def test_instruction_and_variable_copies():
+    from time import perf_counter
+
+    from loopy.tools import LoopyKeyBuilder
+
+    n = 1000
+    knl = lp.make_kernel(
+            "{[i]: 0<=i<10}",
+            "\n".join(f"y{k}[i] = x[i] + {k} {{id=insn_{k}}}"
+                      for k in range(n)),
+            [lp.GlobalArg("x", "float64", shape=(10,)),
+             lp.TemporaryVariable("tmp", "float64", shape=(10,)),
+             lp.ValueArg("n", "int32"), ...])
+    knl = knl.default_entrypoint
+
+    start = perf_counter()
+    copies = [insn.copy() for insn in knl.instructions]
+    logger.info("copying an instruction took %g us",
+                (perf_counter() - start) / n * 1e6)
+
+    key_builder = LoopyKeyBuilder()
+    for insn, insn_copy in zip(knl.instructions, copies, strict=True):
+        assert insn_copy == insn
+        assert hash(insn_copy) == hash(insn)
+        assert key_builder(insn_copy) == key_builder(insn)
+
+    insn = copies[0]
+    assert insn.copy(priority=2).priority == 2
+    assert insn.copy(depends_on=frozenset({"insn_1"})).depends_on == {"insn_1"}
+
+    # memoized results live in a single attribute each
+    assert insn.dependency_names() == {"x", "y0", "i"}
+    assert insn.assignee_var_names() == ("y0",)
+    assert insn.reduction_inames() == frozenset()
+    assert not any(name.startswith("_memoize_dic") for name in vars(insn))
+    assert loads(dumps(insn)) == insn
+
+    # memoized results take less memory than with pytools.memoize_method,
+    # which keeps a dictionary per method and instance
+    from pytools import memoize_method
+
+    class DictMemoizedAssignment(lp.Assignment):
+        @memoize_method
+        def dependency_names(self):
+            return lp.Assignment.dependency_names.__wrapped__(self)
+
+        @memoize_method
+        def assignee_var_names(self):
+            return lp.Assignment.assignee_var_names.__wrapped__(self)
+
+        @memoize_method
+        def reduction_inames(self):
+            return lp.Assignment.reduction_inames.__wrapped__(self)
+
+    def get_memoization_footprint(insns):
+        import gc
+        import tracemalloc
+        gc.collect()
+        tracemalloc.start()
+        try:
+            for insn in insns:
+                insn.dependency_names()
+                insn.assignee_var_names()
+                insn.reduction_inames()
+            return tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+    footprint = get_memoization_footprint(
+            [insn.copy() for insn in knl.instructions])
+    dict_footprint = get_memoization_footprint(
+            [DictMemoizedAssignment(**insn.get_copy_kwargs())
+             for insn in knl.instructions])
+    logger.info("memoized results took %g bytes per instruction "
+                "(%g bytes with pytools.memoize_method)",
+                footprint / n, dict_footprint / n)
+    assert footprint < dict_footprint
+
+    for var in [*knl.args, *knl.temporary_variables.values()]:
+        var_copy = var.copy()
+        assert var_copy == var
+        assert key_builder(var_copy) == key_builder(var)
+        assert var.copy(name="z").name == "z"
+
+
+@pytest.mark.parametrize("callee_depth", [0, 2])
+def test_synthetic_kernel(callee_depth):
+    from time import perf_counter
+
+    from loopy.check import pre_schedule_checks
+    from loopy.synthetic import make_synthetic_kernel
+
+    kwargs = {"loop_depth": 2, "instructions_per_loop_nest": 8,
+              "subst_rule_nesting": 2, "callee_depth": callee_depth,
+              "target": lp.CTarget()}
+    t_unit = make_synthetic_kernel(30, **kwargs)
+    assert t_unit == make_synthetic_kernel(30, **kwargs)
+
+    knl = t_unit["synthetic"]
+    assert len(knl.substitutions) == 2
+    assert len(knl.domains) == 4 * (2 if callee_depth else 1)
+    assert len([insn for insn in knl.instructions
+                if not insn.id.startswith("call_")]) == 30
+    assert len(t_unit.callables_table) == 1 + callee_depth
+
+    with lp.CacheMode(False):
+        for stage in [lp.preprocess_program, pre_schedule_checks,
+                      lp.linearize, lp.generate_code_v2]:
+            start = perf_counter()
+            result = stage(t_unit)
+            logger.info("%s took %g s", stage.__name__, perf_counter() - start)
+            if stage is lp.preprocess_program:
+                t_unit = result
+
+    # per instruction, the operand product appears twice in the expansion of
+    # the substitution rules, which contribute two multiplications themselves
+    op_map = lp.get_op_map(t_unit, subgroup_size=1)
+    assert op_map.filter_by(name="mul", kernel_name="synthetic").eval_and_sum() \
+            == 30 * 8**2 * 4
+
+
 if __name__ == "__main__":
     import sys
     if len(sys.argv) > 1:
@@ -1569,6 +1569,36 @@ def test_within_stats():
         _ = ops_dtype[lp.MemAccess(dtype=np.int32)].eval_with_dict({})
 
 
+def test_eval_with_arrays():
+    import pytest
+
+    knl = lp.make_kernel(
+            "{[i, j, k]: 0<=i<n and 0<=j<m and 0<=k<i and k<=j}",
+            "y[i, j] = sum(k, a[i, k]*b[k, j]) / 3")
+    knl = lp.add_dtypes(knl, {"a,b": np.float64})
+    knl = lp.split_iname(knl, "i", 3)
+
+    n = np.arange(1, 20).reshape(-1, 1)
+    m = np.arange(1, 15).reshape(1, -1)
+
+    for count_map in [lp.get_op_map(knl, subgroup_size=SGS),
+                      lp.get_mem_access_map(knl, subgroup_size=SGS)]:
+        totals = count_map.eval_and_sum_with_arrays({"n": n, "m": m})
+        counts = count_map.eval_with_arrays({"n": n, "m": m})
+        assert totals.shape == (19, 14)
+
+        for ni in [1, 4, 19]:
+            for mi in [1, 5, 14]:
+                params = {"n": ni, "m": mi}
+                assert totals[ni-1, mi-1] == count_map.eval_and_sum(params)
+                for key, count in counts.items():
+                    assert (count[ni-1, mi-1]
+                            == count_map[key].eval_with_dict(params))
+
+    with pytest.raises(ValueError):
+        count_map.eval_and_sum_with_arrays({"n": n})
+
+
 if __name__ == "__main__":
     import sys
     if len(sys.argv) > 1:
@@ -875,6 +875,74 @@ def test_float3():
     assert "float3" in device_code
 
 
+def test_strength_reduce_indices(ctx_factory: cl.CtxFactory):
+    ctx = ctx_factory()
+    queue = cl.CommandQueue(ctx)
+
+    knl = lp.make_kernel(
+        "{[i, j]: 0<=i<n and 0<=j<m}",
+        "out[i, j] = 2*a[i, j] + a[i, j + 1] + b[j]",
+        [
+            lp.GlobalArg("a", np.float64, shape=("n", "m+1"),
+                         strides=("sa0", "sa1")),
+            lp.GlobalArg("out", np.float64, shape=("n", "m"),
+                         strides=("so0", "so1")),
+            lp.GlobalArg("b", np.float64, shape=("m",)),
+            lp.ValueArg("sa0, sa1", np.int64),
+            lp.ValueArg("so0, so1", np.int32),
+            ...])
+    ref_knl = knl
+    knl = lp.set_options(knl, strength_reduce_indices=True)
+
+    device_code = lp.generate_code_v2(knl).device_code()
+    assert device_code.count(" += sa1") == 2
+    assert device_code.count(" += so1") == 1
+
+    # offsets into a are 64-bit and must not be narrowed to the iname's type
+    assert device_code.count("long j_offset") == 2
+    assert "int j = 0, j_offset_1 = so0 * i;" in device_code
+
+    rng = np.random.default_rng(seed=12)
+    a = rng.random((7, 10))
+    b = rng.random(9)
+    strides = {"sa0": 10, "sa1": 1, "so0": 9, "so1": 1}
+
+    _evt, (out,) = knl(queue, a=a, b=b, **strides)
+    _evt, (ref_out,) = ref_knl(queue, a=a, b=b, **strides)
+
+    assert np.allclose(out, ref_out)
+    assert np.allclose(out, 2*a[:, :-1] + a[:, 1:] + b)
+
+
+@pytest.mark.parametrize("inner_tag", ["unr", None])
+def test_peel_remainder_slabs(ctx_factory: cl.CtxFactory, inner_tag):
+    ctx = ctx_factory()
+
+    knl = lp.make_kernel(
+        "{[i]: 0<=i<n}",
+        "out[i] = 2*a[i]",
+        [lp.GlobalArg("a, out", np.float64, shape=("n",)), ...])
+    ref_knl = knl
+    knl = lp.split_iname(knl, "i", 4, inner_tag=inner_tag)
+    knl = lp.prioritize_loops(knl, "i_outer,i_inner")
+    knl = lp.set_options(knl, peel_remainder_slabs=True)
+
+    device_code = lp.generate_code_v2(knl).device_code()
+    _, slabs_code = device_code.split("/* bulk slab for 'i_outer' */")
+    bulk_code, final_code = slabs_code.split("/* final slab for 'i_outer' */")
+    assert "if (" not in bulk_code
+    if inner_tag is None:
+        assert "i_inner <= 3;" in bulk_code
+    else:
+        assert "if (" in final_code
+
+    lp.auto_test_vs_ref(ref_knl, ctx, knl, parameters={"n": 103})
+
+    # no remainder if the split length divides the trip count
+    knl = lp.assume(knl, "n mod 4 = 0")
+    assert "slab" not in lp.generate_code_v2(knl).device_code()
+
+
 if __name__ == "__main__":
     import sys
     if len(sys.argv) > 1:
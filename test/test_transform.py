@@ -1745,6 +1745,519 @@ def test_duplicate_iname_not_read_only_nested(ctx_factory: cl.CtxFactory):
     lp.auto_test_vs_ref(ref_t_unit, ctx, t_unit)
 
 
+def test_instruction_match_index():
+    from loopy.match import And, Id, Not, ObjTagged, Or, Reads, parse_match
+
+    class FooTag(Tag):
+        pass
+
+    t_unit = lp.make_kernel(
+        "{[i, j]: 0<=i,j<10}",
+        """
+        for i
+            <> acc = 0 {id=init, tags=foo}
+            for j
+                acc = acc + a[i, j] * x[j] {id=update_acc, tags=foo:bar}
+            end
+            y[i] = acc {id=assign_y}
+            z[i] = 2*x[i] {id=assign_z, tags=bar}
+        end
+        """,
+        seq_dependencies=True)
+    t_unit = lp.tag_instructions(t_unit, FooTag(), "id:assign_*")
+    knl = t_unit.default_entrypoint
+
+    match_exprs = [
+            "id:init", "id:assign_*", "id:*_acc", "id:assign_?", "id:nope",
+            "tag:foo", "tag:ba*", "writes:acc", "writes:*", "reads:x",
+            "reads:a*", "iname:j", "iname:i and not iname:j",
+            "id:init or (reads:acc and not tag:bar)", "in_kernel:loopy*",
+            "in_kernel:nope", None,
+            Or((ObjTagged(FooTag()), Id("init"))),
+            And((Reads("x"), Not(Id("assign_z")))),
+            ]
+
+    for match_expr in match_exprs:
+        match = parse_match(match_expr)
+        assert match.get_matching_insn_ids(knl) == frozenset(
+                insn.id for insn in knl.instructions if match(knl, insn))
+
+    assert [insn.id for insn in lp.find_instructions(knl, "id:assign_* or id:init")
+            ] == ["init", "assign_y", "assign_z"]
+
+    # the index is carried over to copies with unchanged instructions
+    index = knl.get_instruction_match_index()
+    assert knl.copy(name="other").get_instruction_match_index() is index
+    assert knl.copy(instructions=knl.instructions[:2]
+                    ).get_instruction_match_index() is not index
+
+
+def test_transformation_session():
+    t_unit = lp.make_kernel(
+        "{[i, j, k]: 0<=i,j,k<10}",
+        """
+        a[i, j] = 2*b[i, j] {id=insn_a}
+        c[i, j] = a[i, j] + 1 {id=insn_c}
+        """)
+
+    def transform(apply, kernel_or_t_unit):
+        for func, args, kwargs in [
+                (lp.split_iname, ("i", 2), {}),
+                (lp.rename_iname, ("i_inner", "ii"), {}),
+                (lp.rename_inames, (["j"], "jj"), {}),
+                (lp.tag_inames, ({"ii": "l.0"},), {}),
+                (lp.add_dependency, ("id:insn_c", "id:insn_a"), {}),
+                ]:
+            kernel_or_t_unit = apply(kernel_or_t_unit, func, *args, **kwargs)
+        return kernel_or_t_unit
+
+    def apply_directly(kernel_or_t_unit, func, *args, **kwargs):
+        return func(kernel_or_t_unit, *args, **kwargs)
+
+    def apply_in_session(session, func, *args, **kwargs):
+        return session.apply(func, *args, **kwargs)
+
+    for kernel_or_t_unit in [t_unit, t_unit.default_entrypoint]:
+        ref = transform(apply_directly, kernel_or_t_unit)
+
+        session = lp.TransformationSession(kernel_or_t_unit)
+        assert transform(apply_in_session, session) is session
+        assert session.ntransformations == 5
+
+        def get_kernel(kernel_or_t_unit):
+            if isinstance(kernel_or_t_unit, lp.TranslationUnit):
+                return kernel_or_t_unit.default_entrypoint
+            return kernel_or_t_unit
+
+        # the renamed inames are removed at each step
+        assert not {"j", "i_inner"} & get_kernel(session.current).all_inames()
+
+        result = session.commit()
+        assert result == ref
+
+        # the iname 'k', unused from the start, is kept
+        assert {"k", "jj"} <= get_kernel(result).all_inames()
+        assert not {"j", "i_inner"} & get_kernel(result).all_inames()
+
+    # inames left unused on request remain in place
+    session = lp.TransformationSession(t_unit)
+    session.apply(lp.rename_inames, ["j"], "jj",
+                  remove_newly_unused_inames=False)
+    assert "j" in session.commit().default_entrypoint.all_inames()
+
+    # as are inames left unused by transformations that do not remove them
+    t_unit = lp.make_kernel(
+        "{[i, k]: 0<=i,k<10}",
+        """
+        a[i] = 2*b[i] {id=insn_a}
+        c[k] = k {id=insn_k}
+        """)
+    ref = lp.rename_iname(lp.remove_instructions(t_unit, {"insn_k"}), "i", "ii")
+    session = lp.TransformationSession(t_unit)
+    session.apply(lp.remove_instructions, {"insn_k"})
+    session.apply(lp.rename_iname, "i", "ii")
+    result = session.commit()
+    assert result == ref
+    assert result.default_entrypoint.all_inames() == {"ii", "k"}
+
+    # inames may be renamed back and forth, including those used only in
+    # substitution rules
+    t_unit = lp.make_kernel(
+        "{[i, j, r]: 0<=i,j,r<10}",
+        """
+        rowsum(i) := sum(r, a[i, r])
+        out[i, j] = a[i, j] + rowsum(i)
+        """)
+    steps = [
+            (lp.rename_iname, ("i", "k")),
+            (lp.rename_iname, ("k", "i")),
+            (lp.rename_iname, ("r", "s")),
+            (lp.rename_iname, ("s", "r")),
+            ]
+    for kernel_or_t_unit in [t_unit, t_unit.default_entrypoint]:
+        ref = kernel_or_t_unit
+        session = lp.TransformationSession(kernel_or_t_unit)
+        for func, args in steps:
+            ref = func(ref, *args)
+            session.apply(func, *args)
+            assert session.current == ref
+
+        assert session.commit() == ref
+
+
+def test_kernel_copy_carries_over_caches():
+    knl = lp.make_kernel(
+        "{[i, j]: 0<=i,j<10}",
+        """
+        a[i, j] = 2*b[i, j] {id=insn_a}
+        c[i] = a[i, 0] + 1 {id=insn_c}
+        """).default_entrypoint
+
+    writer_map = knl.writer_map()
+    home_domain_map = knl._get_home_domain_map()
+
+    # the shared results cannot be modified
+    with pytest.raises(AttributeError):
+        writer_map["a"].add("insn_c")
+    with pytest.raises((AttributeError, TypeError)):
+        writer_map["c"] = frozenset()
+
+    new_knl = knl.copy(name="other")
+    assert new_knl.writer_map() is writer_map
+    assert new_knl._get_home_domain_map() is home_domain_map
+    assert (new_knl.get_leaf_domain_indices(frozenset({"i"}))
+            is knl.get_leaf_domain_indices(frozenset({"i"})))
+
+    new_knl = knl.copy(instructions=knl.instructions[:1])
+    assert new_knl.writer_map() == {"a": {"insn_a"}}
+    assert new_knl._get_home_domain_map() is home_domain_map
+
+    new_knl = lp.split_iname(knl, "i", 2)
+    assert new_knl.writer_map() == writer_map
+    assert new_knl.all_inames() == {"i_inner", "i_outer", "j"}
+
+
+def test_multiversion(ctx_factory: cl.CtxFactory):
+    ctx = ctx_factory()
+    cq = cl.CommandQueue(ctx)
+
+    knl = lp.make_kernel(
+        "{[i, j]: 0<=i,j<n}",
+        "out[i] = 2*a[i] + sum(j, a[j])",
+        [lp.GlobalArg("a, out", np.float64, shape="n"),
+         lp.ValueArg("n", np.int32)])
+    knl = lp.split_iname(knl, "i", 8)
+    knl = lp.prioritize_loops(knl, "i_outer,i_inner")
+
+    mv_knl = lp.multiversion(knl, ["n % 8 == 0", "n == 4"])
+
+    assert mv_knl.default_entrypoint.all_inames() == {
+        f"{iname}_{suffix}"
+        for iname in ["i_outer", "i_inner", "j"]
+        for suffix in ["v0", "v1", "generic"]}
+
+    code = lp.generate_code_v2(mv_knl).device_code()
+    # only the generic version handles a remainder of the split
+    assert "i_inner_v0 <= 7;" in code
+    assert "-8 * i_outer_v0" not in code
+    assert "-8 * i_outer_generic" in code
+
+    for n in [16, 4, 13]:
+        a = np.random.default_rng(seed=n).random(n)
+        _evt, (out,) = mv_knl(cq, a=a, n=n)
+        assert np.allclose(out, 2*a + a.sum())
+
+    with pytest.raises(lp.LoopyError):
+        lp.multiversion(knl, ["m == 4"])
+
+
+def test_hoist_invariants(ctx_factory: cl.CtxFactory):
+    ctx = ctx_factory()
+    cq = cl.CommandQueue(ctx)
+
+    knl = lp.make_kernel(
+        "{[e, i, q]: 0<=e<nelements and 0<=i<4 and 0<=q<8}",
+        """
+        out[e, i] = sum(q, w[q]*(jac[e, 0]*jac[e, 3] - jac[e, 1]*jac[e, 2])
+                           * phi[q, i]) {id=integrate}
+        """,
+        [lp.GlobalArg("jac", np.float64, shape=("nelements", 4)),
+         lp.GlobalArg("w", np.float64, shape=(8,)),
+         lp.GlobalArg("phi", np.float64, shape=(8, 4)),
+         lp.GlobalArg("out", np.float64, shape=("nelements", 4)),
+         ...])
+
+    hoisted_knl = lp.hoist_invariants(knl)
+
+    kernel = hoisted_knl.default_entrypoint
+    hoisted_insn, = [insn for insn in kernel.instructions
+                     if insn.id != "integrate"]
+    assert hoisted_insn.within_inames == {"e"}
+    assert hoisted_insn.id in kernel.id_to_insn["integrate"].depends_on
+
+    def count_ops(t_unit):
+        return lp.get_op_map(t_unit, subgroup_size=1).eval_and_sum(
+            {"nelements": 10})
+
+    assert count_ops(hoisted_knl) < count_ops(knl)
+
+    rng = np.random.default_rng(seed=15)
+    jac = rng.random((10, 4))
+    w = rng.random(8)
+    phi = rng.random((8, 4))
+
+    _evt, (out_ref,) = knl(cq, jac=jac, w=w, phi=phi)
+    _evt, (out,) = hoisted_knl(cq, jac=jac, w=w, phi=phi)
+    assert np.allclose(out, out_ref)
+
+    # jac may be changed by the instruction itself
+    knl = lp.make_kernel(
+        "{[e, q]: 0<=e<nelements and 0<=q<8}",
+        "jac[e, q] = 2*jac[e, 0] + q",
+        [lp.GlobalArg("jac", np.float64, shape=("nelements", 8)), ...])
+    assert lp.hoist_invariants(knl) == knl
+
+
+def test_hoist_invariants_guarded():
+    knl = lp.make_kernel(
+        "{[i]: 0<=i<n}",
+        """
+        out[i] = if(m != 0, a[i]*(k // m), 0)
+        out2[i] = if(m != 0 and a[i]*(k // m) > 1, 1, 0)
+        """,
+        [lp.GlobalArg("a, out, out2", np.int32, shape="n"),
+         lp.ValueArg("k, m", np.int32), ...],
+        target=lp.ExecutableCTarget())
+
+    # k // m is only evaluated where m != 0
+    hoisted_knl = lp.hoist_invariants(knl)
+    assert hoisted_knl == knl
+
+    a = np.arange(10, dtype=np.int32)
+    _evt, (out, out2) = hoisted_knl(a=a, k=np.int32(7), m=np.int32(0))
+    assert (out == 0).all()
+    assert (out2 == 0).all()
+
+    # conditions are evaluated unconditionally, and may be hoisted from
+    knl = lp.make_kernel(
+        "{[i]: 0<=i<n}",
+        "out[i] = if(k // m > 1, a[i], 0)",
+        [lp.GlobalArg("a, out", np.int32, shape="n"),
+         lp.ValueArg("k, m", np.int32), ...],
+        target=lp.ExecutableCTarget())
+
+    hoisted_knl = lp.hoist_invariants(knl)
+    hoisted_insn, = [
+        insn for insn in hoisted_knl.default_entrypoint.instructions
+        if insn.id.endswith("_invariant")]
+    assert hoisted_insn.within_inames == frozenset()
+
+    _evt, (out,) = hoisted_knl(a=a, k=np.int32(7), m=np.int32(3))
+    assert (out == a).all()
+
+
+def test_eliminate_common_subexpressions(ctx_factory: cl.CtxFactory):
+    ctx = ctx_factory()
+    cq = cl.CommandQueue(ctx)
+
+    knl = lp.make_kernel(
+        "{[i, j]: 0<=i<n and 0<=j<4}",
+        """
+        out1[i] = (a[i]*b[i] + c[i])*2 + sin(a[i]*b[i]) {id=out1}
+        out2[i] = (a[i]*b[i] + c[i])*3 {id=out2}
+        out3[i, j] = a[i]*b[i] + j {id=out3}
+        """,
+        [lp.GlobalArg("a, b, c", np.float64, shape="n"),
+         lp.GlobalArg("out1, out2", np.float64, shape="n"),
+         lp.GlobalArg("out3", np.float64, shape=("n", 4)),
+         ...])
+
+    cse_knl = lp.eliminate_common_subexpressions(knl)
+
+    kernel = cse_knl.default_entrypoint
+    cse_insns = [insn for insn in kernel.instructions
+                 if insn.id not in ["out1", "out2", "out3"]]
+    assert len(cse_insns) == 2
+    assert all(insn.within_inames == {"i"} for insn in cse_insns)
+    # out3 is in a different loop nest and keeps its own product
+    assert kernel.id_to_insn["out3"] == knl.default_entrypoint.id_to_insn["out3"]
+    for insn_id in ["out1", "out2"]:
+        assert kernel.id_to_insn[insn_id].depends_on & {
+            insn.id for insn in cse_insns}
+
+    rng = np.random.default_rng(seed=15)
+    a, b, c = rng.random((3, 10))
+    _evt, out_ref = knl(cq, a=a, b=b, c=c)
+    _evt, out = cse_knl(cq, a=a, b=b, c=c)
+    for ary, ary_ref in zip(out, out_ref, strict=True):
+        assert np.allclose(ary, ary_ref)
+
+    knl_limited = lp.eliminate_common_subexpressions(knl, max_temporaries=1)
+    assert len(knl_limited.default_entrypoint.temporary_variables) == 1
+    assert lp.eliminate_common_subexpressions(knl, min_flops=3) == knl
+
+
+def test_eliminate_common_subexpressions_guarded():
+    knl = lp.make_kernel(
+        "{[i]: 0<=i<n}",
+        """
+        out1[i] = if(b[i] != 0, a[i] // b[i] + 1, 0)
+        out2[i] = if(b[i] != 0, (a[i] // b[i])*3, 0)
+        """,
+        [lp.GlobalArg("a, b, out1, out2", np.int32, shape="n"), ...],
+        target=lp.ExecutableCTarget())
+
+    # a[i] // b[i] is only evaluated where b[i] != 0
+    cse_knl = lp.eliminate_common_subexpressions(knl)
+    assert cse_knl == knl
+
+    a = np.arange(10, dtype=np.int32)
+    b = np.arange(10, dtype=np.int32) % 3
+    _evt, (out1, out2) = cse_knl(a=a, b=b)
+    nonzero = b != 0
+    assert (out1[nonzero] == a[nonzero] // b[nonzero] + 1).all()
+    assert (out2[nonzero] == (a[nonzero] // b[nonzero])*3).all()
+    assert (out1[~nonzero] == 0).all()
+    assert (out2[~nonzero] == 0).all()
+
+    # subexpressions evaluated unconditionally by every user may be eliminated
+    # from their guarded occurrences, too
+    knl = lp.make_kernel(
+        "{[i]: 0<=i<n}",
+        """
+        out1[i] = a[i]*b[i] + if(b[i] > 1, a[i]*b[i], 0) {id=out1}
+        out2[i] = 2*(a[i]*b[i]) {id=out2}
+        """,
+        [lp.GlobalArg("a, b, out1, out2", np.int32, shape="n"), ...],
+        target=lp.ExecutableCTarget())
+
+    from pymbolic import parse
+
+    cse_knl = lp.eliminate_common_subexpressions(knl)
+    kernel = cse_knl.default_entrypoint
+    cse_insn, = [insn for insn in kernel.instructions
+                 if insn.id not in ["out1", "out2"]]
+    assert cse_insn.expression == parse("a[i]*b[i]")
+
+    _evt, (out1, out2) = cse_knl(a=a, b=b)
+    assert (out1 == a*b + np.where(b > 1, a*b, 0)).all()
+    assert (out2 == 2*a*b).all()
+
+
+def test_auto_tile(ctx_factory: cl.CtxFactory):
+    ctx = ctx_factory()
+
+    knl = lp.make_kernel(
+        "{[i, j]: 1<=i, j<n-1}",
+        """
+        out[i, j] = u[i-1, j] + u[i+1, j] + u[i, j-1] + u[i, j+1] - 4*u[i, j]
+        """,
+        [lp.GlobalArg("u, out", np.float64, shape=("n", "n")), ...])
+
+    # two tiles of 32x32 entries of u and out plus the halo take 17440 bytes
+    tiled_knl = lp.auto_tile(knl, [32*1024, 1024*1024],
+                             parameters={"n": 4096})
+
+    kernel = tiled_knl.default_entrypoint
+    assert kernel.loop_priority == frozenset({(
+        "i_outer", "j_outer", "i_inner_outer", "j_inner_outer",
+        "i_inner_inner", "j_inner_inner")})
+    assert kernel.get_constant_iname_length("i_inner_inner") == 32
+    assert kernel.get_constant_iname_length("j_inner_inner") == 32
+
+    lp.auto_test_vs_ref(knl, ctx, tiled_knl, parameters={"n": 300})
+
+    with pytest.raises(lp.LoopyError):
+        lp.auto_tile(knl, [32*1024])
+
+    matmul = lp.make_kernel(
+        "{[i, j, k]: 0<=i, j, k<n}",
+        """
+        c[i, j] = 0 {id=init}
+        c[i, j] = c[i, j] + a[i, k]*b[k, j] {dep=init}
+        """,
+        [lp.GlobalArg("a, b, c", np.float64, shape=("n", "n")), ...])
+
+    with pytest.raises(lp.LoopyError):
+        lp.auto_tile(matmul, [32*1024], inames="i, j, k",
+                     parameters={"n": 1024})
+
+    # with all of k inside a tile, even 4x4 tiles of c do not fit
+    assert lp.auto_tile(matmul, [32*1024], parameters={"n": 1024}) == matmul
+
+
+def test_auto_tile_non_affine():
+    knl = lp.make_kernel(
+        "{[i, j]: 0<=i, j<n}",
+        "out[i*j] = 1",
+        [lp.GlobalArg("out", np.float64, shape=("n*n",)), ...])
+
+    # the footprint of out cannot be determined
+    with pytest.warns(lp.LoopyWarning, match="auto_tile_no_fit"):
+        assert lp.auto_tile(knl, [1024], parameters={"n": 256}) == knl
+
+    # ... and is ignored in favor of the others
+    knl = lp.make_kernel(
+        "{[i, j]: 0<=i, j<n}",
+        "out[i*j] = a[i, j]",
+        [lp.GlobalArg("out", np.float64, shape=("n*n",)),
+         lp.GlobalArg("a", np.float64, shape=("n", "n")), ...])
+
+    # a tile of a fills the cache
+    tiled_knl = lp.auto_tile(knl, [1024], parameters={"n": 256})
+    kernel = tiled_knl.default_entrypoint
+    assert (kernel.get_constant_iname_length("i_inner")
+            * kernel.get_constant_iname_length("j_inner")) == 1024 // 8
+
+
+def test_add_padding_to_avoid_cache_conflicts(ctx_factory: cl.CtxFactory):
+    ctx = ctx_factory()
+
+    knl = lp.make_kernel(
+        "{[i, j]: 0<=i, j<1024}",
+        """
+        <> tmp[i, j] = 2*a[i, j]
+        b[j] = sum(i, tmp[i, j])
+        """,
+        [lp.GlobalArg("a", np.float64, shape=(1024, 1024)), ...])
+    knl = lp.prioritize_loops(knl, "j, i")
+
+    l1 = lp.CacheGeometry(32*1024, 8)
+
+    # rows of 8192 bytes map all accesses along i to a single set of L1
+    conflicts = lp.find_cache_conflicts(knl, [l1])
+    assert {(c.variable, c.iname, c.stride, c.nsets_touched)
+            for c in conflicts} == {("a", "i", 8192, 1), ("tmp", "i", 8192, 1)}
+
+    with pytest.warns(lp.diagnostic.LoopyAdvisory, match="'a'"):
+        padded_knl = lp.add_padding_to_avoid_cache_conflicts(knl, [l1])
+
+    tmp = padded_knl.default_entrypoint.temporary_variables["tmp"]
+    assert tmp.storage_shape == (1024, 1032)
+    assert [dim_tag.stride for dim_tag in tmp.dim_tags] == [1032, 1]
+    assert {c.variable for c in lp.find_cache_conflicts(padded_knl, [l1])} == {"a"}
+
+    lp.auto_test_vs_ref(knl, ctx, padded_knl)
+
+
+def test_choose_array_layouts(ctx_factory: cl.CtxFactory):
+    ctx = ctx_factory()
+
+    knl = lp.make_kernel(
+        "{[e, f]: 0<=e<64 and 0<=f<3}",
+        """
+        <> tmp[e, f] = 2*x[e, f]
+        out[f, e] = tmp[e, f] + 1
+        """,
+        [lp.GlobalArg("x", np.float64, shape=(64, 3)),
+         lp.GlobalArg("out", np.float64, shape=(3, 64))])
+    knl = lp.prioritize_loops(knl, "f,e")
+
+    # along e, only the structure-of-arrays layout is contiguous
+    (score, layout), *others = lp.rank_array_layouts(knl, "x")
+    assert (score, layout) == (1, lp.ArrayLayout("N0,N1"))
+    assert all(other_score == 0 for other_score, _ in others)
+    assert lp.ArrayLayout("N1,N0") in [other for _, other in others]
+
+    with pytest.warns(lp.diagnostic.LoopyAdvisory, match="strides \\(1, 64\\)"):
+        new_knl = lp.choose_array_layouts(knl, "x, tmp")
+
+    kernel = new_knl.default_entrypoint
+    for name in ["x", "tmp"]:
+        ary = kernel.get_var_descriptor(name)
+        assert [dim_tag.stride for dim_tag in ary.dim_tags] == [1, 64]
+
+    # temporaries only by default, and the current layout is kept on ties
+    assert (lp.choose_array_layouts(knl).default_entrypoint.arg_dict["x"]
+            == knl.default_entrypoint.arg_dict["x"])
+    assert lp.choose_array_layouts(new_knl) == new_knl
+
+    lp.auto_test_vs_ref(knl, ctx, new_knl)
+
+    with pytest.raises(lp.LoopyError):
+        lp.rank_array_layouts(knl.default_entrypoint, "x")
+
+
 if __name__ == "__main__":
     import sys
     if len(sys.argv) > 1: